@@ -0,0 +1,55 @@
+""" Benchmark: parallel_bfs() throughput as the number of worker processes grows.
+
+Sweeps workers from 1 to os.cpu_count() (or --max-workers) on a random directed graph and
+reports the time for all searches and the speedup over 1 worker.
+
+Usage:
+    PYTHONPATH=src python benchmarks/parallel_bfs.py [--vertices N] [--edges M] [--sources S] [--repeat R]
+                                                     [--max-workers W]
+"""
+import argparse
+import os
+import random
+import time
+
+from dsa.graph import Graph
+from dsa.parallel import parallel_bfs
+
+
+def random_graph(vertices: int, edges: int, seed: int=0):
+    """ Build a random directed CSR graph with integer labels. """
+    rng = random.Random(seed)
+    pairs = [(rng.randrange(vertices), rng.randrange(vertices)) for _ in range(edges)]
+    return Graph.from_edges(pairs, graph_type='csr', directed=True)
+
+def run(graph, sources: list, workers: int) -> float:
+    """ Time one parallel_bfs() call, consuming every result. """
+    begin = time.perf_counter()
+    for _ in parallel_bfs(graph, sources, workers=workers):
+        pass
+    return time.perf_counter() - begin
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--vertices', type=int, default=20000)
+    parser.add_argument('--edges', type=int, default=100000)
+    parser.add_argument('--sources', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    graph = random_graph(args.vertices, args.edges)
+    sources = random.Random(1).sample(graph.vertices(), min(args.sources, graph.order()))
+
+    print(f"{len(sources)} searches over {graph.order()} vertices and {graph.size()} edges, "
+          f"{os.cpu_count()} CPUs (best of {args.repeat}, seconds)")
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        best = min(run(graph, sources, workers) for _ in range(args.repeat))
+        if baseline is None:
+            baseline = best
+        print(f"  workers={workers:<3} {best:.3f}  speedup {baseline / best:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+""" Benchmark: clustered and random inserts into DynamicArray, GapBuffer and Rope.
+
+Usage:
+    PYTHONPATH=src python benchmarks/sequence_inserts.py [--size N] [--inserts K] [--repeat R]
+"""
+import argparse
+import random
+import time
+
+from dsa.array import DynamicArray
+from dsa.sequence import GapBuffer, Rope
+
+
+def clustered_positions(size: int, inserts: int, rng: random.Random) -> list:
+    """ Insert positions that stay next to a single cursor, like typing into a text buffer. """
+    start = rng.randrange(size)
+    return [start + i for i in range(inserts)]
+
+def random_positions(size: int, inserts: int, rng: random.Random) -> list:
+    """ Insert positions spread uniformly over the sequence. """
+    return [rng.randrange(size + i + 1) for i in range(inserts)]
+
+def run(cls, size: int, positions: list) -> float:
+    """ Time inserting at each position into a fresh sequence of the given size. """
+    if cls is DynamicArray:
+        sequence = cls(range(size), capacity=size)
+    else:
+        sequence = cls(range(size))
+    begin = time.perf_counter()
+    for index in positions:
+        sequence.insert(index, -1)
+    return time.perf_counter() - begin
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=20000)
+    parser.add_argument('--inserts', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.inserts} inserts into {args.size} elements (best of {args.repeat}, seconds)")
+    for name, pattern in (('clustered', clustered_positions), ('random', random_positions)):
+        positions = pattern(args.size, args.inserts, random.Random(0))
+        timings = []
+        for cls in (DynamicArray, GapBuffer, Rope):
+            best = min(run(cls, args.size, positions) for _ in range(args.repeat))
+            timings.append(f"{cls.__name__} {best:.3f}")
+        print(f"  {name + ':':<10} " + ", ".join(timings))
+
+
+if __name__ == '__main__':
+    main()
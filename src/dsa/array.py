@@ -1,4 +1,19 @@
 """ Module containing array classes. """
+import bisect
+import functools
+from collections import deque
+import mmap
+import os
+import struct
+
+try:
+    import numpy as np
+except ImportError:
+    # NumPy is optional: batch operations fall back to pure Python
+    np = None
+
+#: default for optional arguments where None is a valid value
+_MISSING = object()
 
 class Array:
     """
@@ -217,6 +232,143 @@ class Array:
         """
         return f'{self.to_list()} Count: {self.count} Capacity: {self.capacity()}'
 
+    def _elements(self):
+        """
+        Helper method to return the elements of the array in order, read directly from the backing storage.
+        """
+        return self._array[:self.count]
+
+    def _numpy_view(self):
+        """
+        Helper method to return a NumPy view of the elements, or None if the array is not typed or NumPy is unavailable.
+        """
+        return None
+
+    def map(self, fn):
+        """
+        Apply a function to every element.
+
+        Args:
+            fn: A function of one argument.
+
+        Returns:
+            A DynamicArray with the results in order.
+        """
+        return DynamicArray.from_list([fn(e) for e in self._elements()])
+
+    def filter(self, pred):
+        """
+        Select the elements for which a predicate is true.
+
+        Args:
+            pred: A function of one argument returning a boolean.
+
+        Returns:
+            A DynamicArray with the matching elements in order.
+        """
+        return DynamicArray.from_list([e for e in self._elements() if pred(e)])
+
+    def reduce(self, fn, initial=_MISSING):
+        """
+        Combine the elements from left to right using a function of two arguments.
+
+        Args:
+            fn: A function of two arguments (accumulated value, element).
+            initial: An optional starting value.
+
+        Returns:
+            The accumulated value.
+
+        Raises:
+            TypeError: If the array is empty and no initial value is given.
+        """
+        if initial is _MISSING:
+            return functools.reduce(fn, self._elements())
+        return functools.reduce(fn, self._elements(), initial)
+
+    def sum(self):
+        """
+        Return the sum of the elements (0 if the array is empty).
+
+        Returns:
+            The sum of the elements.
+        """
+        view = self._numpy_view()
+        if view is not None:
+            return view.sum().item()
+        return sum(self._elements())
+
+    def min(self):
+        """
+        Return the smallest element.
+
+        Returns:
+            The smallest element.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        if self.count == 0:
+            raise ValueError("min() of an empty array")
+        view = self._numpy_view()
+        if view is not None:
+            return view.min().item()
+        return min(self._elements())
+
+    def max(self):
+        """
+        Return the largest element.
+
+        Returns:
+            The largest element.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        if self.count == 0:
+            raise ValueError("max() of an empty array")
+        view = self._numpy_view()
+        if view is not None:
+            return view.max().item()
+        return max(self._elements())
+
+    def argsort(self) -> list:
+        """
+        Return the indices that would sort the array. The sort is stable.
+
+        Returns:
+            A list of indices in sorted element order.
+        """
+        view = self._numpy_view()
+        if view is not None:
+            return view.argsort(kind='stable').tolist()
+        elements = self._elements()
+        return sorted(range(len(elements)), key=elements.__getitem__)
+
+    def searchsorted(self, value, side: str='left') -> int:
+        """
+        Find the index where a value would be inserted to keep a sorted array in order.
+        The array must already be sorted in ascending order.
+
+        Args:
+            value: The value to locate.
+            side (str): 'left' for the first suitable index, 'right' for the last.
+
+        Returns:
+            The insertion index.
+
+        Raises:
+            ValueError: If side is not 'left' or 'right'.
+        """
+        if side not in ('left', 'right'):
+            raise ValueError("side must be 'left' or 'right'")
+        view = self._numpy_view()
+        if view is not None:
+            return int(np.searchsorted(view, value, side=side))
+        if side == 'left':
+            return bisect.bisect_left(self._array, value, 0, self.count)
+        return bisect.bisect_right(self._array, value, 0, self.count)
+
     def __eq__(self, other):
         """
         Compare this array to another for equality.
@@ -341,6 +493,10 @@ class CircularArray(Array):
     """ 
     A circular array implementation.
 
+    By default, appending to a full circular array overwrites the oldest element in O(1), so it can be
+    used as a fixed-size ring buffer (e.g. the last N samples of a metric). With aggregates enabled,
+    the sum, mean, min and max of the elements are updated incrementally on each append.
+
     Special Methods:
 
         Index Operator: 
@@ -349,13 +505,15 @@ class CircularArray(Array):
         Assignment: 
             array[index] = value
     """
-    def __init__(self, contents=None, capacity: int=10):
+    def __init__(self, contents=None, capacity: int=10, overwrite: bool=True, aggregates: bool=False):
         """ 
         Initialize the circular array with optional contents and a fixed capacity.
 
         Args:
             contents: An optional iterable to fill array with default values.
             capacity (int): The initial size of the array (default is 10)
+            overwrite (bool): If True, appending to a full array overwrites the oldest element. If False, it raises an exception.
+            aggregates (bool): If True, maintain sum, mean, min and max incrementally (elements must be numbers).
         """
         if contents and len(contents) > capacity:
             capacity = len(contents)
@@ -364,6 +522,11 @@ class CircularArray(Array):
         
         #: index of the first element in the circular array
         self._start = 0
+
+        self.overwrite = overwrite
+        self._aggregates = aggregates
+        if aggregates:
+            self._rebuild_aggregates()
         
         # need to call circular array's extend to handle wrap-around
         if contents:
@@ -400,6 +563,8 @@ class CircularArray(Array):
         if index < 0 or index >= self.count: 
             raise IndexError
         self._array[(self._start + index) % len(self._array)] = value
+        if self._aggregates:
+            self._rebuild_aggregates()
 
     def append(self, element):
         """
@@ -407,20 +572,207 @@ class CircularArray(Array):
 
         Args:
             element: The element to append.
+
+        Raises:
+            Exception: If the array is full and overwrite is disabled.
         """
-        # self._array[(self._start + self.count) % len(self._array)] = element
-        # if self.count < self.capacity():
-        #     self.count += 1
-        # else:
-        #     self._start = (self._start + 1) % len(self._array)
+        if self.count >= self.capacity() and not self.overwrite:
+            raise Exception(f"Capacity Error: Maximum capacity {self.capacity()} reached.")
+
         index = (self._start + self.count) % len(self._array)
+        evicted = self._array[index]
         self._array[index] = element
 
         if self.count < self.capacity():
             self.count += 1
+            evicted = None
         else:
             self._start = (self._start + 1) % len(self._array)  # Overwrite oldest element
 
+        if self._aggregates:
+            self._add_aggregate(element, evicted)
+
+    def append_many(self, elements):
+        """
+        Append multiple elements. With overwrite enabled, only the newest capacity elements are kept,
+        and elements are copied in at most two bulk slice assignments.
+
+        Args:
+            elements: An iterable containing elements to append.
+
+        Raises:
+            Exception: If the array runs out of space and overwrite is disabled.
+        """
+        elements = list(elements)
+        capacity = self.capacity()
+
+        if self._aggregates or not self.overwrite:
+            for e in elements:
+                self.append(e)
+            return
+
+        if len(elements) >= capacity:
+            self._array[:] = elements[-capacity:]
+            self._start = 0
+            self.count = capacity
+            return
+
+        end = (self._start + self.count) % capacity
+        first = min(len(elements), capacity - end)
+        self._array[end:end + first] = elements[:first]
+        self._array[:len(elements) - first] = elements[first:]
+
+        overflow = self.count + len(elements) - capacity
+        if overflow > 0:
+            self._start = (self._start + overflow) % capacity
+            self.count = capacity
+        else:
+            self.count += len(elements)
+
+    def latest(self, k: int) -> list:
+        """ 
+        Return the newest k elements (oldest first) without copying the rest of the ring.
+
+        Args:
+            k (int): The number of elements to return. If k exceeds the count, all elements are returned.
+
+        Returns:
+            A list of the newest k elements, in the order they were appended.
+
+        Raises:
+            ValueError: If k is negative.
+        """
+        if k < 0:
+            raise ValueError("k must be non-negative")
+        k = min(k, self.count)
+        capacity = self.capacity()
+        first = (self._start + self.count - k) % capacity
+        if first + k <= capacity:
+            return self._array[first:first + k]
+        return self._array[first:] + self._array[:first + k - capacity]
+
+    def _rebuild_aggregates(self):
+        """
+        Helper method to recompute the aggregates from the current contents.
+        Elements are numbered by append sequence; the monotonic deques hold (sequence, value) pairs.
+        """
+        self._sequence = 0
+        self._sum = 0
+        self._min_window = deque()
+        self._max_window = deque()
+        for e in self.to_list():
+            self._add_aggregate(e, None)
+
+    def _add_aggregate(self, element, evicted):
+        """
+        Helper method to update the aggregates after an append in O(1) amortized time.
+        """
+        if evicted is not None:
+            self._sum -= evicted
+        self._sum += element
+
+        while self._min_window and self._min_window[-1][1] >= element:
+            self._min_window.pop()
+        self._min_window.append((self._sequence, element))
+        while self._max_window and self._max_window[-1][1] <= element:
+            self._max_window.pop()
+        self._max_window.append((self._sequence, element))
+        self._sequence += 1
+
+        self._trim_aggregates()
+
+    def _trim_aggregates(self):
+        """
+        Helper method to drop deque entries that are no longer in the window.
+        """
+        oldest = self._sequence - self.count
+        while self._min_window and self._min_window[0][0] < oldest:
+            self._min_window.popleft()
+        while self._max_window and self._max_window[0][0] < oldest:
+            self._max_window.popleft()
+
+    def sum(self):
+        """
+        Return the sum of the elements (0 if the array is empty). O(1) when aggregates are enabled.
+
+        Returns:
+            The sum of the elements.
+        """
+        if self._aggregates:
+            return self._sum
+        return super().sum()
+
+    def mean(self):
+        """
+        Return the mean of the elements. O(1) when aggregates are enabled.
+
+        Returns:
+            The mean of the elements.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        if self.count == 0:
+            raise ValueError("mean() of an empty array")
+        return self.sum() / self.count
+
+    def min(self):
+        """
+        Return the smallest element. O(1) amortized when aggregates are enabled.
+
+        Returns:
+            The smallest element.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        if self._aggregates and self.count > 0:
+            self._trim_aggregates()
+            return self._min_window[0][1]
+        return super().min()
+
+    def max(self):
+        """
+        Return the largest element. O(1) amortized when aggregates are enabled.
+
+        Returns:
+            The largest element.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        if self._aggregates and self.count > 0:
+            self._trim_aggregates()
+            return self._max_window[0][1]
+        return super().max()
+
+    def _elements(self):
+        """
+        Helper method to return the elements of the array in order, starting from the oldest element.
+        """
+        return self.to_list()
+
+    def searchsorted(self, value, side: str='left') -> int:
+        """
+        Find the index where a value would be inserted to keep a sorted array in order.
+        The array must already be sorted in ascending order.
+
+        Args:
+            value: The value to locate.
+            side (str): 'left' for the first suitable index, 'right' for the last.
+
+        Returns:
+            The insertion index.
+
+        Raises:
+            ValueError: If side is not 'left' or 'right'.
+        """
+        if side not in ('left', 'right'):
+            raise ValueError("side must be 'left' or 'right'")
+        if side == 'left':
+            return bisect.bisect_left(self.to_list(), value)
+        return bisect.bisect_right(self.to_list(), value)
+
     def raw_view(self):
         """ 
         Return a raw view of the array.
@@ -437,14 +789,11 @@ class CircularArray(Array):
         Returns:
             A list containing the elements of the array.
         """
-        output_list = []
-        for i in range(self.count):
-            output_list.append(self._array[(self._start + i) % len(self._array)])
-        return output_list
+        return self.latest(self.count)
 
     def insert(self, index: int, element):
         """
-        Insert an element at a specified index, shifting existing elements to the right.
+        Insert an element at a specified index, shifting the elements on the shorter side of the index.
 
         Args:
             index (int): The index at which to insert the element.
@@ -458,16 +807,24 @@ class CircularArray(Array):
             raise IndexError
         if self.count >= self.capacity():
             raise Exception(f"Capacity Error: Maximum capacity {self.capacity()} reached.")
-        # Shift elements to the right
-        for i in range(self.count, index, -1):
-            self._array[(self._start + i) % self.capacity()] = self._array[(self._start + i - 1) % self.capacity()]
-        self._array[(self._start + index) % self.capacity()] = element
+        capacity = self.capacity()
+        if index < self.count - index:
+            # Shift elements before the index to the left
+            self._start = (self._start - 1) % capacity
+            for i in range(index):
+                self._array[(self._start + i) % capacity] = self._array[(self._start + i + 1) % capacity]
+        else:
+            # Shift elements to the right
+            for i in range(self.count, index, -1):
+                self._array[(self._start + i) % capacity] = self._array[(self._start + i - 1) % capacity]
+        self._array[(self._start + index) % capacity] = element
         self.count += 1
-
+        if self._aggregates:
+            self._rebuild_aggregates()
 
     def delete(self, index: int):
         """
-        Delete an element at a specified index, shifting subsequent elements to the left.
+        Delete an element at a specified index, shifting the elements on the shorter side of the index.
 
         Args:
             index (int): The index of the element to delete.
@@ -477,7 +834,525 @@ class CircularArray(Array):
         """
         if index < 0 or index >= self.count:
             raise IndexError
-        # Shift elements to the left
-        for i in range(index, self.count - 1):
-            self._array[(self._start + i) % self.capacity()] = self._array[(self._start + i + 1) % self.capacity()]
+        capacity = self.capacity()
+        if index < self.count - index - 1:
+            # Shift elements before the index to the right
+            for i in range(index, 0, -1):
+                self._array[(self._start + i) % capacity] = self._array[(self._start + i - 1) % capacity]
+            self._start = (self._start + 1) % capacity
+        else:
+            # Shift elements to the left
+            for i in range(index, self.count - 1):
+                self._array[(self._start + i) % capacity] = self._array[(self._start + i + 1) % capacity]
         self.count -= 1
+        if self._aggregates:
+            self._rebuild_aggregates()
+
+
+class ArrayView:
+    """
+    A read-only view of a contiguous range of an array's elements. Elements are not copied.
+    The view reads the array's storage directly, so it should not be used after the array is modified.
+
+    Special Methods:
+        Index Operator: view[index]
+    """
+    def __init__(self, array: Array, start: int, end: int):
+        """
+        Initialize a view of the elements at indices start (inclusive) to end (exclusive).
+
+        Args:
+            array (Array): The array to view.
+            start (int): The index of the first element in the view.
+            end (int): The index after the last element in the view.
+        """
+        self._source = array
+        self.start = start
+        self.end = end
+
+    def __getitem__(self, index: int):
+        """
+        Retrieve the element at the specified index of the view.
+
+        Args:
+            index (int): The index of the element (relative to the start of the view).
+
+        Returns:
+            The element at the specified index.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        if index < 0 or index >= self.end - self.start:
+            raise IndexError
+        return self._source._array[self.start + index]
+
+    def __len__(self) -> int:
+        """
+        Return the number of elements in the view.
+        """
+        return self.end - self.start
+
+    def __iter__(self):
+        """
+        Iterate over the elements of the view.
+        """
+        for i in range(self.start, self.end):
+            yield self._source._array[i]
+
+    def to_list(self) -> list:
+        """
+        Copy the elements of the view to a standard Python list.
+
+        Returns:
+            A list containing the elements of the view.
+        """
+        return self._source._array[self.start:self.end]
+
+    def __repr__(self):
+        """
+        Return a string representation of the view.
+
+        Returns:
+            A string representation of the view.
+        """
+        return f'{self.to_list()} Start: {self.start} End: {self.end}'
+
+    def __eq__(self, other):
+        """
+        Compare the view to another view or array based on their contents.
+
+        Args:
+            other: The object to compare with.
+
+        Returns:
+            True if the elements are equal, False otherwise.
+        """
+        if isinstance(other, (ArrayView, Array)):
+            return self.to_list() == other.to_list()
+        return NotImplemented
+
+
+class SortedArray(DynamicArray):
+    """
+    A dynamic array that keeps its elements in ascending order.
+
+    Lookups use binary search (O(log n)); add() uses binary search followed by a bulk shift.
+
+    Special Methods:
+        Index Operator: array[index]
+        Assignment: array[index] = value (only if the order is preserved)
+        in operator: element in array
+
+    Equality:
+        SortedArray instances can be compared for equality with other array instances, based on their contents.
+    """
+    def __init__(self, contents=None, capacity: int=10):
+        """
+        Initialize the sorted array with optional contents.
+
+        Args:
+            contents: An optional iterable of elements (in any order).
+            capacity (int): The initial size of the array (default is 10)
+        """
+        super().__init__(None, capacity)
+
+        if contents:
+            self.extend(contents)
+
+    def add(self, element) -> int:
+        """
+        Insert an element in sorted position. Equal elements are inserted after existing ones.
+
+        Args:
+            element: The element to insert.
+
+        Returns:
+            The index at which the element was inserted.
+        """
+        index = bisect.bisect_right(self._array, element, 0, self.count)
+
+        if self.count >= len(self._array):
+            self.grow()
+
+        self._array[index + 1:self.count + 1] = self._array[index:self.count]
+        self._array[index] = element
+        self.count += 1
+        return index
+
+    def insert(self, index: int, element):
+        """
+        Insert an element at a specified index with a bulk shift, only if the order is preserved
+        (self[index - 1] <= element <= self[index]). Use add() to insert in sorted position.
+
+        Args:
+            index (int): The index at which to insert the element.
+            element: The element to insert.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+            ValueError: If the element would break the sorted order.
+        """
+        if index < 0 or index > self.count:
+            raise IndexError
+        if (index > 0 and element < self._array[index - 1]) or (index < self.count and self._array[index] < element):
+            raise ValueError(f"Inserting {element} at index {index} would break the sorted order")
+
+        if self.count >= len(self._array):
+            self.grow()
+
+        self._array[index + 1:self.count + 1] = self._array[index:self.count]
+        self._array[index] = element
+        self.count += 1
+
+    def append(self, element):
+        """
+        Insert an element in sorted position (same as add()).
+
+        Args:
+            element: The element to insert.
+        """
+        self.add(element)
+
+    def extend(self, array):
+        """
+        Insert multiple elements from a given iterable (in any order).
+
+        Args:
+            array: An iterable containing elements to insert.
+        """
+        self.merge(sorted(array))
+
+    def merge(self, sorted_iterable):
+        """
+        Merge an iterable of elements already in ascending order in O(n + m) time.
+
+        Args:
+            sorted_iterable: An iterable of elements in ascending order.
+
+        Raises:
+            ValueError: If the iterable is not in ascending order.
+        """
+        merged = []
+        i = 0
+        previous = None
+        for k, element in enumerate(sorted_iterable):
+            if k > 0 and element < previous:
+                raise ValueError("merge() requires elements in ascending order")
+            previous = element
+            while i < self.count and not element < self._array[i]:
+                merged.append(self._array[i])
+                i += 1
+            merged.append(element)
+        merged.extend(self._array[i:self.count])
+
+        capacity = len(self._array)
+        while capacity < len(merged):
+            capacity *= 2
+        self._array = merged + [ None ] * (capacity - len(merged))
+        self.count = len(merged)
+
+    def index(self, element) -> int:
+        """
+        Find the index of the first occurrence of an element using binary search.
+
+        Args:
+            element: The element to find.
+
+        Returns:
+            The index of the element.
+
+        Raises:
+            ValueError: If the element is not in the array.
+        """
+        index = bisect.bisect_left(self._array, element, 0, self.count)
+        if index < self.count and self._array[index] == element:
+            return index
+        raise ValueError(f"{element} is not in array")
+
+    def __contains__(self, element) -> bool:
+        """
+        Args:
+            element: The element to find.
+        Returns:
+            A boolean indicating if the element is in the array.
+        """
+        index = bisect.bisect_left(self._array, element, 0, self.count)
+        return index < self.count and self._array[index] == element
+
+    def range(self, lo, hi) -> ArrayView:
+        """
+        Return a view of the elements x where lo <= x < hi.
+
+        Args:
+            lo: The lower bound (inclusive).
+            hi: The upper bound (exclusive).
+
+        Returns:
+            An ArrayView of the matching elements.
+        """
+        start = bisect.bisect_left(self._array, lo, 0, self.count)
+        end = bisect.bisect_left(self._array, hi, start, self.count)
+        return ArrayView(self, start, end)
+
+    def __setitem__(self, index: int, value):
+        """
+        Set a new value at the specified index.
+
+        Args:
+            index (int): The index at which to set the value.
+            value: The new value to assign.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+            ValueError: If the new value would break the sorted order.
+        """
+        if index < 0 or index >= self.count:
+            raise IndexError
+        if (index > 0 and value < self._array[index - 1]) or (index < self.count - 1 and self._array[index + 1] < value):
+            raise ValueError(f"Assigning {value} at index {index} would break the sorted order")
+        self._array[index] = value
+
+    def min(self):
+        """
+        Return the smallest element in O(1).
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        if self.count == 0:
+            raise ValueError("min() of an empty array")
+        return self._array[0]
+
+    def max(self):
+        """
+        Return the largest element in O(1).
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        if self.count == 0:
+            raise ValueError("max() of an empty array")
+        return self._array[self.count - 1]
+
+    @classmethod
+    def from_list(cls, mylist: list):
+        """
+        Create a sorted array from a standard Python list (in any order).
+
+        Args:
+            mylist: A Python list to initialize the array.
+
+        Returns:
+            An instance of the SortedArray class.
+        """
+        return cls(mylist, capacity=max(len(mylist), 10))
+
+
+class MmapArray(Array):
+    """
+    A memory-mapped array of fixed-width typed elements stored in a file.
+
+    Elements are read and written directly through an mmap of the file, so arrays larger than
+    available memory can be indexed without loading them. The file grows (doubling its capacity)
+    as elements are appended.
+
+    Typecodes are the same as the standard library array module (e.g. 'b', 'i', 'q', 'f', 'd').
+
+    Special Methods:
+        Index Operator: array[index]
+        Assignment: array[index] = value
+
+    Equality:
+        MmapArray instances can be compared for equality with other Array or DynamicArray instances, based on their contents.
+    """
+    _MAGIC = b'DSAA'
+    #: file header: magic, typecode, padding and element count
+    _HEADER = struct.Struct('<4sc3xQ')
+
+    def __init__(self, path: str, typecode: str=None, contents=None, capacity: int=10):
+        """
+        Open (or create) a memory-mapped array file.
+
+        Args:
+            path (str): The path of the backing file. An existing file is reopened with its contents.
+            typecode (str): The element typecode (default is 'd' for new files, or the typecode stored in an existing file).
+            contents: An optional iterable of elements to append.
+            capacity (int): The initial capacity of a new file (default is 10)
+
+        Raises:
+            ValueError: If the file is not an MmapArray file or the typecode does not match the file.
+        """
+        self.path = path
+
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            self._file = open(path, 'r+b')
+            magic, stored_typecode, count = self._HEADER.unpack(self._file.read(self._HEADER.size))
+            if magic != self._MAGIC:
+                self._file.close()
+                raise ValueError(f"{path} is not an MmapArray file")
+            stored_typecode = stored_typecode.decode()
+            if typecode is not None and typecode != stored_typecode:
+                self._file.close()
+                raise ValueError(f"Typecode mismatch: file uses '{stored_typecode}', not '{typecode}'")
+            self.typecode = stored_typecode
+        else:
+            if typecode is None:
+                typecode = 'd'
+            self.typecode = typecode
+            if contents and len(contents) > capacity:
+                capacity = len(contents)
+            count = 0
+            self._file = open(path, 'w+b')
+            self._file.truncate(self._HEADER.size + max(capacity, 1) * self.itemsize())
+
+        self._map()
+
+        #: number of elements currently in array
+        self.count = count
+
+        if contents:
+            self.extend(contents)
+
+    def itemsize(self) -> int:
+        """
+        Get the size of one element in bytes.
+
+        Returns:
+            The number of bytes used by each element.
+        """
+        return struct.calcsize(self.typecode)
+
+    def _map(self):
+        """
+        Helper method to memory-map the file and create a typed view over the elements.
+        """
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._view = memoryview(self._mmap)
+        self._array = self._view[self._HEADER.size:].cast(self.typecode)
+
+    def _unmap(self):
+        """
+        Helper method to release the typed view and close the memory map.
+        """
+        self._array.release()
+        self._view.release()
+        self._mmap.close()
+
+    def _numpy_view(self):
+        """
+        Helper method to return a NumPy view of the elements (no copy), or None if NumPy is unavailable.
+        """
+        if np is None:
+            return None
+        return np.frombuffer(self._array, dtype=np.dtype(self.typecode), count=self.count)
+
+    def _convert(self, element):
+        """
+        Helper method to convert an element to the Python type required by the typecode.
+        """
+        if self.typecode in 'fd':
+            return float(element)
+        return int(element)
+
+    def grow(self):
+        """
+        Helper method to double the capacity of the backing file.
+        """
+        new_size = self.capacity() * 2
+        self.flush()
+        self._unmap()
+        self._file.truncate(self._HEADER.size + new_size * self.itemsize())
+        self._map()
+
+    def append(self, element):
+        """
+        Append an element to the array. Grow the backing file as needed.
+
+        Args:
+            element: The element to append.
+        """
+        if self.count >= self.capacity():
+            self.grow()
+
+        self._array[self.count] = self._convert(element)
+        self.count += 1
+
+    def insert(self, index: int, element):
+        """
+        Insert an element at a specified index, shifting existing elements to the right. Grow the backing file as needed.
+
+        Args:
+            index (int): The index at which to insert the element.
+            element: The element to insert.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        if index < 0 or index > self.count:
+            raise IndexError
+
+        if self.count >= self.capacity():
+            self.grow()
+
+        super().insert(index, self._convert(element))
+
+    def __setitem__(self, index: int, value):
+        """
+        Set a new value at the specified index.
+
+        Args:
+            index (int): The index at which to set the value.
+            value: The new value to assign.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        super().__setitem__(index, self._convert(value))
+
+    def to_list(self) -> list:
+        """
+        Convert the array's elements to a standard Python list.
+
+        Returns:
+            A list containing the elements of the array.
+        """
+        return self._array[:self.count].tolist()
+
+    @classmethod
+    def from_list(cls, mylist: list, path: str, typecode: str='d'):
+        """
+        Create a memory-mapped array file from a standard Python list.
+
+        Args:
+            mylist: A Python list to initialize the array.
+            path (str): The path of the backing file.
+            typecode (str): The element typecode (default is 'd').
+
+        Returns:
+            An instance of the MmapArray class.
+        """
+        return cls(path, typecode, mylist, capacity=len(mylist))
+
+    def flush(self):
+        """
+        Write the element count to the file header and flush changes to disk.
+        """
+        self._mmap[:self._HEADER.size] = self._HEADER.pack(self._MAGIC, self.typecode.encode(), self.count)
+        self._mmap.flush()
+
+    def close(self):
+        """
+        Flush and close the backing file. The array cannot be used after it is closed.
+        """
+        if self._mmap.closed:
+            return
+        self.flush()
+        self._unmap()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,262 @@
+""" Module to access functions for connected components, strongly connected components and topological sorting. """
+from dsa.graph import _iter_adjacents
+from dsa.queue import DynamicQueue
+from dsa.unionfind import LabeledDisjointSet
+
+def _undirected_adjacents(graph) -> dict:
+    """
+    Helper function that returns a dictionary {vertex: list of vertices} with every edge in both directions.
+    Built in one pass over the adjacency lists, so directed graphs do not need a predecessors() call per vertex.
+    """
+    iter_adjacents = _iter_adjacents(graph)
+    adjacents = {vertex: [] for vertex in graph.vertices()}
+    for start in adjacents:
+        for end in iter_adjacents(start):
+            adjacents[start].append(end)
+            adjacents[end].append(start)
+    return adjacents
+
+def connected_components(graph) -> list:
+    """
+    Return the connected components of a graph with a breadth-first sweep in O(V + E).
+    The components of a directed graph are its weakly connected components (edge directions are ignored).
+
+    Args:
+        graph: The graph to search (any graph class).
+
+    Returns:
+        A list of components, each a list of vertices in BFS order. Components are ordered by their first vertex
+        in graph.vertices().
+    """
+    if graph.is_directed:
+        adjacents = _undirected_adjacents(graph).__getitem__
+    else:
+        adjacents = _iter_adjacents(graph)
+
+    visited = set()
+    components = []
+    for vertex in graph.vertices():
+        if vertex in visited:
+            continue
+        visited.add(vertex)
+        component = [vertex]
+        # appending while iterating visits each vertex once, in BFS order
+        for current in component:
+            for adjacent in adjacents(current):
+                if adjacent not in visited:
+                    visited.add(adjacent)
+                    component.append(adjacent)
+        components.append(component)
+    return components
+
+def strongly_connected_components(graph) -> list:
+    """
+    Return the strongly connected components of a graph using Tarjan's algorithm in O(V + E).
+
+    The depth-first search uses an explicit stack of adjacency iterators instead of recursion,
+    so graphs of any depth can be searched.
+
+    Args:
+        graph: The graph to search (any graph class).
+
+    Returns:
+        A list of components, each a list of vertices, in reverse topological order: no edge leads from a component
+        to a component listed after it.
+    """
+    iter_adjacents = _iter_adjacents(graph)
+    index = {}
+    low = {}
+    on_stack = set()
+    stack = []
+    components = []
+
+    for root in graph.vertices():
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter_adjacents(root))]
+
+        while work:
+            current, adjacents = work[-1]
+            for adjacent in adjacents:
+                if adjacent not in index:
+                    index[adjacent] = low[adjacent] = len(index)
+                    stack.append(adjacent)
+                    on_stack.add(adjacent)
+                    work.append((adjacent, iter_adjacents(adjacent)))
+                    break
+                if adjacent in on_stack and index[adjacent] < low[current]:
+                    low[current] = index[adjacent]
+            else:
+                # every adjacent explored: finish current
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[current] < low[parent]:
+                        low[parent] = low[current]
+                if low[current] == index[current]:
+                    component = []
+                    while True:
+                        vertex = stack.pop()
+                        on_stack.discard(vertex)
+                        component.append(vertex)
+                        if vertex == current:
+                            break
+                    components.append(component)
+    return components
+
+def topological_sort(graph) -> list:
+    """
+    Return the vertices of a directed acyclic graph so that every edge goes from an earlier to a later vertex,
+    using Kahn's algorithm in O(V + E).
+
+    Args:
+        graph: The directed graph to sort (any graph class).
+
+    Returns:
+        A list of vertices in topological order. Vertices with no ordering between them keep their graph.vertices() order
+        where possible.
+
+    Raises:
+        ValueError: If the graph is undirected or has a cycle.
+    """
+    if not graph.is_directed:
+        raise ValueError("topological_sort() requires a directed graph")
+
+    iter_adjacents = _iter_adjacents(graph)
+    if hasattr(graph, 'in_degree'):
+        in_degree = {vertex: graph.in_degree(vertex) for vertex in graph.vertices()}
+    else:
+        # views have no in_degree(): count it from the adjacency lists
+        in_degree = dict.fromkeys(graph.vertices(), 0)
+        for vertex in in_degree:
+            for adjacent in iter_adjacents(vertex):
+                in_degree[adjacent] += 1
+    queue = DynamicQueue()
+    for vertex, degree in in_degree.items():
+        if degree == 0:
+            queue.enqueue(vertex)
+
+    order = []
+    while not queue.is_empty():
+        current = queue.dequeue()
+        order.append(current)
+        for adjacent in iter_adjacents(current):
+            in_degree[adjacent] -= 1
+            if in_degree[adjacent] == 0:
+                queue.enqueue(adjacent)
+
+    if len(order) < len(in_degree):
+        raise ValueError("Graph has a cycle")
+    return order
+
+class IncrementalComponents:
+    """
+    Connected components of a graph that only grows, updated in near-constant time per added edge.
+
+    Edges are treated as undirected. Components are tracked with a LabeledDisjointSet, so each add_edge()
+    and find() costs O(α(V)) amortized instead of a new BFS sweep.
+    """
+    def __init__(self, vertices=None, edges=None):
+        """
+        Args:
+            vertices: An iterable of initial vertices.
+            edges: An iterable of initial edges (tuples whose first two items are the vertices).
+        """
+        self._sets = LabeledDisjointSet(vertices)
+        if edges is not None:
+            for edge in edges:
+                self.add_edge(edge[0], edge[1])
+
+    @classmethod
+    def from_graph(cls, graph) -> 'IncrementalComponents':
+        """
+        Create a component tracker from the vertices and edges of a graph.
+
+        Args:
+            graph: The graph to start from (any graph class).
+        """
+        return cls(graph.vertices(), graph.iter_edges())
+
+    def add_vertex(self, vertex):
+        """
+        Add a vertex as its own component. Adding an existing vertex does nothing.
+
+        Args:
+            vertex: The vertex to add.
+        """
+        self._sets.add(vertex)
+
+    def add_edge(self, start, end) -> bool:
+        """
+        Add an edge, adding its vertices if needed, and merge their components.
+
+        Args:
+            start: The starting vertex.
+            end: The ending vertex.
+
+        Returns:
+            True if the edge joined two different components.
+        """
+        self._sets.add(start)
+        self._sets.add(end)
+        return self._sets.union(start, end)
+
+    def _check(self, vertex):
+        """
+        Helper function that raises KeyError if a vertex has not been added.
+        """
+        if vertex not in self._sets:
+            raise KeyError(f"Vertex {vertex} does not exist")
+
+    def find(self, vertex):
+        """
+        Return the representative vertex of the component containing a vertex.
+
+        Args:
+            vertex: The vertex to look up.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        self._check(vertex)
+        return self._sets.find(vertex)
+
+    def connected(self, start, end) -> bool:
+        """
+        Return True if two vertices are in the same component.
+
+        Raises:
+            KeyError: If either vertex does not exist.
+        """
+        return self.find(start) == self.find(end)
+
+    def component_size(self, vertex) -> int:
+        """
+        Return the number of vertices in the component containing a vertex.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        self._check(vertex)
+        return self._sets.set_size(vertex)
+
+    def components(self) -> list:
+        """
+        Return the components as lists of vertices, ordered by the first vertex added to each.
+        """
+        return self._sets.groups()
+
+    def __len__(self) -> int:
+        """
+        Return the number of components.
+        """
+        return self._sets.count()
+
+    def __contains__(self, vertex) -> bool:
+        """
+        Return True if the vertex has been added.
+        """
+        return vertex in self._sets
@@ -1,8 +1,10 @@
 """ Module to access functions for Dijkstra's Algorithm. """
+from contextlib import nullcontext
 from dsa.heap import MinHeap
-from dsa.graph import Graph
+from dsa.graph import Graph, _iter_adjacent_items
+from dsa.visitor import Visitor
 
-def shortest_path(graph: Graph, start: str, end: str, debug: bool=False) -> tuple:
+def shortest_path(graph: Graph, start: str, end: str, debug: bool=False, visitor: Visitor=None) -> tuple:
     """ 
     Helper function that returns a weight table and a predecessor table using Dijkstra's Algorithm.
 
@@ -11,6 +13,7 @@ def shortest_path(graph: Graph, start: str, end: str, debug: bool=False) -> tupl
         start (str): The starting vertex label.
         end (str): The ending vertex label.
         debug (bool): If True, display weight table as it is being built.
+        visitor (Visitor): Visitor whose hooks are called during the 'search' phase.
     
     Raises:
         KeyError: If start or end vertex is not in the graph.
@@ -27,33 +30,47 @@ def shortest_path(graph: Graph, start: str, end: str, debug: bool=False) -> tupl
     predecessor = {start: start}
     visited = set()
     pq = MinHeap()
+    adjacent_items = _iter_adjacent_items(graph)
 
     # insert starting vertex with weight 0
     pq.insert((0, start))
-    
-    while not pq.is_empty():
-        current_weight, current_vertex = pq.pop()
-        if current_vertex in visited:
-            continue
-        visited.add(current_vertex)
-
-        if current_vertex == end:
-            break
-
-        for adjacent, weight in graph.adjacent_items(current_vertex):
-            new_dist = current_weight + weight
-            if debug:
-                print("current_vertex ", current_vertex, " adjacent ", adjacent, " weight ", weight, " new_dist ", new_dist, " predecessor ", predecessor)
-            if new_dist < weight_table.get(adjacent, float('inf')):
-                weight_table[adjacent] = new_dist
-                predecessor[adjacent] = current_vertex
-                pq.insert((new_dist, adjacent))
+
+    if visitor is None:
+        visitor = Visitor()
+
+    with visitor.phase('search'):
+        visitor.on_discover(start)
+        visitor.on_push(start, 0)
+        while not pq.is_empty():
+            current_weight, current_vertex = pq.pop()
+            visitor.on_pop(current_vertex, current_weight)
+            if current_vertex in visited:
+                continue
+            visited.add(current_vertex)
+            visitor.on_finish(current_vertex)
+
+            if current_vertex == end:
+                break
+
+            for adjacent, weight in adjacent_items(current_vertex):
+                visitor.on_examine_edge(current_vertex, adjacent)
+                new_dist = current_weight + weight
                 if debug:
-                    print(weight_table)
+                    print("current_vertex ", current_vertex, " adjacent ", adjacent, " weight ", weight, " new_dist ", new_dist, " predecessor ", predecessor)
+                if new_dist < weight_table.get(adjacent, float('inf')):
+                    if adjacent not in weight_table:
+                        visitor.on_discover(adjacent)
+                    weight_table[adjacent] = new_dist
+                    predecessor[adjacent] = current_vertex
+                    visitor.on_relax(current_vertex, adjacent, new_dist)
+                    pq.insert((new_dist, adjacent))
+                    if debug:
+                        print(weight_table)
+                    visitor.on_push(adjacent, new_dist)
     
     return weight_table, predecessor
 
-def find_path(graph: Graph, start: str, end: str, debug: bool=False) -> list:
+def find_path(graph: Graph, start: str, end: str, debug: bool=False, visitor: Visitor=None) -> list:
     """ 
     Return the shortest path of two vertices using Dijkstra's Algorithm.
 
@@ -62,6 +79,8 @@ def find_path(graph: Graph, start: str, end: str, debug: bool=False) -> list:
         start (str): The starting vertex label.
         end (str): The ending vertex label.
         debug (bool): If True, display the weight table.
+        visitor (Visitor): Visitor whose hooks are called during the 'search' phase; path reconstruction
+            runs in the 'path' phase.
     
     Raises:
         KeyError: If start or end vertex is not in the graph, or if there is no path from start to end.
@@ -69,21 +88,22 @@ def find_path(graph: Graph, start: str, end: str, debug: bool=False) -> list:
     Returns:
         A list of vertices that form a shortest path.
     """
-    weight_table, predecessor = shortest_path(graph, start, end, debug)
+    weight_table, predecessor = shortest_path(graph, start, end, debug, visitor)
 
     # No path or invalid start/end
     if end not in predecessor:
         raise KeyError(f"No path from {start} to {end}.")
 
-    path = []
-    current = end
-    path.append(current)
-
-    while current != start:
-        current = predecessor[current]
+    with visitor.phase('path') if visitor is not None else nullcontext():
+        path = []
+        current = end
         path.append(current)
 
-    path.reverse()
+        while current != start:
+            current = predecessor[current]
+            path.append(current)
+
+        path.reverse()
 
     if debug:
         print("predecessor table")
@@ -1,4 +1,120 @@
 """ Module containing graph classes. """
+from array import array
+import json
+import mmap
+import struct
+import sys
+
+#: label of a deleted vertex slot in stable_ids mode (a private object, so None stays a valid label)
+_DELETED = object()
+
+def _iter_adjacents(graph):
+    """
+    Helper function that returns graph.iter_adjacents, or graph.adjacents for graph-like objects without it.
+    """
+    return getattr(graph, 'iter_adjacents', None) or graph.adjacents
+
+def _iter_adjacent_items(graph):
+    """
+    Helper function that returns graph.iter_adjacent_items, or graph.adjacent_items for graph-like objects without it.
+    """
+    return getattr(graph, 'iter_adjacent_items', None) or graph.adjacent_items
+
+def _encode_label(label):
+    """
+    Helper function that turns a label into a JSON value that _decode_label() turns back into the same label.
+    Tuples and frozensets become {'tuple': [...]} and {'frozenset': [...]}; labels are hashable, so no label
+    is itself a dictionary.
+    """
+    if isinstance(label, tuple):
+        return {'tuple': [_encode_label(item) for item in label]}
+    if isinstance(label, frozenset):
+        return {'frozenset': [_encode_label(item) for item in label]}
+    return label
+
+def _decode_label(value: dict):
+    """
+    Helper function (a json.loads() object_hook) that rebuilds the tuples and frozensets of _encode_label().
+    """
+    if 'tuple' in value:
+        return tuple(value['tuple'])
+    return frozenset(value['frozenset'])
+
+def _intern_edges(edges, weighted: bool, directed: bool, labels: list, label_index: dict) -> tuple:
+    """
+    Helper function to intern the vertex labels of an edge iterable in a single pass.
+    New labels are appended to labels and label_index. Undirected edges are recorded in both directions.
+
+    Returns:
+        A tuple (starts, ends, weights): typed arrays of vertex ids and a list of weights (None if unweighted).
+    """
+    starts = array('i')
+    ends = array('i')
+    weights = [] if weighted else None
+    for edge in edges:
+        if weighted:
+            start, end, weight = edge
+        else:
+            start, end = edge
+
+        a = label_index.get(start)
+        if a is None:
+            a = label_index[start] = len(labels)
+            labels.append(start)
+        b = label_index.get(end)
+        if b is None:
+            b = label_index[end] = len(labels)
+            labels.append(end)
+
+        starts.append(a)
+        ends.append(b)
+        if weighted:
+            weights.append(weight)
+        if not directed:
+            starts.append(b)
+            ends.append(a)
+            if weighted:
+                weights.append(weight)
+    return starts, ends, weights
+
+def _parse_weight(text: str):
+    """
+    Helper function to parse an edge weight as an int if possible, otherwise a float.
+    """
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+class _GraphViews:
+    """
+    Mixin for the graph classes and views with the methods that create lazy views (see GraphView).
+    """
+    def subgraph(self, vertices) -> 'SubgraphView':
+        """ 
+        Return a read-only view of the subgraph induced by some vertices, without copying.
+
+        Args:
+            vertices: An iterable of vertex labels, or a predicate function called with each vertex label.
+
+        Returns:
+            A SubgraphView of this graph.
+        """
+        return SubgraphView(self, vertices)
+
+    def edge_filtered(self, predicate) -> 'EdgeFilteredView':
+        """ 
+        Return a read-only view of the graph with only the edges accepted by a predicate, without copying.
+
+        Args:
+            predicate: A function called as predicate(start, end), or predicate(start, end, weight)
+                for weighted graphs, returning True to keep the edge.
+
+        Returns:
+            An EdgeFilteredView of this graph.
+        """
+        return EdgeFilteredView(self, predicate)
 
 class Graph:
     """
@@ -6,25 +122,50 @@ class Graph:
     
     """
     @staticmethod
-    def create(graph_type: str, directed: bool=False, weighted: bool=False, vertices=None) -> object:
+    def create(graph_type: str, directed: bool=False, weighted: bool=False, vertices=None, edges=None) -> object:
         """ 
         Return a graph object based on the specified parameters.
 
         Args:
-            graph_type: The type of graph ('adjacency_matrix' or 'adjacency_list').
+            graph_type: The type of graph ('adjacency_matrix', 'bit_matrix', 'adjacency_list' or 'csr').
             directed (bool): Whether the graph is directed.
             weighted (bool): Whether the graph is weighted.
             labels (list[str], optional): List of vertex labels for adjacency matrix graphs. Defaults to [].
+            edges (list[tuple], optional): Edges (start, end) or (start, end, weight) of an immutable CSR graph.
         """
         if graph_type == 'adjacency_matrix':
             if vertices is None:
                 vertices = []
             return Graph.create_adjacency_matrix(directed=directed, weighted=weighted, vertices=vertices)
+        elif graph_type == 'bit_matrix':
+            return Graph.create_bit_matrix(directed=directed, weighted=weighted, vertices=vertices)
         elif graph_type == 'adjacency_list':
             return Graph.create_adjacency_list(directed=directed, weighted=weighted, vertices=vertices)
+        elif graph_type == 'csr':
+            return Graph.create_csr(directed=directed, weighted=weighted, vertices=vertices, edges=edges)
         else:
-            raise ValueError("Invalid graph type. Use 'adjacency_matrix' or 'adjacency_list'.")
+            raise ValueError("Invalid graph type. Use 'adjacency_matrix', 'bit_matrix', 'adjacency_list' or 'csr'.")
     
+    @staticmethod
+    def load(path: str, graph_type: str='csr', memory_map: bool=False) -> object:
+        """ 
+        Load a graph written by save().
+
+        Args:
+            path (str): The path of the graph file.
+            graph_type (str): The type of graph to return ('csr' returns the stored graph directly;
+                other types are rebuilt from it).
+            memory_map (bool): If True (csr only), the arrays are memory-mapped instead of read into memory.
+
+        Returns:
+            A graph object.
+        """
+        graph = CSRGraph.load(path, memory_map=memory_map)
+        if graph_type == 'csr':
+            return graph
+        with graph:
+            return Graph.from_dict(graph.to_dict(), graph_type, directed=graph.is_directed, weighted=graph.is_weighted)
+
     @staticmethod
     def create_adjacency_matrix(directed: bool=False, weighted: bool=False, vertices=None) -> object:
         """ 
@@ -42,6 +183,23 @@ class Graph:
         else:
             return AdjacencyMatrixGraph(directed=directed, vertices=vertices)
     
+    @staticmethod
+    def create_bit_matrix(directed: bool=False, weighted: bool=False, vertices=None) -> object:
+        """ 
+        Return a bit-packed adjacency matrix graph object (unweighted only).
+
+        Args:
+            directed (bool): Whether the graph is directed.
+            weighted (bool): Must be False.
+            vertices (list[str], optional): List of vertex labels.
+
+        Raises:
+            ValueError: If a weighted graph is requested.
+        """
+        if weighted:
+            raise ValueError("Bit matrix graphs are unweighted.")
+        return AdjacencyBitMatrixGraph(directed=directed, vertices=vertices)
+
     @staticmethod
     def create_adjacency_list(directed: bool=False, weighted: bool=False, vertices=None) -> object:
         """ 
@@ -57,6 +215,19 @@ class Graph:
         else:
             return AdjacencyListGraph(directed=directed, vertices=vertices)
 
+    @staticmethod
+    def create_csr(directed: bool=False, weighted: bool=False, vertices=None, edges=None) -> object:
+        """ 
+        Return an immutable compressed sparse row (CSR) graph object.
+
+        Args:
+            directed (bool): Whether the graph is directed.
+            weighted (bool): Whether the graph is weighted.
+            vertices (list[str], optional): List of vertex labels.
+            edges (list[tuple], optional): Edges (start, end) or (start, end, weight).
+        """
+        return CSRGraph(directed=directed, weighted=weighted, vertices=vertices, edges=edges)
+
     @staticmethod
     def from_dict(data: dict, graph_type: str, directed: bool = False, weighted: bool = False) -> object:
         """ 
@@ -64,7 +235,7 @@ class Graph:
         
         Args:
             data (dict): The dictionary representation of the graph.
-            graph_type (str): The type of graph ('adjacency_matrix' or 'adjacency_list').
+            graph_type (str): The type of graph ('adjacency_matrix', 'bit_matrix', 'adjacency_list' or 'csr').
             directed (bool): Whether the graph is directed.
             weighted (bool): Whether the graph is weighted.
             
@@ -76,28 +247,123 @@ class Graph:
                 return AdjacencyMatrixWeightedGraph.from_dict(data, directed=directed)
             else:
                 return AdjacencyMatrixGraph.from_dict(data, directed=directed)
+        elif graph_type == 'bit_matrix':
+            if weighted:
+                raise ValueError("Bit matrix graphs are unweighted.")
+            return AdjacencyBitMatrixGraph.from_dict(data, directed=directed)
         elif graph_type == 'adjacency_list':
             if weighted:
                 return AdjacencyListWeightedGraph.from_dict(data, directed=directed)
             else:
                 return AdjacencyListGraph.from_dict(data, directed=directed)
+        elif graph_type == 'csr':
+            return CSRGraph.from_dict(data, directed=directed, weighted=weighted)
+        else:
+            raise ValueError("Invalid graph type. Use 'adjacency_matrix', 'bit_matrix', 'adjacency_list' or 'csr'.")
+
+    @staticmethod
+    def from_edges(edges, graph_type: str='adjacency_list', directed: bool=False, weighted: bool=False) -> object:
+        """ 
+        Create a graph from an iterable of edges in a single pass.
+        Vertices are interned as they are seen and storage is filled in bulk, which is much
+        faster than calling add_edge() for each edge.
+
+        Args:
+            edges: An iterable of (start, end) tuples, or (start, end, weight) tuples for weighted graphs.
+            graph_type (str): The type of graph ('adjacency_matrix', 'bit_matrix', 'adjacency_list' or 'csr').
+            directed (bool): Whether the graph is directed.
+            weighted (bool): Whether the graph is weighted.
+
+        Returns:
+            An instance of the specified graph class.
+        """
+        if graph_type == 'adjacency_matrix':
+            if weighted:
+                return AdjacencyMatrixWeightedGraph.from_edges(edges, directed=directed)
+            else:
+                return AdjacencyMatrixGraph.from_edges(edges, directed=directed)
+        elif graph_type == 'bit_matrix':
+            if weighted:
+                raise ValueError("Bit matrix graphs are unweighted.")
+            return AdjacencyBitMatrixGraph.from_edges(edges, directed=directed)
+        elif graph_type == 'adjacency_list':
+            if weighted:
+                return AdjacencyListWeightedGraph.from_edges(edges, directed=directed)
+            else:
+                return AdjacencyListGraph.from_edges(edges, directed=directed)
+        elif graph_type == 'csr':
+            return CSRGraph(directed=directed, weighted=weighted, edges=edges)
         else:
-            raise ValueError("Invalid graph type. Use 'adjacency_matrix' or 'adjacency_list'.")
+            raise ValueError("Invalid graph type. Use 'adjacency_matrix', 'bit_matrix', 'adjacency_list' or 'csr'.")
+
+    @staticmethod
+    def read_edgelist(path: str, weighted: bool=False, delimiter: str=None, comment: str='#'):
+        """ 
+        Read edges from a text file one line at a time (a generator, so the file is never fully loaded).
+        Each line holds a start label, an end label and, for weighted graphs, a weight.
+        Blank lines and lines starting with the comment string are skipped.
+
+        Args:
+            path (str): The path of the edge list file.
+            weighted (bool): Whether to read a weight from the third column.
+            delimiter (str): The column delimiter (None for whitespace, ',' for CSV).
+            comment (str): The prefix of comment lines.
+
+        Yields:
+            (start, end) tuples, or (start, end, weight) tuples for weighted graphs.
+
+        Raises:
+            ValueError: If a line has too few columns.
+        """
+        columns = 3 if weighted else 2
+        with open(path) as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith(comment):
+                    continue
+                fields = [field.strip() for field in line.split(delimiter)]
+                if len(fields) < columns:
+                    raise ValueError(f"Line {line_number}: expected {columns} columns, found {len(fields)}")
+                if weighted:
+                    yield fields[0], fields[1], _parse_weight(fields[2])
+                else:
+                    yield fields[0], fields[1]
 
-class AdjacencyMatrixGraph:
+    @staticmethod
+    def load_edgelist(path: str, graph_type: str='adjacency_list', directed: bool=False, weighted: bool=False, delimiter: str=None, comment: str='#') -> object:
+        """ 
+        Create a graph from a whitespace- or CSV-delimited edge list file, streaming the file once.
+
+        Args:
+            path (str): The path of the edge list file.
+            graph_type (str): The type of graph ('adjacency_matrix', 'bit_matrix', 'adjacency_list' or 'csr').
+            directed (bool): Whether the graph is directed.
+            weighted (bool): Whether the graph is weighted (weights are read from the third column).
+            delimiter (str): The column delimiter (None for whitespace, ',' for CSV).
+            comment (str): The prefix of comment lines.
+
+        Returns:
+            An instance of the specified graph class.
+        """
+        edges = Graph.read_edgelist(path, weighted=weighted, delimiter=delimiter, comment=comment)
+        return Graph.from_edges(edges, graph_type=graph_type, directed=directed, weighted=weighted)
+
+class AdjacencyMatrixGraph(_GraphViews):
     """ 
     An unweighted adjacency matrix graph implementation.
     
     This class allows either directed or undirected representation of a graph.
     Vertex labels are string types.
     """
-    def __init__(self, directed=False, weighted=False, vertices=None):
+    def __init__(self, directed=False, weighted=False, vertices=None, stable_ids=False):
         """
         Initialize the graph with optional vertex labels.
         
         Args:
             directed (bool): Whether the graph is directed.
             vertices (list[str]): List of labels for each vertex.
+            stable_ids (bool): If True, deleted vertices leave a tombstone slot that is reused by the next add_vertex(),
+                so vertex ids never change (until compact() is called) and deletes are O(V).
 
         """
         if vertices is None:
@@ -115,10 +381,18 @@ class AdjacencyMatrixGraph:
         # Map labels to indices
         self.label_index = {label: i for i, label in enumerate(self.labels)}
 
+        self.stable_ids = stable_ids
+        #: ids of deleted (tombstone) slots available for reuse
+        self._free = []
+
         # Initialize matrix
         n = len(self.labels)
-        self._matrix = [[None for _ in range(n)] for _ in range(n)]
+        self._matrix = [[None] * n for _ in range(n)]
 
+        #: edge counters, kept up to date by every mutation
+        self._edge_count = 0
+        self._out_degree = [0] * n
+        self._in_degree = [0] * n
 
     def add_edge(self, start_label: str, end_label: str, directed=None):
         """ 
@@ -136,13 +410,68 @@ class AdjacencyMatrixGraph:
         
         a = self.label_index[start_label]
         b = self.label_index[end_label]
-        self._matrix[a][b] = True
+        self._set_cell(a, b, True)
 
         if directed is None:            
             directed = self.is_directed
         
         if not directed:
-            self._matrix[b][a] = True
+            self._set_cell(b, a, True)
+
+    def _set_cell(self, a: int, b: int, value):
+        """
+        Helper method to set a matrix cell (None for no edge) and update the edge counters.
+        """
+        row = self._matrix[a]
+        if row[b] is None and value is not None:
+            self._count_edge(a, b, 1)
+        elif row[b] is not None and value is None:
+            self._count_edge(a, b, -1)
+        row[b] = value
+
+    def _count_edge(self, a: int, b: int, delta: int):
+        """
+        Helper method to add delta to the edge counters for an edge from id a to id b.
+        Self-loops count toward the degrees but not the edge count, as edges() skips them.
+        """
+        if a != b:
+            self._edge_count += delta
+        self._out_degree[a] += delta
+        self._in_degree[b] += delta
+
+    def _has_cell(self, a: int, b: int) -> bool:
+        """
+        Helper method to test for an edge from id a to id b.
+        """
+        return self._matrix[a][b] is not None
+
+    def _out_ids(self, a: int) -> list:
+        """
+        Helper method to return the ids of the adjacents of id a.
+        """
+        return [b for b, cell in enumerate(self._matrix[a]) if cell is not None]
+
+    def _recount(self):
+        """
+        Helper method to rebuild the edge counters from the matrix (used after bulk loads).
+        """
+        n = len(self.labels)
+        self._out_degree = [0] * n
+        self._in_degree = [0] * n
+        self._edge_count = 0
+        for a in range(n):
+            for b in self._out_ids(a):
+                self._count_edge(a, b, 1)
+
+    def _drop_counts(self, index: int):
+        """
+        Helper method to remove the edges into and out of id index from the edge counters.
+        """
+        for b in self._out_ids(index):
+            self._count_edge(index, b, -1)
+        for a in range(len(self.labels)):
+            if a != index and self._has_cell(a, index):
+                self._count_edge(a, index, -1)
 
     def add_vertex(self, label: str):
         """ 
@@ -156,12 +485,81 @@ class AdjacencyMatrixGraph:
         """
         if label in self.label_index:
             raise ValueError(f"Vertex {label} already exists")
+        if self._reuse_slot(label):
+            return
         self.labels.append(label)
         self.label_index[label] = len(self.labels) - 1
+        self._out_degree.append(0)
+        self._in_degree.append(0)
         for row in self._matrix:
             row.append(None)
         self._matrix.append([None for i in range(len(self.labels))])
 
+    def _reuse_slot(self, label: str) -> bool:
+        """
+        Helper method to place a new vertex in a deleted slot, if there is one.
+        The row and column of a deleted slot are already cleared.
+        """
+        if not self._free:
+            return False
+        index = self._free.pop()
+        self.labels[index] = label
+        self.label_index[label] = index
+        return True
+
+    def _tombstone(self, label: str):
+        """
+        Helper method to delete a vertex by clearing its row and column and marking its slot free.
+        """
+        index = self.label_index.pop(label)
+        self._drop_counts(index)
+        self._clear_slot(index)
+        self.labels[index] = _DELETED
+        self._free.append(index)
+
+    def _clear_slot(self, index: int):
+        """
+        Helper method to clear the row and column of a vertex slot.
+        """
+        self._matrix[index] = [None] * len(self._matrix)
+        for row in self._matrix:
+            row[index] = None
+
+    def _compact_storage(self, keep: list):
+        """
+        Helper method to rebuild the matrix with only the given slots.
+        """
+        self._matrix = [[self._matrix[i][j] for j in keep] for i in keep]
+
+    def compact(self) -> dict:
+        """ 
+        Remove deleted (tombstone) slots and renumber the vertices.
+
+        Returns:
+            A dictionary mapping old vertex ids to new vertex ids.
+        """
+        keep = [i for i, label in enumerate(self.labels) if label is not _DELETED]
+        self._compact_storage(keep)
+        self._out_degree = [self._out_degree[i] for i in keep]
+        self._in_degree = [self._in_degree[i] for i in keep]
+        self.labels = [self.labels[i] for i in keep]
+        self.label_index = {label: i for i, label in enumerate(self.labels)}
+        self._free = []
+        return {old: new for new, old in enumerate(keep)}
+
+    def index_of(self, label: str) -> int:
+        """ 
+        Return the integer id of a vertex (its row and column in the matrix).
+        With stable_ids, the id does not change when other vertices are deleted.
+
+        Args:
+            label (str): The vertex label.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        return self.label_index[label]
+
     def delete_vertex(self, label: str):
         """ 
         Delete a vertex from the graph.
@@ -169,7 +567,13 @@ class AdjacencyMatrixGraph:
         Args:
             label (str): The vertex label to delete.
         """
+        if self.stable_ids:
+            self._tombstone(label)
+            return
         index = self.label_index[label]
+        self._drop_counts(index)
+        self._out_degree.pop(index)
+        self._in_degree.pop(index)
         self.labels.pop(index)
         self.label_index = { label: index for index, label in enumerate(self.labels) }
         self._matrix.pop(index)
@@ -190,7 +594,7 @@ class AdjacencyMatrixGraph:
         if self._matrix[a][b] is None:
             raise KeyError(f"Edge {start_label} to {end_label} does not exist")
 
-        self._matrix[a][b] = None
+        self._set_cell(a, b, None)
         
         if directed is None:
             directed = self.is_directed
@@ -198,40 +602,73 @@ class AdjacencyMatrixGraph:
         if not directed:
             if self._matrix[b][a] is None:
                 raise KeyError(f"Edge {end_label} to {start_label} does not exist")
-            self._matrix[b][a] = None
+            self._set_cell(b, a, None)
 
     def vertices(self) -> list:
         """
         Return a list of vertex labels of the graph
         """
+        if self._free:
+            return [label for label in self.labels if label is not _DELETED]
         return self.labels
     
     def edges(self) -> list:
         """ 
         Return a list of edges in the graph. Each edge is represented by a tuple (start, end)
         """
-        edges = []
-        vertex_count = len(self.labels)
-        for i in range(vertex_count):
-            for j in range(vertex_count):
-                if self._matrix[i][j] and i != j:  
-                    edges.append((self.labels[i], self.labels[j]))
-    
-        return edges
+        return list(self.iter_edges())
+
+    def iter_edges(self):
+        """ 
+        Yield the edges of the graph one at a time, in the same order as edges().
+        """
+        labels = self.labels
+        for i, row in enumerate(self._matrix):
+            for j, cell in enumerate(row):
+                if cell and i != j:
+                    yield (labels[i], labels[j])
 
     def undirected_edges(self) -> list:
         """ 
         Return a list of undirected edges in the graph. Each edge is represented by a tuple (start, end)
         """
+        seen = set()
         edges = []
-        vertex_count = len(self.labels)
-        for i in range(vertex_count):
-            for j in range(vertex_count):
-                if self._matrix[i][j] and i != j and (self.labels[j], self.labels[i]) not in edges:  
-                    edges.append((self.labels[i], self.labels[j]))
-    
+        for edge in self.iter_edges():
+            if (edge[1], edge[0]) not in seen:
+                seen.add(edge)
+                edges.append(edge)
         return edges
 
+    def predecessors(self, vertex: str) -> list:
+        """
+        Return a list of the vertices with an edge to a given vertex, by scanning its column in O(V).
+
+        Args:
+            vertex (str): The vertex label.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        b = self.label_index[vertex]
+        return [self.labels[a] for a in range(len(self.labels)) if self._has_cell(a, b)]
+
+    def in_edges(self, vertex: str) -> list:
+        """
+        Return a list of the edges entering a given vertex.
+        Each edge is represented by a tuple (start, end), or (start, end, weight) for weighted graphs.
+
+        Args:
+            vertex (str): The vertex label.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        if self.is_weighted:
+            b = self.label_index[vertex]
+            return [(start, vertex, self._matrix[self.label_index[start]][b]) for start in self.predecessors(vertex)]
+        return [(start, vertex) for start in self.predecessors(vertex)]
+
     def has_vertex(self, label: str) -> bool:
         """ 
         Return boolean if a vertex exists
@@ -273,8 +710,21 @@ class AdjacencyMatrixGraph:
         Args:
             vertex (str): The label of the vertex.
         """
-        index = self.label_index[vertex]
-        return [self.labels[i] for i in range(len(self._matrix[index])) if self.has_edge(vertex, self.labels[i])]
+        return list(self.iter_adjacents(vertex))
+
+    def iter_adjacents(self, vertex: str):
+        """
+        Return an iterator over the adjacents of a given vertex, without building a list.
+
+        Args:
+            vertex (str): The label of the vertex.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        row = self._matrix[self.label_index[vertex]]
+        labels = self.labels
+        return (labels[i] for i, cell in enumerate(row) if cell is not None)
 
     def __getitem__(self, vertex: str) -> list:
         """ 
@@ -299,16 +749,17 @@ class AdjacencyMatrixGraph:
         """ 
         Print the contents of the graph.
         """
+        live = [i for i, label in enumerate(self.labels) if label is not _DELETED]
         print("   |", end="")
-        for label in self.labels:
-            print(f"{label:^3}", end=" ")
+        for i in live:
+            print(f"{self.labels[i]:^3}", end=" ")
         print()
-        print("----" * (len(self._matrix) + 1))
-        for r, row in enumerate(self._matrix):
+        print("----" * (len(live) + 1))
+        for r in live:
             label = self.labels[r]
             print(f"{label:^3}|", end="")
-            for col in row:
-                b = " T " if col else "   "
+            for c in live:
+                b = " T " if self._matrix[r][c] else "   "
                 print(b, end=" ")
             print()
             
@@ -318,26 +769,54 @@ class AdjacencyMatrixGraph:
         Returns:
             int: The number of nodes in the graph.
         """
-        return len(self.labels)
+        return len(self.label_index)
     
     def __len__(self):
         """
         Return the number of nodes in the graph.
         """
-        return len(self.labels)
+        return len(self.label_index)
             
     def size(self) -> int:
         """
-        Return the number of edges in the graph.
+        Return the number of edges in the graph. Self-loops are not counted, as in edges().
         Returns:
             int: The number of edges in the graph.
         """
-        edge_count = 0
-        for start in self.labels:
-            edge_count += len(self[start])
         if not self.is_directed:
-            edge_count = edge_count // 2
-        return edge_count
+            return self._edge_count // 2
+        return self._edge_count
+
+    def out_degree(self, vertex: str) -> int:
+        """
+        Return the number of edges leaving a vertex in O(1).
+
+        Args:
+            vertex (str): The vertex label.
+        """
+        return self._out_degree[self.label_index[vertex]]
+
+    def in_degree(self, vertex: str) -> int:
+        """
+        Return the number of edges entering a vertex in O(1).
+
+        Args:
+            vertex (str): The vertex label.
+        """
+        return self._in_degree[self.label_index[vertex]]
+
+    def degree(self, vertex: str) -> int:
+        """
+        Return the degree of a vertex in O(1): the number of adjacents for an undirected graph,
+        in-degree plus out-degree for a directed graph.
+
+        Args:
+            vertex (str): The vertex label.
+        """
+        index = self.label_index[vertex]
+        if self.is_directed:
+            return self._in_degree[index] + self._out_degree[index]
+        return self._out_degree[index]
     
     def to_dict(self) -> dict:
         """ 
@@ -354,6 +833,8 @@ class AdjacencyMatrixGraph:
         matrix_dict = {}
         
         for i, row in enumerate(self._matrix):
+            if self.labels[i] is _DELETED:
+                continue
             if self.is_weighted:
                 matrix_dict[self.labels[i]] = {}
             else:
@@ -368,6 +849,24 @@ class AdjacencyMatrixGraph:
         
         return matrix_dict
 
+    def freeze(self) -> 'CSRGraph':
+        """ 
+        Return an immutable CSR copy of the graph.
+
+        Returns:
+            A CSRGraph with the same vertices, edges and adjacency order.
+        """
+        return CSRGraph.from_graph(self)
+
+    def save(self, path: str):
+        """ 
+        Write the graph to a compact binary file (see CSRGraph.save()).
+
+        Args:
+            path (str): The path of the file to write.
+        """
+        self.freeze().save(path)
+
     @classmethod
     def from_dict(cls, data: dict, directed: bool = False):
         """ 
@@ -387,18 +886,54 @@ class AdjacencyMatrixGraph:
                 graph.add_edge(start_node, end_node)
         return graph
 
+    @classmethod
+    def from_edges(cls, edges, directed: bool = False):
+        """ 
+        Create a graph from an iterable of (start, end) edges.
+        Vertices are interned in one pass and the matrix is allocated once before it is filled.
+        
+        Args:
+            edges: An iterable of (start, end) tuples.
+            directed (bool): Whether the graph is directed.
+            
+        Returns:
+            An instance of the graph class.
+        """
+        return cls._bulk_load(edges, directed, weighted=False)
+
+    @classmethod
+    def _bulk_load(cls, edges, directed: bool, weighted: bool):
+        """
+        Helper method to intern the edge labels, preallocate the graph and fill it.
+        """
+        labels = []
+        label_index = {}
+        starts, ends, weights = _intern_edges(edges, weighted, directed, labels, label_index)
+        graph = cls(directed=directed, vertices=labels)
+        graph._fill_edges(starts, ends, weights)
+        return graph
+
+    def _fill_edges(self, starts, ends, weights):
+        """
+        Helper method to set matrix cells from arrays of vertex ids.
+        """
+        for a, b in zip(starts, ends):
+            self._matrix[a][b] = True
+        self._recount()
+
 class AdjacencyMatrixWeightedGraph(AdjacencyMatrixGraph):
     """ 
     A weighted adjacency matrix graph implementation
     (allows either directed or undirected representation)
     vertex labels are string types
     """
-    def __init__(self, directed=False, vertices=None):
+    def __init__(self, directed=False, vertices=None, stable_ids=False):
         """ 
         Args:
             vertices: list of labels for each vertex (string types)
+            stable_ids (bool): If True, deleted vertices leave a reusable tombstone slot (see AdjacencyMatrixGraph).
         """
-        super().__init__(directed=directed, vertices=vertices)
+        super().__init__(directed=directed, vertices=vertices, stable_ids=stable_ids)
         self.is_weighted=True
 
     def add_edge(self, start_label: str, end_label: str, weight, directed=None):
@@ -419,29 +954,31 @@ class AdjacencyMatrixWeightedGraph(AdjacencyMatrixGraph):
         a = self.label_index[start_label]
         b = self.label_index[end_label]
 
-        self._matrix[a][b] = weight
-        self._matrix[a][a] = None # prevent self-loop
-        self._matrix[b][b] = None
+        self._set_cell(a, b, weight)
+        self._set_cell(a, a, None) # prevent self-loop
+        self._set_cell(b, b, None)
 
         if directed is None:
             directed = self.is_directed
 
         if not directed:
-            self._matrix[b][a] = weight
+            self._set_cell(b, a, weight)
         
     def print_graph(self):
         """ 
         Print the contents of the graph.
         """
+        live = [i for i, label in enumerate(self.labels) if label is not _DELETED]
         print("   |", end="")
-        for label in self.labels:
-            print(f"{label:>3}", end=" ")
+        for i in live:
+            print(f"{self.labels[i]:>3}", end=" ")
         print()
-        print("----" * (len(self._matrix) + 1))
-        for r, row in enumerate(self._matrix):
+        print("----" * (len(live) + 1))
+        for r in live:
             label = self.labels[r]
             print(f"{label:^3}|", end="")
-            for col in row:
+            for c in live:
+                col = self._matrix[r][c]
                 w = f"{col:3}" if col is not None else "   "
                 print(w, end=" ")
             print()
@@ -450,15 +987,17 @@ class AdjacencyMatrixWeightedGraph(AdjacencyMatrixGraph):
         """ 
         Return a list of edges in the graph. Each edge is represented by a tuple (start, end, weight).
         """
-        edges = []
-        vertex_count = len(self.labels)
-        for i in range(vertex_count):
-            for j in range(vertex_count):
-                weight = self._matrix[i][j]
-                if weight and i != j:  
-                    edges.append((self.labels[i], self.labels[j], weight))
-    
-        return edges
+        return list(self.iter_edges())
+
+    def iter_edges(self):
+        """ 
+        Yield the edges of the graph one at a time, in the same order as edges().
+        """
+        labels = self.labels
+        for i, row in enumerate(self._matrix):
+            for j, weight in enumerate(row):
+                if weight and i != j:
+                    yield (labels[i], labels[j], weight)
 
     def adjacent_items(self, vertex: str) -> list:
         """
@@ -467,22 +1006,33 @@ class AdjacencyMatrixWeightedGraph(AdjacencyMatrixGraph):
         Args:
             vertex: starting vertex label 
         """
-        index = self.label_index[vertex]
-        return [(self.labels[i], self._matrix[index][i]) for i in range(len(self._matrix[index])) if self.has_edge(vertex, self.labels[i])]
+        return list(self.iter_adjacent_items(vertex))
+
+    def iter_adjacent_items(self, vertex: str):
+        """
+        Return an iterator over the (adjacent label, weight) pairs of a given vertex, without building a list.
+
+        Args:
+            vertex: starting vertex label 
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        row = self._matrix[self.label_index[vertex]]
+        labels = self.labels
+        return ((labels[i], weight) for i, weight in enumerate(row) if weight is not None)
 
     
     def undirected_edges(self) -> list:
         """ 
         Return a list of undirected edges in the graph. Each edge is represented by a tuple (start, end, weight).
         """
+        seen = set()
         edges = []
-        vertex_count = len(self.labels)
-        for i in range(vertex_count):
-            for j in range(vertex_count):
-                weight = self._matrix[i][j]
-                if weight and i != j and (self.labels[j], self.labels[i], weight) not in edges:  
-                    edges.append((self.labels[i], self.labels[j], weight))
-    
+        for edge in self.iter_edges():
+            if (edge[1], edge[0], edge[2]) not in seen:
+                seen.add(edge)
+                edges.append(edge)
         return edges
 
     def get_weight(self, start_label: str, end_label: str):
@@ -530,15 +1080,419 @@ class AdjacencyMatrixWeightedGraph(AdjacencyMatrixGraph):
                 graph.add_edge(start_node, end_node, weight)
         return graph
 
-class AdjacencyListGraph:
+    @classmethod
+    def from_edges(cls, edges, directed: bool = False):
+        """ 
+        Create a weighted graph from an iterable of (start, end, weight) edges.
+        Vertices are interned in one pass and the matrix is allocated once before it is filled.
+        
+        Args:
+            edges: An iterable of (start, end, weight) tuples.
+            directed (bool): Whether the graph is directed.
+            
+        Returns:
+            An instance of the weighted graph class.
+        """
+        return cls._bulk_load(edges, directed, weighted=True)
+
+    def _fill_edges(self, starts, ends, weights):
+        """
+        Helper method to set matrix cells from arrays of vertex ids (self-loops are not stored).
+        """
+        for a, b, weight in zip(starts, ends, weights):
+            if a != b:
+                self._matrix[a][b] = weight
+        self._recount()
+
+class AdjacencyBitMatrixGraph(AdjacencyMatrixGraph):
+    """ 
+    An unweighted adjacency matrix graph implementation with bit-packed rows.
+
+    Each row of the matrix is a bytearray with one bit per vertex, so a dense graph uses
+    V * V / 8 bytes instead of a Python reference per cell (a 50,000 vertex graph fits in about 300 MB).
+    Adjacents are found by scanning the set bits of a row.
+
+    This class allows either directed or undirected representation of a graph.
+    """
+    def __init__(self, directed=False, vertices=None, stable_ids=False):
+        """
+        Initialize the graph with optional vertex labels.
+        
+        Args:
+            directed (bool): Whether the graph is directed.
+            vertices (list[str]): List of labels for each vertex.
+            stable_ids (bool): If True, deleted vertices leave a reusable tombstone slot (see AdjacencyMatrixGraph).
+        """
+        if vertices is None:
+            vertices = []
+
+        self.labels = list(vertices)
+
+        # Prevent duplicates
+        if len(self.labels) != len(set(self.labels)):
+            raise ValueError("Duplicate vertex labels are not allowed.")
+
+        self.is_directed = directed
+        self.is_weighted = False
+
+        # Map labels to indices
+        self.label_index = {label: i for i, label in enumerate(self.labels)}
+
+        self.stable_ids = stable_ids
+        #: ids of deleted (tombstone) slots available for reuse
+        self._free = []
+
+        # Initialize rows (capacity is rounded up to a whole number of bytes)
+        self._row_bytes = max((len(self.labels) + 7) // 8, 1)
+        self._rows = [bytearray(self._row_bytes) for _ in self.labels]
+
+        #: edge counters, kept up to date by every mutation
+        self._edge_count = 0
+        self._out_degree = [0] * len(self.labels)
+        self._in_degree = [0] * len(self.labels)
+
+    @staticmethod
+    def _bits(row) -> list:
+        """
+        Helper method to return the indices of the set bits of a row in increasing order.
+        """
+        return list(AdjacencyBitMatrixGraph._iter_bits(row))
+
+    @staticmethod
+    def _iter_bits(row):
+        """
+        Helper method to yield the indices of the set bits of a row in increasing order.
+        """
+        # scan 64-bit words so zero words are skipped and the bit tricks work on small integers,
+        # instead of rewriting a V-bit integer for every set bit
+        full = len(row) - len(row) % 8
+        words = array('Q')
+        words.frombytes(row[:full])
+        if sys.byteorder == 'big':
+            words.byteswap()
+        base = 0
+        for word in words:
+            while word:
+                low = word & -word
+                yield base + low.bit_length() - 1
+                word ^= low
+            base += 64
+        word = int.from_bytes(row[full:], 'little')
+        while word:
+            low = word & -word
+            yield base + low.bit_length() - 1
+            word ^= low
+
+    def add_vertex(self, label: str):
+        """ 
+        Add a vertex to the graph. Row capacity doubles when it is exhausted.
+        
+        Args:
+            label (str): The vertex label to add.
+        
+        Raises:
+            ValueError: If the vertex label already exists.
+        """
+        if label in self.label_index:
+            raise ValueError(f"Vertex {label} already exists")
+        if self._reuse_slot(label):
+            return
+        self.labels.append(label)
+        self.label_index[label] = len(self.labels) - 1
+        self._out_degree.append(0)
+        self._in_degree.append(0)
+
+        if len(self.labels) > self._row_bytes * 8:
+            extra = self._row_bytes
+            for row in self._rows:
+                row.extend(bytes(extra))
+            self._row_bytes += extra
+        self._rows.append(bytearray(self._row_bytes))
+
+    def delete_vertex(self, label: str):
+        """ 
+        Delete a vertex from the graph.
+        
+        Args:
+            label (str): The vertex label to delete.
+        """
+        if self.stable_ids:
+            self._tombstone(label)
+            return
+        index = self.label_index[label]
+        self._drop_counts(index)
+        self._out_degree.pop(index)
+        self._in_degree.pop(index)
+        self.labels.pop(index)
+        self.label_index = { label: index for index, label in enumerate(self.labels) }
+        self._rows.pop(index)
+
+        # remove the column by shifting the higher bits of every row down by one
+        low_mask = (1 << index) - 1
+        for i, row in enumerate(self._rows):
+            bits = int.from_bytes(row, 'little')
+            if bits >> index:
+                bits = (bits & low_mask) | ((bits >> (index + 1)) << index)
+                self._rows[i] = bytearray(bits.to_bytes(self._row_bytes, 'little'))
+
+    def _clear_slot(self, index: int):
+        """
+        Helper method to clear the row and column bits of a vertex slot.
+        """
+        self._rows[index] = bytearray(self._row_bytes)
+        mask = ~(1 << (index & 7)) & 0xFF
+        for row in self._rows:
+            row[index >> 3] &= mask
+
+    def _compact_storage(self, keep: list):
+        """
+        Helper method to rebuild the rows with only the given slots.
+        """
+        new_index = {old: new for new, old in enumerate(keep)}
+        self._row_bytes = max((len(keep) + 7) // 8, 1)
+        rows = []
+        for i in keep:
+            row = bytearray(self._row_bytes)
+            for j in self._bits(self._rows[i]):
+                k = new_index[j]
+                row[k >> 3] |= 1 << (k & 7)
+            rows.append(row)
+        self._rows = rows
+
+    def add_edge(self, start_label: str, end_label: str, directed=None):
+        """ 
+        Add an edge in the graph.
+        
+        Args:
+            start_label (str): Starting vertex label.
+            end_label (str): Ending vertex label.
+            directed (bool): Whether the edge is directed.
+        """
+        if start_label not in self.label_index:
+            self.add_vertex(start_label)
+        if end_label not in self.label_index:
+            self.add_vertex(end_label)
+
+        a = self.label_index[start_label]
+        b = self.label_index[end_label]
+        self._set_bit(a, b)
+
+        if directed is None:
+            directed = self.is_directed
+
+        if not directed:
+            self._set_bit(b, a)
+
+    def _fill_edges(self, starts, ends, weights):
+        """
+        Helper method to set matrix bits from arrays of vertex ids.
+        """
+        rows = self._rows
+        for a, b in zip(starts, ends):
+            rows[a][b >> 3] |= 1 << (b & 7)
+        self._recount()
+
+    def _has_bit(self, a: int, b: int) -> bool:
+        """
+        Helper method to test the matrix bit at row a, column b.
+        """
+        return bool(self._rows[a][b >> 3] & (1 << (b & 7)))
+
+    _has_cell = _has_bit
+
+    def _set_bit(self, a: int, b: int):
+        """
+        Helper method to set the matrix bit at row a, column b and update the edge counters.
+        """
+        if not self._has_bit(a, b):
+            self._rows[a][b >> 3] |= 1 << (b & 7)
+            self._count_edge(a, b, 1)
+
+    def _clear_bit(self, a: int, b: int):
+        """
+        Helper method to clear the matrix bit at row a, column b and update the edge counters.
+        """
+        if self._has_bit(a, b):
+            self._rows[a][b >> 3] &= ~(1 << (b & 7)) & 0xFF
+            self._count_edge(a, b, -1)
+
+    def _out_ids(self, a: int) -> list:
+        """
+        Helper method to return the ids of the adjacents of id a.
+        """
+        return self._bits(self._rows[a])
+
+    def delete_edge(self, start_label: str, end_label: str, directed=None):
+        """ 
+        Delete an edge in the graph.
+        
+        Args:
+            start_label (str): Starting vertex label.
+            end_label (str): Ending vertex label.
+            directed (bool): Whether the edge is directed.
+        """
+        a = self.label_index[start_label]
+        b = self.label_index[end_label]
+        if not self._has_bit(a, b):
+            raise KeyError(f"Edge {start_label} to {end_label} does not exist")
+
+        self._clear_bit(a, b)
+
+        if directed is None:
+            directed = self.is_directed
+
+        if not directed:
+            if not self._has_bit(b, a):
+                raise KeyError(f"Edge {end_label} to {start_label} does not exist")
+            self._clear_bit(b, a)
+
+    def iter_edges(self):
+        """ 
+        Yield the edges of the graph one at a time, in the same order as edges().
+        """
+        labels = self.labels
+        for i, row in enumerate(self._rows):
+            for j in self._iter_bits(row):
+                if i != j:
+                    yield (labels[i], labels[j])
+
+    def undirected_edges(self) -> list:
+        """ 
+        Return a list of undirected edges in the graph. Each edge is represented by a tuple (start, end)
+        """
+        edges = []
+        for i, row in enumerate(self._rows):
+            for j in self._bits(row):
+                if i != j and not (j < i and self._has_bit(j, i)):
+                    edges.append((self.labels[i], self.labels[j]))
+        return edges
+
+    def has_edge(self, start_label: str, end_label: str) -> bool:
+        """ 
+        Return boolean if an edge exists.
+
+        Args:
+            start_label (str): starting vertex label
+            end_label (str): starting vertex label
+        
+        Returns:
+            A boolean of whether there is an edge from start to end.
+        """
+        if not self.has_vertex(start_label):
+            raise KeyError(f"Vertex {start_label} does not exist")
+        if not self.has_vertex(end_label):
+            raise KeyError(f"Vertex {end_label} does not exist")
+
+        return self._has_bit(self.label_index[start_label], self.label_index[end_label])
+
+    def adjacents(self, vertex: str) -> list:
+        """
+        Return a list of adjacents of a given vertex
+
+        Args:
+            vertex (str): The label of the vertex.
+        """
+        return list(self.iter_adjacents(vertex))
+
+    def iter_adjacents(self, vertex: str):
+        """
+        Return an iterator over the adjacents of a given vertex, without building a list.
+
+        Args:
+            vertex (str): The label of the vertex.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        row = self._rows[self.label_index[vertex]]
+        labels = self.labels
+        return (labels[i] for i in self._iter_bits(row))
+
+    def __getitem__(self, vertex: str) -> list:
+        """ 
+        Args:
+            vertex (str): The vertex label.
+        Returns:
+            A list of adjacent vertex labels.
+        """
+        return self.adjacents(vertex)
+
+    def print_graph(self):
+        """ 
+        Print the contents of the graph.
+        """
+        live = [i for i, label in enumerate(self.labels) if label is not _DELETED]
+        print("   |", end="")
+        for i in live:
+            print(f"{self.labels[i]:^3}", end=" ")
+        print()
+        print("----" * (len(live) + 1))
+        for r in live:
+            label = self.labels[r]
+            print(f"{label:^3}|", end="")
+            for c in live:
+                b = " T " if self._has_bit(r, c) else "   "
+                print(b, end=" ")
+            print()
+
+    def to_dict(self) -> dict:
+        """ 
+        Return the adjacency matrix as a dictionary of lists.
+        
+        Returns:
+            A dictionary representing the adjacency matrix of the graph: {vertex: [neighbor1, neighbor2, ...]}
+        """
+        return {label: self.adjacents(label) for label in self.vertices()}
+
+    def bfs_layers(self, start_label: str) -> list:
+        """ 
+        Return the breadth-first levels from a start vertex, expanding each frontier
+        with bitwise OR of its rows and masking visited vertices with AND.
+
+        Args:
+            start_label (str): The starting vertex label.
+
+        Returns:
+            A list of levels, each a list of vertex labels in vertex order.
+        """
+        start = self.label_index[start_label]
+        visited = frontier = 1 << start
+        layers = []
+        while frontier:
+            indices = []
+            reached = 0
+            while frontier:
+                low = frontier & -frontier
+                i = low.bit_length() - 1
+                indices.append(i)
+                reached |= int.from_bytes(self._rows[i], 'little')
+                frontier ^= low
+            layers.append([self.labels[i] for i in indices])
+            frontier = reached & ~visited
+            visited |= frontier
+        return layers
+
+class AdjacencyListGraph(_GraphViews):
     """ 
     A unweighted adjacency list vertex implementation
     (allows either directed or undirected representation)
     vertex labels are string types
     """
-    def __init__(self, directed=False, vertices=None):
+    def __init__(self, directed=False, vertices=None, reverse_index=False):
+        """ 
+        Args:
+            directed (bool): Whether the graph is directed.
+            vertices (list[str]): List of labels for each vertex.
+            reverse_index (bool): If True, maintain a map of each vertex's predecessors so that
+                predecessors(), in_edges() and delete_vertex() take time proportional to the degree.
+        """
         #: hash table of vertices in graph
         self._adjacents = {}
+        #: edge counters, kept up to date by every mutation (out-degree is the length of a row)
+        self._in_degree = {}
+        self._edge_count = 0
+        #: hash table of predecessors of each vertex (None when there is no reverse index)
+        self._predecessors = {} if reverse_index else None
         self.is_directed = directed
         self.is_weighted = False
         if vertices is None:
@@ -560,20 +1514,48 @@ class AdjacencyListGraph:
         if label in self._adjacents:
             raise ValueError(f"Vertex {label} already exists")
         
-        self._adjacents[label] = []
+        self._add_row(label, [])
+
+    def _add_row(self, label: str, row):
+        """
+        Helper method to add a vertex with an empty adjacency row.
+        """
+        self._adjacents[label] = row
+        self._in_degree[label] = 0
+        if self._predecessors is not None:
+            self._predecessors[label] = {}
 
     def delete_vertex(self, label: str):
         """ 
         Delete a vertex from the graph.
+        With a reverse index this is O(degree), otherwise every adjacency list is scanned.
 
         Args:
             label (str): The vertex label to delete.
         """
         if label in self._adjacents:
+            for end in self._adjacents[label]:
+                self._in_degree[end] -= 1
+                if self._predecessors is not None:
+                    del self._predecessors[end][label]
+            self._edge_count -= len(self._adjacents[label])
             del self._adjacents[label]
-        for key in self._adjacents.keys():
-            if label in self._adjacents[key]:
-                self._adjacents[key].remove(label)
+            del self._in_degree[label]
+
+        if self._predecessors is not None:
+            starts = list(self._predecessors.pop(label, {}))
+        else:
+            starts = [key for key, row in self._adjacents.items() if label in row]
+        for key in starts:
+            if key in self._adjacents:
+                self._drop_entry(key, label)
+
+    def _drop_entry(self, start_label: str, end_label: str):
+        """
+        Helper method to remove end_label from the row of start_label while deleting end_label.
+        """
+        self._adjacents[start_label].remove(end_label)
+        self._edge_count -= 1
         
     def add_edge(self, start_label: str, end_label: str, directed=None):
         """ 
@@ -600,12 +1582,15 @@ class AdjacencyListGraph:
             end_label (str): The label of the ending vertex.
         """
         if start_label not in self._adjacents:
-            self._adjacents[start_label] = [end_label]
-        else:
-            if end_label not in self._adjacents[start_label]:
-                self._adjacents[start_label].append(end_label)
+            self.add_vertex(start_label)
         if end_label not in self._adjacents:
-            self._adjacents[end_label] = []
+            self.add_vertex(end_label)
+        if end_label not in self._adjacents[start_label]:
+            self._adjacents[start_label].append(end_label)
+            self._in_degree[end_label] += 1
+            self._edge_count += 1
+            if self._predecessors is not None:
+                self._predecessors[end_label][start_label] = None
 
     def delete_edge(self, start_label: str, end_label: str, directed=None):
         """ 
@@ -623,6 +1608,7 @@ class AdjacencyListGraph:
         if end_label not in self._adjacents[start_label]:
             raise KeyError(f"Vertex {end_label} does not exist")
         self._adjacents[start_label].remove(end_label)
+        self._unlink(start_label, end_label)
         
         if directed is None:
             directed = self.is_directed
@@ -633,6 +1619,7 @@ class AdjacencyListGraph:
             if start_label not in self._adjacents[end_label]:
                 raise KeyError(f"Vertex {start_label} does not exist")
             self._adjacents[end_label].remove(start_label)
+            self._unlink(end_label, start_label)
 
     def vertices(self) -> list:
         """
@@ -648,6 +1635,18 @@ class AdjacencyListGraph:
             vertex (str): The label of the vertex.
         """
         return self._adjacents[vertex]
+
+    def iter_adjacents(self, vertex: str):
+        """
+        Return an iterator over the adjacents of a given vertex, without building a list.
+
+        Args:
+            vertex (str): The label of the vertex.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        return iter(self._adjacents[vertex])
     
     def __getitem__(self, label: str):
         """ 
@@ -694,26 +1693,115 @@ class AdjacencyListGraph:
         Returns:
             int: The number of edges in the graph.
         """
-        edge_count = 0
-        for start in self._adjacents.keys():
-            edge_count += len(self.adjacents(start))
         if not self.is_directed:
-            edge_count = edge_count // 2
-        return edge_count
+            return self._edge_count // 2
+        return self._edge_count
 
-    def __len__(self):
+    def out_degree(self, vertex: str) -> int:
         """
-        Return the number of nodes in the graph.
-        Returns:
-            int: The number of nodes in the graph.
+        Return the number of edges leaving a vertex in O(1).
+
+        Args:
+            vertex (str): The vertex label.
         """
-        return len(self._adjacents)
+        return len(self._adjacents[vertex])
 
+    def in_degree(self, vertex: str) -> int:
+        """
+        Return the number of edges entering a vertex in O(1).
 
-    def order(self) -> int:
+        Args:
+            vertex (str): The vertex label.
         """
-        Return the number of nodes in the graph.
-        Returns:
+        return self._in_degree[vertex]
+
+    def degree(self, vertex: str) -> int:
+        """
+        Return the degree of a vertex in O(1): the number of adjacents for an undirected graph,
+        in-degree plus out-degree for a directed graph.
+
+        Args:
+            vertex (str): The vertex label.
+        """
+        if self.is_directed:
+            return self._in_degree[vertex] + len(self._adjacents[vertex])
+        return len(self._adjacents[vertex])
+
+    def _recount(self):
+        """
+        Helper method to rebuild the edge counters from the adjacency rows (used after bulk loads).
+        """
+        self._in_degree = {label: 0 for label in self._adjacents}
+        self._edge_count = 0
+        for row in self._adjacents.values():
+            self._edge_count += len(row)
+            for end in row:
+                self._in_degree[end] += 1
+        if self._predecessors is not None:
+            self.enable_reverse_index()
+
+    def _unlink(self, start_label: str, end_label: str):
+        """
+        Helper method to update the edge counters and reverse index after an edge is removed from a row.
+        """
+        self._in_degree[end_label] -= 1
+        self._edge_count -= 1
+        if self._predecessors is not None:
+            del self._predecessors[end_label][start_label]
+
+    def enable_reverse_index(self):
+        """
+        Build (or rebuild) the reverse index from the adjacency lists in O(V + E).
+        It is then maintained by every mutation.
+        """
+        predecessors = {label: {} for label in self._adjacents}
+        for start, row in self._adjacents.items():
+            for end in row:
+                predecessors[end][start] = None
+        self._predecessors = predecessors
+
+    def predecessors(self, vertex: str) -> list:
+        """
+        Return a list of the vertices with an edge to a given vertex.
+        With a reverse index this is O(in-degree), otherwise every adjacency list is scanned.
+
+        Args:
+            vertex (str): The vertex label.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        if vertex not in self._adjacents:
+            raise KeyError(f"Vertex {vertex} does not exist")
+        if self._predecessors is not None:
+            return list(self._predecessors[vertex])
+        return [start for start, row in self._adjacents.items() if vertex in row]
+
+    def in_edges(self, vertex: str) -> list:
+        """
+        Return a list of the edges entering a given vertex. Each edge is represented by a tuple (start, end)
+
+        Args:
+            vertex (str): The vertex label.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        return [(start, vertex) for start in self.predecessors(vertex)]
+
+    def __len__(self):
+        """
+        Return the number of nodes in the graph.
+        Returns:
+            int: The number of nodes in the graph.
+        """
+        return len(self._adjacents)
+
+
+    def order(self) -> int:
+        """
+        Return the number of nodes in the graph.
+        Returns:
             int: The number of nodes in the graph.
         """
         return len(self._adjacents)
@@ -731,22 +1819,27 @@ class AdjacencyListGraph:
         """ 
         Return a list of edges in the graph. Each edge is represented by a tuple (start, end)
         """
-        edges = []
-        for start in self._adjacents.keys():
-            for end in self.adjacents(start):
-                if start != end:  
-                    edges.append((start, end))
-        return edges
+        return list(self.iter_edges())
+
+    def iter_edges(self):
+        """ 
+        Yield the edges of the graph one at a time, in the same order as edges().
+        """
+        for start, row in self._adjacents.items():
+            for end in row:
+                if start != end:
+                    yield (start, end)
 
     def undirected_edges(self) -> list:
         """ 
         Return a list of undirected edges in the graph. Each edge is represented by a tuple (start, end)
         """
+        seen = set()
         edges = []
-        for start in self._adjacents.keys():
-            for end in self.adjacents(start):
-                if start != end and (end, start) not in edges:  
-                    edges.append((start, end))
+        for edge in self.iter_edges():
+            if (edge[1], edge[0]) not in seen:
+                seen.add(edge)
+                edges.append(edge)
         return edges
     
     def to_dict(self) -> dict:
@@ -762,6 +1855,24 @@ class AdjacencyListGraph:
             - Weighted: {vertex: {neighbor1: weight1, neighbor2: weight2, ...}}
         """
         return {key: values.copy() for key, values in self._adjacents.items()}
+
+    def freeze(self) -> 'CSRGraph':
+        """ 
+        Return an immutable CSR copy of the graph.
+
+        Returns:
+            A CSRGraph with the same vertices, edges and adjacency order.
+        """
+        return CSRGraph.from_graph(self)
+
+    def save(self, path: str):
+        """ 
+        Write the graph to a compact binary file (see CSRGraph.save()).
+
+        Args:
+            path (str): The path of the file to write.
+        """
+        self.freeze().save(path)
     
     @classmethod
     def from_dict(cls, data: dict, directed: bool = False):
@@ -781,18 +1892,66 @@ class AdjacencyListGraph:
             for end_node in neighbors:
                 graph.add_edge(start_node, end_node)
         return graph
+
+    @classmethod
+    def from_edges(cls, edges, directed: bool = False):
+        """ 
+        Create a graph from an iterable of (start, end) edges in a single pass.
+        Duplicate edges are ignored, as with add_edge().
+        
+        Args:
+            edges: An iterable of (start, end) tuples.
+            directed (bool): Whether the graph is directed.
+            
+        Returns:
+            An instance of the graph class.
+        """
+        graph = cls(directed=directed)
+        # dicts act as insertion-ordered sets so duplicate checks are O(1)
+        rows = {}
+        for start, end in edges:
+            row = rows.get(start)
+            if row is None:
+                row = rows[start] = {}
+            row[end] = None
+            if end not in rows:
+                rows[end] = {}
+            if not directed:
+                rows[end][start] = None
+        graph._adjacents = {label: list(row) for label, row in rows.items()}
+        graph._recount()
+        return graph
     
 class AdjacencyListWeightedGraph(AdjacencyListGraph):
     """ 
     A weighted adjacency list vertex implementation in Python
     (allows either directed or undirected representation)
     """
-    def __init__(self, directed=False, vertices=None):
-        #: hash table of vertices in graph
-        super().__init__(directed=directed, vertices=vertices)
-        self._adjacents = {}
+    def __init__(self, directed=False, vertices=None, reverse_index=False):
+        """ 
+        Args:
+            directed (bool): Whether the graph is directed.
+            vertices (list[str]): List of labels for each vertex.
+            reverse_index (bool): If True, maintain a map of each vertex's predecessors (see AdjacencyListGraph).
+        """
+        super().__init__(directed=directed, vertices=vertices, reverse_index=reverse_index)
         self.is_weighted = True
-        
+
+    def add_vertex(self, label: str):
+        """ 
+        Add a vertex to the graph.
+
+        Args:
+            label (str): The vertex label to add.
+            
+        Raises:
+            ValueError: If the vertex label already exists.
+        """
+        if label in self._adjacents:
+            raise ValueError(f"Vertex {label} already exists")
+
+        self._add_row(label, {})
+
     def add_edge(self, start_label: str, end_label: str, weight, directed=None):
         """ 
         Add an edge to the graph.
@@ -804,18 +1963,49 @@ class AdjacencyListWeightedGraph(AdjacencyListGraph):
             directed: Whether the edge is directed.
         """
         if start_label not in self._adjacents:
-            self._adjacents[start_label] = {}
+            self._add_row(start_label, {})
 
         if end_label not in self._adjacents:
-            self._adjacents[end_label] = {}
+            self._add_row(end_label, {})
             
-        self._adjacents[start_label][end_label] = weight
+        self._set_weight(start_label, end_label, weight)
 
         if directed is None:
             directed = self.is_directed
 
         if not directed:
-            self._adjacents[end_label][start_label] = weight
+            self._set_weight(end_label, start_label, weight)
+
+    def _set_weight(self, start_label: str, end_label: str, weight):
+        """
+        Helper method to set the weight of an edge and update the edge counters.
+        """
+        row = self._adjacents[start_label]
+        if end_label not in row:
+            self._in_degree[end_label] += 1
+            self._edge_count += 1
+            if self._predecessors is not None:
+                self._predecessors[end_label][start_label] = None
+        row[end_label] = weight
+
+    def _drop_entry(self, start_label: str, end_label: str):
+        """
+        Helper method to remove end_label from the row of start_label while deleting end_label.
+        """
+        del self._adjacents[start_label][end_label]
+        self._edge_count -= 1
+
+    def in_edges(self, vertex: str) -> list:
+        """
+        Return a list of the edges entering a given vertex. Each edge is represented by a tuple (start, end, weight)
+
+        Args:
+            vertex (str): The vertex label.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        return [(start, vertex, self._adjacents[start][vertex]) for start in self.predecessors(vertex)]
 
     def delete_edge(self, start_label: str, end_label: str, directed=None):
         """ 
@@ -834,6 +2024,7 @@ class AdjacencyListWeightedGraph(AdjacencyListGraph):
         if end_label not in self._adjacents[start_label]:
             raise KeyError(f"Vertex {end_label} does not exist") 
         del self._adjacents[start_label][end_label]
+        self._unlink(start_label, end_label)
         
         if directed is None:
             directed = self.is_directed
@@ -844,6 +2035,7 @@ class AdjacencyListWeightedGraph(AdjacencyListGraph):
             if start_label not in self._adjacents[end_label]:
                 raise KeyError(f"Vertex {start_label} does not exist") 
             del self._adjacents[end_label][start_label]
+            self._unlink(end_label, start_label)
 
     def adjacents(self, vertex: str) -> list:
         """
@@ -863,6 +2055,18 @@ class AdjacencyListWeightedGraph(AdjacencyListGraph):
         """
         return self._adjacents[vertex].items()
 
+    def iter_adjacent_items(self, vertex: str):
+        """
+        Return an iterator over the (adjacent label, weight) pairs of a given vertex, without building a list.
+
+        Args:
+            vertex: starting vertex label 
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        return iter(self._adjacents[vertex].items())
+
     def get_weight(self, start_label: str, end_label: str):
         """ 
         Get the weight of an edge.
@@ -902,24 +2106,27 @@ class AdjacencyListWeightedGraph(AdjacencyListGraph):
         """ 
         Return a list of edges in the graph. Each edge is represented by a tuple (start, end, weight)
         """
-        edges = []
-        for start in self.vertices():
-            for end in self.adjacents(start):
-                weight = self.get_weight(start, end)
-                if start != end:  
-                    edges.append((start, end, weight))
-        return edges
+        return list(self.iter_edges())
+
+    def iter_edges(self):
+        """ 
+        Yield the edges of the graph one at a time, in the same order as edges().
+        """
+        for start, row in self._adjacents.items():
+            for end, weight in row.items():
+                if start != end:
+                    yield (start, end, weight)
 
     def undirected_edges(self) -> list:
         """ 
         Return a list of undirected edges in the graph. Each edge is represented by a tuple (start, end, weight)
         """
+        seen = set()
         edges = []
-        for start in self.vertices():
-            for end in self.adjacents(start):
-                weight = self.get_weight(start, end)
-                if start != end and (end, start, weight) not in edges:  
-                    edges.append((start, end, weight))
+        for edge in self.iter_edges():
+            if (edge[1], edge[0], edge[2]) not in seen:
+                seen.add(edge)
+                edges.append(edge)
         return edges
 
     @classmethod
@@ -941,3 +2148,998 @@ class AdjacencyListWeightedGraph(AdjacencyListGraph):
                 graph.add_edge(start_node, end_node, weight)
         return graph
 
+    @classmethod
+    def from_edges(cls, edges, directed: bool = False):
+        """ 
+        Create a weighted graph from an iterable of (start, end, weight) edges in a single pass.
+        A repeated edge replaces the weight, as with add_edge().
+        
+        Args:
+            edges: An iterable of (start, end, weight) tuples.
+            directed (bool): Whether the graph is directed.
+            
+        Returns:
+            An instance of the weighted graph class.
+        """
+        graph = cls(directed=directed)
+        rows = graph._adjacents
+        for start, end, weight in edges:
+            row = rows.get(start)
+            if row is None:
+                row = rows[start] = {}
+            row[end] = weight
+            if end not in rows:
+                rows[end] = {}
+            if not directed:
+                rows[end][start] = weight
+        graph._recount()
+        return graph
+
+class CSRGraph(_GraphViews):
+    """ 
+    An immutable compressed sparse row (CSR) graph implementation
+    (allows either directed or undirected, weighted or unweighted representation).
+
+    Vertex labels are interned to integer ids. The adjacents of vertex i are
+    targets[offsets[i]:offsets[i + 1]], stored in typed arrays with their weights,
+    which uses a few bytes per edge instead of a Python object per edge.
+
+    Create it with Graph.create('csr', ...), Graph.from_edges(), from_dict() or freeze() on another graph.
+    save() and load() store it in a binary file that can be memory-mapped.
+    """
+    _MAGIC = b'DSAG'
+    _VERSION = 1
+    #: file header: magic, version, flags (1 = directed, 2 = weighted), weight typecode, byte order
+    #: (0 = little, 1 = big), vertex count, edge count, label table bytes and weight bytes
+    _HEADER = struct.Struct('<4sBBcBQQQQ')
+    def __init__(self, directed=False, weighted=False, vertices=None, edges=None):
+        """ 
+        Build the graph from vertex labels and an edge list.
+
+        Args:
+            directed (bool): Whether the graph is directed.
+            weighted (bool): Whether the graph is weighted.
+            vertices (list[str]): List of vertex labels.
+            edges (list[tuple]): Edges (start, end) for unweighted graphs or (start, end, weight) for weighted graphs.
+                Undirected edges are stored in both directions.
+
+        Raises:
+            ValueError: If there are duplicate vertex labels.
+        """
+        if vertices is None:
+            vertices = []
+        if edges is None:
+            edges = []
+
+        self.is_directed = directed
+        self.is_weighted = weighted
+
+        #: list of vertex labels (indexed by vertex id)
+        self.labels = list(vertices)
+        if len(self.labels) != len(set(self.labels)):
+            raise ValueError("Duplicate vertex labels are not allowed.")
+        #: map of vertex labels to vertex ids
+        self.label_index = {label: i for i, label in enumerate(self.labels)}
+        #: reverse CSR arrays (offsets, sources, edge positions), built on first use
+        self._reverse = None
+        #: memory-mapped file backing the arrays of a graph loaded with memory_map=True
+        self._mmap = None
+
+        starts, ends, weights = _intern_edges(edges, weighted, directed, self.labels, self.label_index)
+        self._build_sorted(starts, ends, weights)
+
+    def _build_sorted(self, starts, ends, weights):
+        """
+        Helper method to build the arrays from parallel arrays of edge endpoints with a stable counting sort.
+        Duplicate edges keep their first position and their last weight.
+        """
+        n = len(self.labels)
+        counts = [0] * (n + 1)
+        for a in starts:
+            counts[a + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+
+        position = counts[:n]
+        order = array('q', bytes(8 * len(starts)))
+        for k, a in enumerate(starts):
+            order[position[a]] = k
+            position[a] += 1
+
+        self._offsets = array('q', [0])
+        self._targets = array('i')
+        row_weights = []
+        for i in range(n):
+            row = {}
+            for k in order[counts[i]:counts[i + 1]]:
+                row[ends[k]] = weights[k] if weights is not None else None
+            self._targets.extend(row.keys())
+            row_weights.extend(row.values())
+            self._offsets.append(len(self._targets))
+        self._weights = self._typed_weights(row_weights) if self.is_weighted else None
+
+    def _build(self, rows: list):
+        """
+        Helper method to build the offset, target and weight arrays from rows of (target id, weight) pairs.
+        """
+        self._offsets = array('q', [0])
+        self._targets = array('i')
+        weights = []
+        for row in rows:
+            for target, weight in row:
+                self._targets.append(target)
+                weights.append(weight)
+            self._offsets.append(len(self._targets))
+        self._weights = self._typed_weights(weights) if self.is_weighted else None
+
+    @staticmethod
+    def _typed_weights(weights: list):
+        """
+        Helper method to store weights in a typed array ('q' for integers, 'd' for floats).
+        Weights of other types are kept in a list.
+        """
+        if all(type(w) is int for w in weights):
+            try:
+                return array('q', weights)
+            except OverflowError:
+                return weights
+        try:
+            return array('d', weights)
+        except TypeError:
+            return weights
+
+    @classmethod
+    def from_graph(cls, graph) -> 'CSRGraph':
+        """ 
+        Create a CSR graph from any graph object with vertices() and adjacents()
+        (and adjacent_items() for weighted graphs).
+
+        Args:
+            graph: The graph to copy.
+
+        Returns:
+            A CSRGraph with the same vertices, edges and adjacency order.
+        """
+        csr = cls(directed=graph.is_directed, weighted=graph.is_weighted, vertices=graph.vertices())
+        index = csr.label_index
+        if graph.is_weighted:
+            rows = [[(index[adjacent], weight) for adjacent, weight in graph.adjacent_items(label)] for label in csr.labels]
+        else:
+            rows = [[(index[adjacent], None) for adjacent in graph.adjacents(label)] for label in csr.labels]
+        csr._build(rows)
+        return csr
+
+    @classmethod
+    def from_dict(cls, data: dict, directed: bool = False, weighted: bool = False) -> 'CSRGraph':
+        """ 
+        Create a CSR graph from a dictionary representation.
+
+        Args:
+            data (dict): The dictionary representation of the graph.
+                - Unweighted: {vertex: [neighbor1, neighbor2, ...]}
+                - Weighted: {vertex: {neighbor1: weight1, neighbor2: weight2, ...}}
+            directed (bool): Whether the graph is directed.
+            weighted (bool): Whether the graph is weighted.
+
+        Returns:
+            An instance of the CSRGraph class.
+        """
+        if weighted:
+            edges = [(start, end, weight) for start, neighbors in data.items() for end, weight in neighbors.items()]
+        else:
+            edges = [(start, end) for start, neighbors in data.items() for end in neighbors]
+        return cls(directed=directed, weighted=weighted, vertices=list(data.keys()), edges=edges)
+
+    def save(self, path: str):
+        """ 
+        Write the graph to a compact binary file.
+
+        The file holds a header, the vertex labels as a JSON list, and the offsets, targets and weights arrays,
+        each aligned to 8 bytes so they can be memory-mapped by load(). Integer and float weights are stored
+        as 8-byte values; other weights are stored as JSON.
+
+        Labels must be strings, numbers, booleans, None, or tuples and frozensets of these, which load()
+        restores with their original types. Weights that are not numbers must be JSON serializable.
+
+        Args:
+            path (str): The path of the file to write.
+
+        Raises:
+            TypeError: If a label or weight cannot be stored. The file is not written.
+        """
+        labels = json.dumps([_encode_label(label) for label in self.labels]).encode()
+        if not self.is_weighted:
+            weight_code, weights = b'\0', b''
+        elif isinstance(self._weights, list):
+            weight_code, weights = b'j', json.dumps(self._weights).encode()
+        else:
+            weight_code = getattr(self._weights, 'typecode', None) or self._weights.format
+            weight_code, weights = weight_code.encode(), bytes(self._weights)
+        flags = (1 if self.is_directed else 0) | (2 if self.is_weighted else 0)
+
+        with open(path, 'wb') as f:
+            f.write(self._HEADER.pack(self._MAGIC, self._VERSION, flags, weight_code, sys.byteorder == 'big',
+                                      len(self.labels), len(self._targets), len(labels), len(weights)))
+            f.write(labels)
+            f.write(bytes(-len(labels) % 8))
+            f.write(bytes(self._offsets))
+            f.write(bytes(self._targets))
+            f.write(bytes(-4 * len(self._targets) % 8))
+            f.write(weights)
+
+    @classmethod
+    def load(cls, path: str, memory_map: bool=False) -> 'CSRGraph':
+        """ 
+        Load a graph written by save().
+
+        Args:
+            path (str): The path of the graph file.
+            memory_map (bool): If True, the offsets, targets and weights are read-only views of a
+                memory-mapped file, so loading takes time proportional to the label table only.
+                Call close() (or use the graph as a context manager) to unmap the file.
+
+        Returns:
+            An instance of the CSRGraph class.
+
+        Raises:
+            ValueError: If the file is not a graph file or was written on a machine with a different byte order.
+        """
+        with open(path, 'rb') as f:
+            if memory_map:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                buffer = f.read()
+        view = memoryview(buffer)
+
+        if len(view) < cls._HEADER.size:
+            raise ValueError(f"{path} is not a graph file")
+        magic, version, flags, weight_code, big_endian, n, m, label_size, weight_size = cls._HEADER.unpack_from(view)
+        if magic != cls._MAGIC or version != cls._VERSION:
+            raise ValueError(f"{path} is not a graph file")
+        if big_endian != (sys.byteorder == 'big'):
+            raise ValueError(f"{path} was written with a different byte order")
+
+        def section(start: int, size: int, typecode: str):
+            part = view[start:start + size]
+            if memory_map:
+                return part.cast(typecode)
+            values = array(typecode)
+            values.frombytes(part)
+            return values
+
+        position = cls._HEADER.size
+        labels = json.loads(bytes(view[position:position + label_size]), object_hook=_decode_label)
+        position += label_size + (-label_size % 8)
+        offsets = section(position, 8 * (n + 1), 'q')
+        position += 8 * (n + 1)
+        targets = section(position, 4 * m, 'i')
+        position += 4 * m + (-4 * m % 8)
+        weight_code = weight_code.decode()
+        if weight_code == '\0':
+            weights = None
+        elif weight_code == 'j':
+            weights = json.loads(bytes(view[position:position + weight_size]))
+        else:
+            weights = section(position, weight_size, weight_code)
+
+        graph = cls(directed=bool(flags & 1), weighted=bool(flags & 2))
+        graph.labels = labels
+        graph.label_index = {label: i for i, label in enumerate(labels)}
+        graph._offsets = offsets
+        graph._targets = targets
+        graph._weights = weights
+        if memory_map:
+            view.release()
+            graph._mmap = buffer
+        return graph
+
+    def close(self):
+        """
+        Unmap the file of a graph loaded with memory_map=True. The graph cannot be used afterwards.
+        Does nothing for a graph held in memory.
+        """
+        if self._mmap is None:
+            return
+        for values in (self._offsets, self._targets, self._weights):
+            if isinstance(values, memoryview):
+                values.release()
+        self._mmap.close()
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def csr_arrays(self) -> tuple:
+        """ 
+        Return the integer-indexed arrays of the graph.
+
+        Returns:
+            A tuple (offsets, targets, weights). weights is None for unweighted graphs.
+        """
+        return self._offsets, self._targets, self._weights
+
+    def index_of(self, label: str) -> int:
+        """ 
+        Return the integer id of a vertex.
+
+        Args:
+            label (str): The vertex label.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        return self.label_index[label]
+
+    def vertices(self) -> list:
+        """
+        Return a list of vertex labels of the graph
+        """
+        return list(self.labels)
+
+    def adjacents(self, vertex: str) -> list:
+        """
+        Return a list of adjacents of a given vertex
+
+        Args:
+            vertex (str): The label of the vertex.
+        """
+        i = self.label_index[vertex]
+        labels = self.labels
+        return [labels[t] for t in self._targets[self._offsets[i]:self._offsets[i + 1]]]
+
+    def iter_adjacents(self, vertex: str):
+        """
+        Return an iterator over the adjacents of a given vertex, without building a list.
+
+        Args:
+            vertex (str): The label of the vertex.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        i = self.label_index[vertex]
+        labels = self.labels
+        targets = self._targets
+        return (labels[targets[k]] for k in range(self._offsets[i], self._offsets[i + 1]))
+
+    def adjacent_items(self, vertex: str) -> list:
+        """
+        Return a list of adjacents and weights of a given vertex (adjacent label, weight) pair.
+
+        Args:
+            vertex (str): The label of the vertex.
+
+        Raises:
+            TypeError: If the graph is unweighted.
+        """
+        if not self.is_weighted:
+            raise TypeError("adjacent_items() requires a weighted graph")
+        return list(self.iter_adjacent_items(vertex))
+
+    def iter_adjacent_items(self, vertex: str):
+        """
+        Return an iterator over the (adjacent label, weight) pairs of a given vertex, without building a list.
+
+        Args:
+            vertex (str): The label of the vertex.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+            TypeError: If the graph is unweighted.
+        """
+        if not self.is_weighted:
+            raise TypeError("adjacent_items() requires a weighted graph")
+        i = self.label_index[vertex]
+        labels = self.labels
+        targets = self._targets
+        weights = self._weights
+        return ((labels[targets[k]], weights[k]) for k in range(self._offsets[i], self._offsets[i + 1]))
+
+    def __getitem__(self, vertex: str):
+        """ 
+        Args:
+            vertex (str): The vertex label.
+        Returns:
+            A list of adjacent vertex labels (unweighted) or a dictionary of adjacent vertex labels and weights (weighted).
+        """
+        if self.is_weighted:
+            return dict(self.adjacent_items(vertex))
+        return self.adjacents(vertex)
+
+    def _edge_position(self, start_label: str, end_label: str) -> int:
+        """
+        Helper method to return the position of an edge in the target array, or -1 if it does not exist.
+        """
+        if start_label not in self.label_index:
+            raise KeyError(f"Vertex {start_label} does not exist")
+        if end_label not in self.label_index:
+            raise KeyError(f"Vertex {end_label} does not exist")
+        i = self.label_index[start_label]
+        j = self.label_index[end_label]
+        for k in range(self._offsets[i], self._offsets[i + 1]):
+            if self._targets[k] == j:
+                return k
+        return -1
+
+    def has_vertex(self, label: str) -> bool:
+        """ 
+        Return boolean if a vertex exists
+
+        Args:
+            label (str): The vertex label.
+        Returns:
+            A boolean of whether the vertex exists in the graph.
+        """
+        return label in self.label_index
+
+    def has_edge(self, start_label: str, end_label: str) -> bool:
+        """ 
+        Return boolean if an edge exists
+
+        Args:
+            start_label (str): The starting vertex label.
+            end_label (str): The ending vertex label.
+
+        Returns:
+            A boolean of whether there is an edge from start to end
+
+        Raises:
+            KeyError: If either vertex does not exist.
+        """
+        return self._edge_position(start_label, end_label) >= 0
+
+    def get_weight(self, start_label: str, end_label: str):
+        """ 
+        Get the weight of an edge.
+
+        Args:
+            start_label: The starting vertex label. 
+            end_label: The ending vertex label. 
+
+        Returns:
+            The weight of the edge from start to end.
+
+        Raises:
+            KeyError: If the edge does not exist.
+            TypeError: If the graph is unweighted.
+        """
+        if not self.is_weighted:
+            raise TypeError("get_weight() requires a weighted graph")
+        k = self._edge_position(start_label, end_label)
+        if k < 0:
+            raise KeyError(f"Edge {start_label} to {end_label} does not exist")
+        return self._weights[k]
+
+    def __contains__(self, label: str) -> bool:
+        """ 
+        Args:
+            label (str): The vertex label.
+        Returns:
+            A boolean indicating if the vertex is in the graph.
+        """
+        return label in self.label_index
+
+    def order(self) -> int:
+        """
+        Return the number of nodes in the graph.
+        Returns:
+            int: The number of nodes in the graph.
+        """
+        return len(self.labels)
+
+    def __len__(self):
+        """
+        Return the number of nodes in the graph.
+        """
+        return len(self.labels)
+
+    def size(self) -> int:
+        """
+        Return the number of edges in the graph.
+        Returns:
+            int: The number of edges in the graph.
+        """
+        if self.is_directed:
+            return len(self._targets)
+        return len(self._targets) // 2
+
+    def out_degree(self, vertex: str) -> int:
+        """
+        Return the number of edges leaving a vertex in O(1).
+
+        Args:
+            vertex (str): The vertex label.
+        """
+        i = self.label_index[vertex]
+        return self._offsets[i + 1] - self._offsets[i]
+
+    def in_degree(self, vertex: str) -> int:
+        """
+        Return the number of edges entering a vertex. The reverse arrays are
+        built in O(V + E) on the first call; later calls are O(1).
+
+        Args:
+            vertex (str): The vertex label.
+        """
+        j = self.label_index[vertex]
+        offsets = self.reverse_arrays()[0]
+        return offsets[j + 1] - offsets[j]
+
+    def reverse_arrays(self) -> tuple:
+        """
+        Return the reverse (incoming edge) CSR arrays, building them on the first call in O(V + E).
+        The sources of the edges into vertex j are sources[offsets[j]:offsets[j + 1]], and
+        positions gives the index of each of those edges in the forward targets (and weights) array.
+
+        Returns:
+            A tuple (offsets, sources, positions).
+        """
+        if self._reverse is None:
+            n = len(self.labels)
+            offsets = array('q', bytes(8 * (n + 1)))
+            for j in self._targets:
+                offsets[j + 1] += 1
+            for j in range(n):
+                offsets[j + 1] += offsets[j]
+            fill = array('q', offsets)
+            sources = array('i', bytes(4 * len(self._targets)))
+            positions = array('q', bytes(8 * len(self._targets)))
+            for i in range(n):
+                for k in range(self._offsets[i], self._offsets[i + 1]):
+                    j = self._targets[k]
+                    sources[fill[j]] = i
+                    positions[fill[j]] = k
+                    fill[j] += 1
+            self._reverse = (offsets, sources, positions)
+        return self._reverse
+
+    def predecessors(self, vertex: str) -> list:
+        """
+        Return a list of the vertices with an edge to a given vertex in O(in-degree),
+        in vertex id order (the reverse arrays are built on the first call).
+
+        Args:
+            vertex (str): The vertex label.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        j = self.label_index[vertex]
+        offsets, sources, _ = self.reverse_arrays()
+        labels = self.labels
+        return [labels[i] for i in sources[offsets[j]:offsets[j + 1]]]
+
+    def in_edges(self, vertex: str) -> list:
+        """
+        Return a list of the edges entering a given vertex.
+        Each edge is represented by a tuple (start, end), or (start, end, weight) for weighted graphs.
+
+        Args:
+            vertex (str): The vertex label.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        j = self.label_index[vertex]
+        offsets, sources, positions = self.reverse_arrays()
+        labels = self.labels
+        if self.is_weighted:
+            return [(labels[sources[k]], vertex, self._weights[positions[k]]) for k in range(offsets[j], offsets[j + 1])]
+        return [(labels[i], vertex) for i in sources[offsets[j]:offsets[j + 1]]]
+
+    def degree(self, vertex: str) -> int:
+        """
+        Return the degree of a vertex: the number of adjacents for an undirected graph,
+        in-degree plus out-degree for a directed graph.
+
+        Args:
+            vertex (str): The vertex label.
+        """
+        if self.is_directed:
+            return self.in_degree(vertex) + self.out_degree(vertex)
+        return self.out_degree(vertex)
+
+    def edges(self) -> list:
+        """ 
+        Return a list of edges in the graph. Each edge is represented by a tuple (start, end) or (start, end, weight).
+        """
+        return list(self.iter_edges())
+
+    def iter_edges(self):
+        """ 
+        Yield the edges of the graph one at a time, in the same order as edges().
+        """
+        labels = self.labels
+        targets = self._targets
+        for i in range(len(labels)):
+            for k in range(self._offsets[i], self._offsets[i + 1]):
+                j = targets[k]
+                if i != j:
+                    if self.is_weighted:
+                        yield (labels[i], labels[j], self._weights[k])
+                    else:
+                        yield (labels[i], labels[j])
+
+    def undirected_edges(self) -> list:
+        """ 
+        Return a list of undirected edges in the graph. Each edge is represented by a tuple (start, end) or (start, end, weight).
+        """
+        seen = set()
+        edges = []
+        for edge in self.iter_edges():
+            if (edge[1], edge[0]) not in seen:
+                seen.add((edge[0], edge[1]))
+                edges.append(edge)
+        return edges
+
+    def to_dict(self) -> dict:
+        """ 
+        Return the graph as a dictionary.
+
+        Returns:
+            A dictionary representing the adjacency list of the graph.
+            - Unweighted: {vertex: [neighbor1, neighbor2, ...]}
+            - Weighted: {vertex: {neighbor1: weight1, neighbor2: weight2, ...}}
+        """
+        return {label: self[label] for label in self.labels}
+
+    def print_graph(self):
+        """ 
+        Print the contents of the graph.
+        """
+        for label in self.labels:
+            print(f"{label}: {self[label]}")
+
+def _graph_type(graph) -> str:
+    """
+    Helper function to return the Graph factory type name of a graph (or of the graph under a view).
+    """
+    if isinstance(graph, GraphView):
+        return _graph_type(graph.graph)
+    if isinstance(graph, CSRGraph):
+        return 'csr'
+    if isinstance(graph, AdjacencyBitMatrixGraph):
+        return 'bit_matrix'
+    if isinstance(graph, AdjacencyMatrixGraph):
+        return 'adjacency_matrix'
+    return 'adjacency_list'
+
+class GraphView(_GraphViews):
+    """ 
+    A read-only view of another graph. Adjacency is computed lazily from the parent graph on
+    every call, so creating a view is cheap and later changes to the parent are visible through it.
+
+    Views have the same read methods as the graph classes and can be passed to the traversal,
+    Dijkstra and Prim functions. Use materialize() to copy a view into a new graph.
+    """
+    def __init__(self, graph):
+        """ 
+        Args:
+            graph: The parent graph (or another view).
+        """
+        #: the parent graph
+        self.graph = graph
+        self.is_directed = graph.is_directed
+        self.is_weighted = graph.is_weighted
+
+    def _keep_edge(self, start_label: str, end_label: str, weight) -> bool:
+        """
+        Helper method to decide whether an edge of the parent graph is part of the view.
+        """
+        return True
+
+    def has_vertex(self, label: str) -> bool:
+        """ 
+        Return boolean if a vertex exists
+
+        Args:
+            label (str): The vertex label.
+        """
+        return self.graph.has_vertex(label)
+
+    def __contains__(self, label: str) -> bool:
+        """ 
+        Args:
+            label (str): The vertex label.
+        Returns:
+            A boolean indicating if the vertex is in the view.
+        """
+        return self.has_vertex(label)
+
+    def vertices(self) -> list:
+        """
+        Return a list of vertex labels of the view
+        """
+        return self.graph.vertices()
+
+    def iter_adjacents(self, vertex: str):
+        """
+        Return an iterator over the adjacents of a given vertex.
+
+        Args:
+            vertex (str): The label of the vertex.
+
+        Raises:
+            KeyError: If the vertex is not in the view.
+        """
+        if not self.has_vertex(vertex):
+            raise KeyError(f"Vertex {vertex} does not exist")
+        if self.is_weighted:
+            return (end for end, weight in self.graph.iter_adjacent_items(vertex) if self._keep_edge(vertex, end, weight))
+        return (end for end in self.graph.iter_adjacents(vertex) if self._keep_edge(vertex, end, None))
+
+    def adjacents(self, vertex: str) -> list:
+        """
+        Return a list of adjacents of a given vertex
+
+        Args:
+            vertex (str): The label of the vertex.
+        """
+        return list(self.iter_adjacents(vertex))
+
+    def iter_adjacent_items(self, vertex: str):
+        """
+        Return an iterator over the (adjacent label, weight) pairs of a given vertex.
+
+        Args:
+            vertex (str): The label of the vertex.
+
+        Raises:
+            KeyError: If the vertex is not in the view.
+            TypeError: If the graph is unweighted.
+        """
+        if not self.is_weighted:
+            raise TypeError("adjacent_items() requires a weighted graph")
+        if not self.has_vertex(vertex):
+            raise KeyError(f"Vertex {vertex} does not exist")
+        return ((end, weight) for end, weight in self.graph.iter_adjacent_items(vertex) if self._keep_edge(vertex, end, weight))
+
+    def adjacent_items(self, vertex: str) -> list:
+        """
+        Return a list of adjacents and weights of a given vertex (adjacent label, weight) pair.
+
+        Args:
+            vertex (str): The label of the vertex.
+        """
+        return list(self.iter_adjacent_items(vertex))
+
+    def __getitem__(self, vertex: str):
+        """ 
+        Args:
+            vertex (str): The vertex label.
+        Returns:
+            A list of adjacent vertex labels, or a dictionary of adjacent labels and weights for weighted graphs.
+        """
+        if self.is_weighted:
+            return dict(self.iter_adjacent_items(vertex))
+        return self.adjacents(vertex)
+
+    def has_edge(self, start_label: str, end_label: str) -> bool:
+        """ 
+        Return boolean if an edge exists in the view.
+
+        Args:
+            start_label (str): The starting vertex label.
+            end_label (str): The ending vertex label.
+
+        Raises:
+            KeyError: If either vertex is not in the view.
+        """
+        if not self.has_vertex(start_label):
+            raise KeyError(f"Vertex {start_label} does not exist")
+        if not self.has_vertex(end_label):
+            raise KeyError(f"Vertex {end_label} does not exist")
+        if not self.graph.has_edge(start_label, end_label):
+            return False
+        weight = self.graph.get_weight(start_label, end_label) if self.is_weighted else None
+        return self._keep_edge(start_label, end_label, weight)
+
+    def get_weight(self, start_label: str, end_label: str):
+        """ 
+        Get the weight of an edge.
+
+        Args:
+            start_label: The starting vertex label. 
+            end_label: The ending vertex label. 
+
+        Raises:
+            KeyError: If the edge is not in the view.
+        """
+        if not self.has_edge(start_label, end_label):
+            raise KeyError(f"Edge {start_label} to {end_label} does not exist")
+        return self.graph.get_weight(start_label, end_label)
+
+    def predecessors(self, vertex: str) -> list:
+        """
+        Return a list of the vertices with an edge to a given vertex in the view.
+        The predecessors of the parent graph are filtered, so this costs what the parent's predecessors() costs
+        plus one edge check per predecessor.
+
+        Args:
+            vertex (str): The vertex label.
+
+        Raises:
+            KeyError: If the vertex is not in the view.
+        """
+        return [edge[0] for edge in self.in_edges(vertex)]
+
+    def in_edges(self, vertex: str) -> list:
+        """
+        Return a list of the edges entering a given vertex in the view.
+        Each edge is represented by a tuple (start, end), or (start, end, weight) for weighted graphs.
+
+        Args:
+            vertex (str): The vertex label.
+
+        Raises:
+            KeyError: If the vertex is not in the view.
+        """
+        if not self.has_vertex(vertex):
+            raise KeyError(f"Vertex {vertex} does not exist")
+        edges = []
+        for edge in self.graph.in_edges(vertex):
+            start = edge[0]
+            weight = edge[2] if self.is_weighted else None
+            if self.has_vertex(start) and self._keep_edge(start, vertex, weight):
+                edges.append(edge)
+        return edges
+
+    def iter_edges(self):
+        """ 
+        Yield the edges of the view one at a time. Each edge is represented by a tuple (start, end) or (start, end, weight).
+        """
+        for start in self.vertices():
+            if self.is_weighted:
+                for end, weight in self.iter_adjacent_items(start):
+                    if start != end:
+                        yield (start, end, weight)
+            else:
+                for end in self.iter_adjacents(start):
+                    if start != end:
+                        yield (start, end)
+
+    def edges(self) -> list:
+        """ 
+        Return a list of edges in the view.
+        """
+        return list(self.iter_edges())
+
+    def order(self) -> int:
+        """
+        Return the number of nodes in the view.
+        """
+        return len(self.vertices())
+
+    def __len__(self):
+        """
+        Return the number of nodes in the view.
+        """
+        return self.order()
+
+    def size(self) -> int:
+        """
+        Return the number of edges in the view (computed by walking it).
+        For undirected graphs an edge counts once, even if the view keeps only one of its directions.
+        """
+        if self.is_directed:
+            return sum(1 for start in self.vertices() for _ in self.iter_adjacents(start))
+        position = {label: i for i, label in enumerate(self.vertices())}
+        pairs = set()
+        for start, i in position.items():
+            for end in self.iter_adjacents(start):
+                j = position[end]
+                pairs.add((i, j) if i <= j else (j, i))
+        return len(pairs)
+
+    def to_dict(self) -> dict:
+        """ 
+        Return the view as a dictionary.
+
+        Returns:
+            - Unweighted: {vertex: [neighbor1, neighbor2, ...]}
+            - Weighted: {vertex: {neighbor1: weight1, neighbor2: weight2, ...}}
+        """
+        return {label: self[label] for label in self.vertices()}
+
+    def freeze(self) -> CSRGraph:
+        """ 
+        Return an immutable CSR copy of the view.
+        """
+        return CSRGraph.from_graph(self)
+
+    def materialize(self, graph_type: str=None) -> object:
+        """ 
+        Copy the view into a new graph.
+
+        Args:
+            graph_type (str): The type of graph to create (default is the type of the underlying graph).
+
+        Returns:
+            A new graph object with the vertices and edges of the view.
+        """
+        if graph_type is None:
+            graph_type = _graph_type(self)
+        if graph_type == 'csr':
+            return self.freeze()
+        graph = Graph.create(graph_type, directed=self.is_directed, weighted=self.is_weighted)
+        # add every vertex first, so vertices without edges are kept
+        for label in self.vertices():
+            graph.add_vertex(label)
+        for label in self.vertices():
+            if self.is_weighted:
+                for end, weight in self.iter_adjacent_items(label):
+                    graph.add_edge(label, end, weight)
+            else:
+                for end in self.iter_adjacents(label):
+                    graph.add_edge(label, end)
+        return graph
+
+class SubgraphView(GraphView):
+    """ 
+    A read-only view of the subgraph induced by a set of vertices: the vertices and
+    every edge of the parent graph between two of them.
+    """
+    def __init__(self, graph, vertices):
+        """ 
+        Args:
+            graph: The parent graph (or another view).
+            vertices: An iterable of vertex labels, or a predicate function called with each vertex label.
+
+        Raises:
+            KeyError: If a vertex is not in the parent graph.
+        """
+        super().__init__(graph)
+        if callable(vertices):
+            vertices = [label for label in graph.vertices() if vertices(label)]
+        self._vertices = set()
+        for label in vertices:
+            if not graph.has_vertex(label):
+                raise KeyError(f"Vertex {label} does not exist")
+            self._vertices.add(label)
+
+    def _keep_edge(self, start_label: str, end_label: str, weight) -> bool:
+        return end_label in self._vertices
+
+    def has_vertex(self, label: str) -> bool:
+        """ 
+        Return boolean if a vertex is in the subgraph (and still in the parent graph)
+
+        Args:
+            label (str): The vertex label.
+        """
+        return label in self._vertices and self.graph.has_vertex(label)
+
+    def vertices(self) -> list:
+        """
+        Return a list of vertex labels of the subgraph, in the order of the parent graph
+        """
+        return [label for label in self.graph.vertices() if label in self._vertices]
+
+    def order(self) -> int:
+        """
+        Return the number of nodes in the subgraph. Members deleted from the parent graph are not counted.
+        """
+        return sum(1 for label in self._vertices if self.graph.has_vertex(label))
+
+class EdgeFilteredView(GraphView):
+    """ 
+    A read-only view with all vertices of the parent graph and only the edges accepted by a predicate.
+    """
+    def __init__(self, graph, predicate):
+        """ 
+        Args:
+            graph: The parent graph (or another view).
+            predicate: A function called as predicate(start, end) for unweighted graphs or
+                predicate(start, end, weight) for weighted graphs, returning True to keep the edge.
+                For undirected graphs it is applied to each direction of an edge.
+        """
+        super().__init__(graph)
+        self._predicate = predicate
+
+    def _keep_edge(self, start_label: str, end_label: str, weight) -> bool:
+        if self.is_weighted:
+            return self._predicate(start_label, end_label, weight)
+        return self._predicate(start_label, end_label)
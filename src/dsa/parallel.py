@@ -0,0 +1,129 @@
+""" Module to run many independent graph searches in parallel across processes. """
+from array import array
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import contextmanager
+import os
+import shutil
+import tempfile
+
+from dsa.graph import CSRGraph
+from dsa.graph_traversal import _bfs_ids
+
+@contextmanager
+def _worker_pool(graph: CSRGraph, workers: int, initializer):
+    """
+    Helper context manager that saves a CSR graph once to a temporary file and yields a ProcessPoolExecutor
+    whose workers call initializer(path) to attach it. On exit the pool is shut down (cancelling queued tasks)
+    and the file is removed.
+    """
+    directory = tempfile.mkdtemp(prefix='dsa-')
+    try:
+        path = os.path.join(directory, 'graph.bin')
+        graph.save(path)
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=initializer, initargs=(path,))
+        try:
+            yield executor
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+#: the graph attached by a worker process
+_worker_graph = None
+
+def _attach(path: str):
+    """
+    Helper function to memory-map the shared graph file once in each worker process.
+    """
+    global _worker_graph
+    _worker_graph = CSRGraph.load(path, memory_map=True)
+
+def _bfs_batch(sources: list, graph=None) -> list:
+    """
+    Helper function to run a breadth-first search from each source id of a batch.
+    Worker processes use the graph attached by _attach().
+
+    Returns:
+        A list of (source id, order, levels) tuples of typed arrays: vertex ids in BFS order and the level of each.
+    """
+    if graph is None:
+        graph = _worker_graph
+    offsets, targets, _ = graph.csr_arrays()
+    distance = [-1] * len(graph.labels)
+    parent = [-1] * len(graph.labels)
+    queue = []
+    results = []
+    for source in sources:
+        _bfs_ids(offsets, targets, source, distance, parent, queue)
+        results.append((source, array('i', queue), array('i', [distance[j] for j in queue])))
+        for j in queue:
+            distance[j] = -1
+    return results
+
+def parallel_bfs(graph, sources=None, workers: int=None, batch_size: int=16, distances: bool=False):
+    """
+    Run a breadth-first search from each source vertex, spreading batches of sources across worker processes.
+
+    The graph is frozen to CSR form and saved once to a temporary file which every worker memory-maps,
+    so the graph is shared through the page cache and never pickled per task. Results are yielded
+    as each batch completes, so they arrive in completion order rather than source order.
+
+    The file holds the vertex labels too, so with more than 1 worker the labels must be ones CSRGraph.save()
+    can store: strings, numbers, booleans, None, or tuples and frozensets of these.
+
+    Each search is pure Python, so any speedup is bounded by the number of physical cores; on a single core
+    extra workers only add pool overhead. Only unweighted searches are fanned out: distances are hop counts,
+    not weighted shortest-path distances.
+
+    Args:
+        graph: The graph to search (any graph class; it is frozen to a CSRGraph).
+        sources: An iterable of source vertex labels (default is every vertex).
+        workers (int): The number of worker processes (default is os.cpu_count()). With 1 worker the
+            searches run in this process.
+        batch_size (int): The number of sources sent to a worker at a time.
+        distances (bool): If True, yield hop distances instead of the visit order.
+
+    Yields:
+        (source, result) pairs. result is a list of vertex labels in the same order as graph_traversal.bfs(),
+        or a dictionary {vertex: distance} of the reachable vertices if distances is True.
+
+    Raises:
+        KeyError: If a source vertex does not exist.
+        TypeError: If workers is more than 1 and a vertex label cannot be saved.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = graph.freeze()
+    if sources is None:
+        sources = graph.vertices()
+    source_ids = [graph.index_of(source) for source in sources]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    batches = [source_ids[i:i + batch_size] for i in range(0, len(source_ids), batch_size)]
+    labels = graph.labels
+
+    def results(batch_results):
+        for source, order, levels in batch_results:
+            if distances:
+                yield labels[source], {labels[j]: level for j, level in zip(order, levels)}
+            else:
+                yield labels[source], [labels[j] for j in order]
+
+    if workers <= 1:
+        for batch in batches:
+            yield from results(_bfs_batch(batch, graph))
+        return
+
+    with _worker_pool(graph, workers, _attach) as executor:
+        pending = set()
+        remaining = iter(batches)
+        while True:
+            # keep a bounded number of batches in flight
+            for batch in remaining:
+                pending.add(executor.submit(_bfs_batch, batch))
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from results(future.result())
@@ -1,5 +1,5 @@
 """ Module to access functions for Prim's Algorithm. """
-from dsa.graph import AdjacencyListWeightedGraph
+from dsa.graph import AdjacencyListWeightedGraph, _iter_adjacent_items
 from dsa.heap import PriorityQueue
     
 def prims_mst(graph, start: str, mst_graph=None) -> AdjacencyListWeightedGraph:
@@ -18,7 +18,7 @@ def prims_mst(graph, start: str, mst_graph=None) -> AdjacencyListWeightedGraph:
     def add_adjacent(graph, pq: PriorityQueue, visited: set, node: str):
         """Add all adjacent vertices from the given node to the priority queue."""
         visited.add(node)
-        for adjacent, weight in graph[node].items():
+        for adjacent, weight in adjacent_items(node):
             if adjacent not in visited:
                 pq.push(weight, (node, adjacent))  # Push edge with weight as priority
 
@@ -29,6 +29,7 @@ def prims_mst(graph, start: str, mst_graph=None) -> AdjacencyListWeightedGraph:
     visited = set()
     pq = PriorityQueue()
     total_vertices = len(set(graph.vertices()))
+    adjacent_items = _iter_adjacent_items(graph)
 
     add_adjacent(graph, pq, visited, start)
 
@@ -38,7 +39,7 @@ def prims_mst(graph, start: str, mst_graph=None) -> AdjacencyListWeightedGraph:
         start, end = edge
         # If the end vertex has not been visited, add edge to the MST
         if end not in visited:
-            mst_graph.add_edge(start, end, graph[start][end])
+            mst_graph.add_edge(start, end, weight)
             # add adjacent vertices to the priority queue and mark the end vertex as visited
             add_adjacent(graph, pq, visited, end)
     return mst_graph
@@ -55,9 +56,11 @@ def mst_weight(graph) -> int:
     """
     total_weight = 0
     visited = set()
-    for start, end, weight in graph.edges():
-        if (start, end) not in visited:
-            total_weight += weight
-            visited.add((start, end))
-            visited.add((end, start))
+    adjacent_items = _iter_adjacent_items(graph)
+    for start in graph.vertices():
+        for end, weight in adjacent_items(start):
+            if (start, end) not in visited:
+                total_weight += weight
+                visited.add((start, end))
+                visited.add((end, start))
     return total_weight
\ No newline at end of file
@@ -0,0 +1,345 @@
+""" Module to sample random walks and neighborhoods from a graph. """
+import heapq
+import random
+
+from dsa.graph import CSRGraph
+from dsa.parallel import _worker_pool
+
+def alias_table(weights) -> tuple:
+    """
+    Build a Walker/Vose alias table to draw indexes in proportion to their weights in O(1) per draw.
+
+    Args:
+        weights: A sequence of non-negative numbers, at least one of them positive.
+
+    Returns:
+        A tuple (probability, alias) of lists to pass to alias_draw().
+
+    Raises:
+        ValueError: If a weight is negative or all weights are zero.
+    """
+    n = len(weights)
+    total = sum(weights)
+    if any(weight < 0 for weight in weights) or total <= 0:
+        raise ValueError("Weights must be non-negative with a positive sum")
+
+    scaled = [weight * n / total for weight in weights]
+    probability = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1]
+    large = [i for i, p in enumerate(scaled) if p >= 1]
+    while small and large:
+        small_i, large_i = small.pop(), large.pop()
+        probability[small_i] = scaled[small_i]
+        alias[small_i] = large_i
+        scaled[large_i] += scaled[small_i] - 1
+        (small if scaled[large_i] < 1 else large).append(large_i)
+    # whatever remains is 1 up to rounding
+    return probability, alias
+
+def alias_draw(probability: list, alias: list, rng: random.Random) -> int:
+    """
+    Draw an index from an alias table built by alias_table().
+
+    Args:
+        probability (list): The probability list of the table.
+        alias (list): The alias list of the table.
+        rng (random.Random): The random number generator.
+
+    Returns:
+        The index drawn.
+    """
+    u = rng.random() * len(probability)
+    i = int(u)
+    return i if u - i < probability[i] else alias[i]
+
+#: the sampler built by a worker process
+_worker_sampler = None
+
+def _attach(path: str):
+    """
+    Helper function to memory-map the shared graph file and build its sampler once in each worker process.
+    """
+    global _worker_sampler
+    _worker_sampler = Sampler(CSRGraph.load(path, memory_map=True))
+
+def _walk_batch(kind: str, starts: list, length: int, p: float, q: float, seed: int, sampler=None) -> list:
+    """
+    Helper function to generate the walks of one batch with its own seeded generator.
+    Worker processes use the sampler built by _attach().
+
+    Returns:
+        A list of walks, each a list of vertex ids.
+    """
+    if sampler is None:
+        sampler = _worker_sampler
+    rng = random.Random(seed)
+    if kind == 'node2vec':
+        return [sampler._node2vec_ids(start, length, p, q, rng) for start in starts]
+    return [sampler._walk_ids(start, length, rng) for start in starts]
+
+class Sampler:
+    """
+    Random walk and neighborhood sampler over a graph.
+
+    The graph is frozen to CSR form once and its adjacency is kept as one list of vertex ids per vertex.
+    For weighted graphs an alias table is built per vertex, so each weighted step costs O(1) instead of
+    a scan over the adjacent weights. All sampling uses a random.Random seeded from seed, so the same
+    seed gives the same samples, with or without worker processes.
+    """
+    def __init__(self, graph, seed=None):
+        """
+        Args:
+            graph: The graph to sample (any graph class; it is frozen to a CSRGraph). Weights must be
+                non-negative numbers.
+            seed: The seed of the random number generator (default is unpredictable).
+
+        Raises:
+            ValueError: If a weight is negative or all the edge weights out of a vertex are zero.
+        """
+        if not hasattr(graph, 'csr_arrays'):
+            graph = graph.freeze()
+        self.graph = graph
+        self.labels = graph.labels
+        offsets, targets, weights = graph.csr_arrays()
+        targets = list(targets)
+        self._rows = [targets[offsets[i]:offsets[i + 1]] for i in range(len(self.labels))]
+        self._alias = None
+        if weights is not None:
+            weights = list(weights)
+            self._alias = [alias_table(weights[offsets[i]:offsets[i + 1]]) if offsets[i + 1] > offsets[i] else None
+                           for i in range(len(self.labels))]
+        # adjacency sets for node2vec, built on first use
+        self._sets = None
+        self._rng = random.Random(seed)
+
+    def _adjacency_sets(self) -> list:
+        """
+        Helper function that returns the adjacent ids of each vertex as a set, built on first use.
+        """
+        if self._sets is None:
+            self._sets = [set(row) for row in self._rows]
+        return self._sets
+
+    def _step(self, current: int, rng: random.Random) -> int:
+        """
+        Helper function that draws the next vertex id of a first-order walk, or returns -1 at a dead end.
+        """
+        row = self._rows[current]
+        if not row:
+            return -1
+        if self._alias is None:
+            return row[int(rng.random() * len(row))]
+        probability, alias = self._alias[current]
+        return row[alias_draw(probability, alias, rng)]
+
+    def _walk_ids(self, start: int, length: int, rng: random.Random) -> list:
+        """
+        Helper function for one first-order random walk over vertex ids.
+        """
+        # the step of _step() is inlined here, since walks spend nearly all their time in this loop
+        rows = self._rows
+        draw = rng.random
+        walk = [start]
+        current = start
+        if self._alias is None:
+            for _ in range(length - 1):
+                row = rows[current]
+                if not row:
+                    break
+                current = row[int(draw() * len(row))]
+                walk.append(current)
+        else:
+            tables = self._alias
+            for _ in range(length - 1):
+                row = rows[current]
+                if not row:
+                    break
+                probability, alias = tables[current]
+                u = draw() * len(row)
+                i = int(u)
+                current = row[i if u - i < probability[i] else alias[i]]
+                walk.append(current)
+        return walk
+
+    def _node2vec_ids(self, start: int, length: int, p: float, q: float, rng: random.Random) -> list:
+        """
+        Helper function for one node2vec walk over vertex ids.
+
+        Second-order steps use rejection sampling: a candidate is drawn from the first-order distribution
+        and accepted with probability bias / max(1/p, 1, 1/q), so no per-edge-pair tables are needed.
+        """
+        walk = [start]
+        if length < 2:
+            return walk
+        current = self._step(start, rng)
+        if current < 0:
+            return walk
+        walk.append(current)
+        sets = self._adjacency_sets()
+        upper = max(1 / p, 1.0, 1 / q)
+        previous = start
+        while len(walk) < length:
+            if not self._rows[current]:
+                break
+            while True:
+                candidate = self._step(current, rng)
+                if candidate == previous:
+                    bias = 1 / p
+                elif candidate in sets[previous]:
+                    bias = 1.0
+                else:
+                    bias = 1 / q
+                if rng.random() * upper < bias:
+                    break
+            previous, current = current, candidate
+            walk.append(current)
+        return walk
+
+    def _start_ids(self, starts, walks_per_vertex: int) -> list:
+        """
+        Helper function that returns the start vertex id of every walk.
+        """
+        if starts is None:
+            ids = list(range(len(self.labels)))
+        else:
+            ids = [self.graph.index_of(start) for start in starts]
+        return ids * walks_per_vertex
+
+    def _walks(self, kind: str, length: int, starts, walks_per_vertex: int, p: float, q: float,
+               workers: int, batch_size: int) -> list:
+        """
+        Helper function that splits walks into batches, each with a seed drawn from this sampler,
+        and generates them in this process or across worker processes.
+        """
+        if length < 1:
+            raise ValueError("length must be at least 1")
+        if kind == 'node2vec':
+            if p <= 0 or q <= 0:
+                raise ValueError("p and q must be positive")
+
+        ids = self._start_ids(starts, walks_per_vertex)
+        batches = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+        seeds = [self._rng.getrandbits(64) for _ in batches]
+
+        if workers <= 1 or len(batches) <= 1:
+            results = [_walk_batch(kind, batch, length, p, q, seed, self) for batch, seed in zip(batches, seeds)]
+        else:
+            with _worker_pool(self.graph, workers, _attach) as executor:
+                results = list(executor.map(_walk_batch, [kind] * len(batches), batches, [length] * len(batches),
+                                            [p] * len(batches), [q] * len(batches), seeds))
+
+        labels = self.labels
+        return [[labels[i] for i in walk] for result in results for walk in result]
+
+    def random_walks(self, length: int, starts=None, walks_per_vertex: int=1, workers: int=1, batch_size: int=1024) -> list:
+        """
+        Generate first-order random walks. Each step moves to an adjacent vertex chosen uniformly,
+        or in proportion to the edge weight on weighted graphs.
+
+        Args:
+            length (int): The number of vertices in each walk, including the start. A walk ends early at a
+                vertex with no adjacents.
+            starts: An iterable of start vertices (default is every vertex).
+            walks_per_vertex (int): The number of walks from each start vertex.
+            workers (int): The number of worker processes. The graph is saved once to a temporary file which
+                every worker memory-maps.
+            batch_size (int): The number of walks per batch (and per task sent to a worker).
+
+        Returns:
+            A list of walks, each a list of vertices: one walk from every start, repeated walks_per_vertex times.
+
+        Raises:
+            KeyError: If a start vertex does not exist.
+            ValueError: If length is less than 1.
+        """
+        return self._walks('random', length, starts, walks_per_vertex, 1.0, 1.0, workers, batch_size)
+
+    def node2vec_walks(self, length: int, p: float=1.0, q: float=1.0, starts=None, walks_per_vertex: int=1,
+                       workers: int=1, batch_size: int=1024) -> list:
+        """
+        Generate node2vec second-order biased walks (Grover and Leskovec, 2016).
+
+        After moving from t to v, the next vertex x is drawn in proportion to the edge weight times
+        1/p if x is t, 1 if x is adjacent to t, and 1/q otherwise. p = q = 1 gives a first-order walk.
+
+        Args:
+            length (int): The number of vertices in each walk, including the start.
+            p (float): The return parameter; a high p makes walks less likely to step back.
+            q (float): The in-out parameter; q > 1 keeps walks local, q < 1 pushes them outward.
+            starts: An iterable of start vertices (default is every vertex).
+            walks_per_vertex (int): The number of walks from each start vertex.
+            workers (int): The number of worker processes.
+            batch_size (int): The number of walks per batch.
+
+        Returns:
+            A list of walks, each a list of vertices.
+
+        Raises:
+            KeyError: If a start vertex does not exist.
+            ValueError: If length is less than 1 or p or q is not positive.
+        """
+        return self._walks('node2vec', length, starts, walks_per_vertex, p, q, workers, batch_size)
+
+    def sample_neighbors(self, vertex, k: int, replace: bool=False) -> list:
+        """
+        Sample k adjacents of a vertex, in proportion to the edge weights on weighted graphs.
+
+        Args:
+            vertex: The vertex.
+            k (int): The number of adjacents to sample.
+            replace (bool): If True, draw k adjacents independently (repeats allowed). Otherwise return
+                k distinct adjacents, or every adjacent if there are at most k.
+
+        Returns:
+            A list of adjacent vertices.
+
+        Raises:
+            KeyError: If the vertex does not exist.
+        """
+        labels = self.labels
+        return [labels[j] for j in self._sample_ids(self.graph.index_of(vertex), k, replace, self._rng)]
+
+    def _sample_ids(self, i: int, k: int, replace: bool, rng: random.Random) -> list:
+        """
+        Helper function that samples k adjacent ids of vertex id i.
+        """
+        row = self._rows[i]
+        if not row:
+            return []
+        if replace:
+            return [self._step(i, rng) for _ in range(k)]
+        if len(row) <= k:
+            return list(row)
+        if self._alias is None:
+            return rng.sample(row, k)
+        # weighted sampling without replacement (Efraimidis-Spirakis): keep the k largest u ** (1 / w)
+        offsets, _, weights = self.graph.csr_arrays()
+        keys = [(rng.random() ** (1 / weights[n]) if weights[n] > 0 else 0.0, j)
+                for j, n in zip(row, range(offsets[i], offsets[i + 1]))]
+        return [j for _, j in heapq.nlargest(k, keys)]
+
+    def k_hop_sample(self, seeds, fanouts, replace: bool=False) -> list:
+        """
+        Sample a k-hop neighborhood, GraphSAGE style: sample fanouts[0] adjacents of each seed, then
+        fanouts[1] adjacents of each vertex sampled so far, and so on.
+
+        Args:
+            seeds: An iterable of seed vertices.
+            fanouts: The number of adjacents to sample per vertex at each hop.
+            replace (bool): If True, sample adjacents with replacement.
+
+        Returns:
+            A list with one list of sampled (vertex, adjacent) edges per hop.
+
+        Raises:
+            KeyError: If a seed vertex does not exist.
+        """
+        frontier = list(dict.fromkeys(self.graph.index_of(seed) for seed in seeds))
+        labels = self.labels
+        hops = []
+        for fanout in fanouts:
+            edges = [(i, j) for i in frontier for j in self._sample_ids(i, fanout, replace, self._rng)]
+            hops.append([(labels[i], labels[j]) for i, j in edges])
+            frontier = list(dict.fromkeys(j for _, j in edges))
+        return hops
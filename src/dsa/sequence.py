@@ -0,0 +1,587 @@
+""" Module containing sequence classes for edit-heavy workloads (gap buffer and rope). """
+import bisect
+import random
+
+from dsa.array import Array
+
+class GapBuffer(Array):
+    """
+    A gap buffer implementation.
+
+    Elements are stored in an array with a gap of free slots at the cursor. Inserts and deletes
+    at the cursor are O(1); moving the cursor costs O(distance moved), so clustered edits are cheap.
+
+    Special Methods:
+        Index Operator: buffer[index]
+        Assignment: buffer[index] = value
+
+    Equality:
+        GapBuffer instances can be compared for equality with other array instances, based on their contents.
+    """
+    def __init__(self, contents=None, capacity: int=10):
+        """
+        Initialize the gap buffer with optional contents.
+
+        Args:
+            contents: An optional iterable to fill the buffer with.
+            capacity (int): The initial size of the buffer (default is 10)
+        """
+        if contents and len(contents) > capacity:
+            capacity = len(contents)
+
+        self._array = [ None ] * max(capacity, 1)
+
+        #: index of the first free slot (the cursor)
+        self._gap_start = 0
+        #: index of the first element after the gap
+        self._gap_end = len(self._array)
+
+        #: number of elements currently in buffer
+        self.count = 0
+
+        if contents:
+            self.extend(contents)
+
+    def cursor(self) -> int:
+        """
+        Get the cursor position (the index where the gap is).
+
+        Returns:
+            The cursor position.
+        """
+        return self._gap_start
+
+    def move_cursor(self, index: int):
+        """
+        Move the gap to a specified index by shifting the elements between the old and new positions.
+
+        Args:
+            index (int): The new cursor position (0 to count inclusive).
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        if index < 0 or index > self.count:
+            raise IndexError
+
+        if index < self._gap_start:
+            n = self._gap_start - index
+            self._array[self._gap_end - n:self._gap_end] = self._array[index:self._gap_start]
+            self._gap_start -= n
+            self._gap_end -= n
+        elif index > self._gap_start:
+            n = index - self._gap_start
+            self._array[self._gap_start:self._gap_start + n] = self._array[self._gap_end:self._gap_end + n]
+            self._gap_start += n
+            self._gap_end += n
+
+    def grow(self):
+        """
+        Helper method to double the capacity of the buffer, keeping the gap at the cursor.
+        """
+        new_size = len(self._array) * 2
+        tail = self._array[self._gap_end:]
+        self._array = self._array[:self._gap_start] + [ None ] * (new_size - self.count) + tail
+        self._gap_end = new_size - len(tail)
+
+    def insert(self, index: int, element):
+        """
+        Insert an element at a specified index and leave the cursor after it.
+
+        Args:
+            index (int): The index at which to insert the element.
+            element: The element to insert.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        if index < 0 or index > self.count:
+            raise IndexError
+
+        if self._gap_start == self._gap_end:
+            self.grow()
+
+        self.move_cursor(index)
+        self._array[self._gap_start] = element
+        self._gap_start += 1
+        self.count += 1
+
+    def append(self, element):
+        """
+        Append an element to the end of the buffer (moves the cursor to the end).
+
+        Args:
+            element: The element to append.
+        """
+        self.insert(self.count, element)
+
+    def delete(self, index: int):
+        """
+        Delete the element at a specified index and leave the cursor at that index.
+
+        Args:
+            index (int): The index of the element to delete.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        if index < 0 or index >= self.count:
+            raise IndexError
+
+        self.move_cursor(index)
+        self._array[self._gap_end] = None
+        self._gap_end += 1
+        self.count -= 1
+
+    def _position(self, index: int) -> int:
+        """
+        Helper method to translate an element index into a position in the underlying array.
+        """
+        if index < 0 or index >= self.count:
+            raise IndexError
+        if index < self._gap_start:
+            return index
+        return index + self._gap_end - self._gap_start
+
+    def __getitem__(self, index: int):
+        """
+        Retrieve the element at the specified index.
+
+        Args:
+            index (int): The index of the element.
+
+        Returns:
+            The element at the specified index.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        return self._array[self._position(index)]
+
+    def __setitem__(self, index: int, value):
+        """
+        Set a new value at the specified index.
+
+        Args:
+            index (int): The index at which to set the value.
+            value: The new value to assign.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        self._array[self._position(index)] = value
+
+    def to_list(self) -> list:
+        """
+        Convert the buffer's elements to a standard Python list.
+
+        Returns:
+            A list containing the elements of the buffer.
+        """
+        return self._array[:self._gap_start] + self._array[self._gap_end:]
+
+    def _elements(self):
+        """
+        Helper method to return the elements of the buffer in order, without the gap.
+        """
+        return self.to_list()
+
+    def shift_right(self, start: int):
+        """
+        Helper method to shift elements to the right from a specified start index until the last element.
+        (May delete an element but does not affect the count.)
+        The last element is deleted and the element at start is inserted again by moving the gap.
+
+        Args:
+            start (int): The index at which to start shifting (inclusive).
+        """
+        if start < 0 or start >= self.count:
+            return
+        element = self[start]
+        self.delete(self.count - 1)
+        self.insert(start, element)
+
+    def shift_left(self, start: int):
+        """
+        Helper method to shift elements to the left starting at a start index.
+        (May delete an element but does not affect the count.)
+        The element at start is deleted and the last element is appended again by moving the gap.
+
+        Args:
+            start (int): The starting index of the shift.
+        """
+        if start < 0 or start >= self.count:
+            return
+        last = self[self.count - 1]
+        self.delete(start)
+        self.insert(self.count, last)
+
+    def searchsorted(self, value, side: str='left') -> int:
+        """
+        Find the index where a value would be inserted to keep a sorted buffer in order.
+        The buffer must already be sorted in ascending order. The elements before and after the gap
+        are bisected in place, without copying.
+
+        Args:
+            value: The value to locate.
+            side (str): 'left' for the first suitable index, 'right' for the last.
+
+        Returns:
+            The insertion index.
+
+        Raises:
+            ValueError: If side is not 'left' or 'right'.
+        """
+        if side not in ('left', 'right'):
+            raise ValueError("side must be 'left' or 'right'")
+        search = bisect.bisect_left if side == 'left' else bisect.bisect_right
+        index = search(self._array, value, 0, self._gap_start)
+        if index < self._gap_start:
+            return index
+        return self._gap_start + search(self._array, value, self._gap_end, len(self._array)) - self._gap_end
+
+
+class _RopeNode:
+    """
+    An immutable rope node holding a chunk (tuple) of elements.
+    Nodes form a treap: in-order position by subtree size, heap-ordered by priority.
+    """
+    __slots__ = ('chunk', 'priority', 'left', 'right', 'size')
+
+    def __init__(self, chunk: tuple, priority: float, left=None, right=None):
+        self.chunk = chunk
+        self.priority = priority
+        self.left = left
+        self.right = right
+        self.size = len(chunk) + _size(left) + _size(right)
+
+def _size(node) -> int:
+    return node.size if node is not None else 0
+
+def _merge(a, b):
+    """
+    Concatenate two treaps. Only the nodes along the merge path are copied.
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if a.priority > b.priority:
+        return _RopeNode(a.chunk, a.priority, a.left, _merge(a.right, b))
+    return _RopeNode(b.chunk, b.priority, _merge(a, b.left), b.right)
+
+def _split(node, k: int) -> tuple:
+    """
+    Split a treap into the first k elements and the rest. Only the nodes along the split path are copied.
+    """
+    if node is None:
+        return None, None
+
+    left_size = _size(node.left)
+    if k <= left_size:
+        left, right = _split(node.left, k)
+        return left, _RopeNode(node.chunk, node.priority, right, node.right)
+
+    k -= left_size
+    n = len(node.chunk)
+    if k >= n:
+        left, right = _split(node.right, k - n)
+        return _RopeNode(node.chunk, node.priority, node.left, left), right
+
+    # split falls inside this node's chunk
+    left = _RopeNode(node.chunk[:k], node.priority, node.left, None)
+    right = _merge(_RopeNode(node.chunk[k:], random.random()), node.right)
+    return left, right
+
+
+class Rope(Array):
+    """
+    A rope implementation.
+
+    Elements are stored in chunks at the nodes of a balanced tree (a treap), giving O(log n)
+    expected time for index access, insert, delete, concat and split. Nodes are immutable and
+    shared, so concat() and split() do not copy the elements.
+
+    Special Methods:
+        Index Operator: rope[index]
+        Assignment: rope[index] = value
+
+    Equality:
+        Rope instances can be compared for equality with other array instances, based on their contents.
+    """
+    #: maximum number of elements per node when building a rope from contents
+    chunk_size = 64
+
+    def __init__(self, contents=None):
+        """
+        Initialize the rope with optional contents.
+
+        Args:
+            contents: An optional iterable to fill the rope with.
+        """
+        self._root = None
+
+        #: number of elements currently in rope
+        self.count = 0
+
+        if contents:
+            self.extend(contents)
+
+    @classmethod
+    def _from_root(cls, root):
+        """
+        Helper method to create a rope sharing an existing tree.
+        """
+        rope = cls()
+        rope._root = root
+        rope.count = _size(root)
+        return rope
+
+    @classmethod
+    def _build(cls, contents):
+        """
+        Helper method to build a tree from an iterable, chunk_size elements per node.
+        """
+        items = list(contents)
+        root = None
+        for i in range(0, len(items), cls.chunk_size):
+            root = _merge(root, _RopeNode(tuple(items[i:i + cls.chunk_size]), random.random()))
+        return root
+
+    def capacity(self) -> int:
+        """
+        Get the capacity of the rope. A rope has no fixed capacity, so this is the number of elements.
+
+        Returns:
+            The number of elements in the rope.
+        """
+        return self.count
+
+    def append(self, element):
+        """
+        Append an element to the rope.
+
+        Args:
+            element: The element to append.
+        """
+        self._root = _merge(self._root, _RopeNode((element,), random.random()))
+        self.count += 1
+
+    def extend(self, array):
+        """
+        Append multiple elements from a given array.
+
+        Args:
+            array: An iterable containing elements to append.
+        """
+        self._root = _merge(self._root, self._build(array))
+        self.count = _size(self._root)
+
+    def insert(self, index: int, element):
+        """
+        Insert an element at a specified index.
+
+        Args:
+            index (int): The index at which to insert the element.
+            element: The element to insert.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        if index < 0 or index > self.count:
+            raise IndexError
+
+        left, right = _split(self._root, index)
+        self._root = _merge(_merge(left, _RopeNode((element,), random.random())), right)
+        self.count += 1
+
+    def delete(self, index: int):
+        """
+        Delete the element at a specified index.
+
+        Args:
+            index (int): The index of the element to delete.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        if index < 0 or index >= self.count:
+            raise IndexError
+
+        left, right = _split(self._root, index)
+        _, right = _split(right, 1)
+        self._root = _merge(left, right)
+        self.count -= 1
+
+    def __getitem__(self, index: int):
+        """
+        Retrieve the element at the specified index.
+
+        Args:
+            index (int): The index of the element.
+
+        Returns:
+            The element at the specified index.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        if index < 0 or index >= self.count:
+            raise IndexError
+
+        node = self._root
+        while True:
+            left_size = _size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index < left_size + len(node.chunk):
+                return node.chunk[index - left_size]
+            else:
+                index -= left_size + len(node.chunk)
+                node = node.right
+
+    def __setitem__(self, index: int, value):
+        """
+        Set a new value at the specified index.
+
+        Args:
+            index (int): The index at which to set the value.
+            value: The new value to assign.
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        if index < 0 or index >= self.count:
+            raise IndexError
+
+        left, right = _split(self._root, index)
+        _, right = _split(right, 1)
+        self._root = _merge(_merge(left, _RopeNode((value,), random.random())), right)
+
+    def __iter__(self):
+        """
+        Iterate over the elements in order.
+        """
+        stack = []
+        node = self._root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield from node.chunk
+            node = node.right
+
+    def to_list(self) -> list:
+        """
+        Convert the rope's elements to a standard Python list.
+
+        Returns:
+            A list containing the elements of the rope.
+        """
+        return list(self)
+
+    def _elements(self):
+        """
+        Helper method to return the elements of the rope in order.
+        """
+        return self.to_list()
+
+    def shift_right(self, start: int):
+        """
+        Helper method to shift elements to the right from a specified start index until the last element.
+        (May delete an element but does not affect the count.)
+        The tree is split around start and the last element and merged back, in O(log n) expected time.
+
+        Args:
+            start (int): The index at which to start shifting (inclusive).
+        """
+        if start < 0 or start >= self.count:
+            return
+        head, tail = _split(self._root, start)
+        tail, _ = _split(tail, self.count - start - 1)
+        element = self[start]
+        self._root = _merge(_merge(head, _RopeNode((element,), random.random())), tail)
+
+    def shift_left(self, start: int):
+        """
+        Helper method to shift elements to the left starting at a start index.
+        (May delete an element but does not affect the count.)
+        The tree is split around start and the last element and merged back, in O(log n) expected time.
+
+        Args:
+            start (int): The starting index of the shift.
+        """
+        if start < 0 or start >= self.count:
+            return
+        head, tail = _split(self._root, start)
+        _, tail = _split(tail, 1)
+        _, last = _split(self._root, self.count - 1)
+        self._root = _merge(_merge(head, tail), last)
+
+    def searchsorted(self, value, side: str='left') -> int:
+        """
+        Find the index where a value would be inserted to keep a sorted rope in order.
+        The rope must already be sorted in ascending order. Bisects through the index operator,
+        so it takes O(log^2 n) expected time without building a list.
+
+        Args:
+            value: The value to locate.
+            side (str): 'left' for the first suitable index, 'right' for the last.
+
+        Returns:
+            The insertion index.
+
+        Raises:
+            ValueError: If side is not 'left' or 'right'.
+        """
+        if side not in ('left', 'right'):
+            raise ValueError("side must be 'left' or 'right'")
+        if side == 'left':
+            return bisect.bisect_left(self, value, 0, self.count)
+        return bisect.bisect_right(self, value, 0, self.count)
+
+    @classmethod
+    def from_list(cls, mylist: list):
+        """
+        Create a rope from a standard Python list.
+
+        Args:
+            mylist: A Python list to initialize the rope.
+
+        Returns:
+            An instance of the Rope class.
+        """
+        return cls(mylist)
+
+    def concat(self, other: 'Rope') -> 'Rope':
+        """
+        Return a new rope with the elements of this rope followed by the elements of another.
+        Neither rope is modified.
+
+        Args:
+            other (Rope): The rope to append.
+
+        Returns:
+            The concatenated rope.
+        """
+        return self._from_root(_merge(self._root, other._root))
+
+    def split(self, index: int) -> tuple:
+        """
+        Split the rope at an index into two new ropes. This rope is not modified.
+
+        Args:
+            index (int): The number of elements in the first rope.
+
+        Returns:
+            A tuple of two ropes (elements before index, elements from index on).
+
+        Raises:
+            IndexError: If the index is out of bounds.
+        """
+        if index < 0 or index > self.count:
+            raise IndexError
+
+        left, right = _split(self._root, index)
+        return self._from_root(left), self._from_root(right)
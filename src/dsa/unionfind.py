@@ -0,0 +1,333 @@
+""" Module to access union-find (disjoint set) classes. """
+from array import array
+
+class DisjointSet:
+    """
+    A disjoint set (union-find) forest over the integer ids 0 .. n - 1.
+
+    Parents and set sizes are stored in typed arrays, with union by size and full path compression,
+    so find() and union() cost O(α(n)) amortized.
+    """
+    def __init__(self, size: int=0):
+        """
+        Args:
+            size (int): The number of elements, each starting in its own set.
+        """
+        self._parent = array('i', range(size))
+        self._size = array('i', [1]) * size
+        self._count = size
+
+    def add(self) -> int:
+        """
+        Add a new element in its own set.
+
+        Returns:
+            The id of the new element.
+        """
+        element = len(self._parent)
+        self._parent.append(element)
+        self._size.append(1)
+        self._count += 1
+        return element
+
+    def _check(self, element: int):
+        """
+        Helper function that raises IndexError if an element id is out of range.
+        """
+        if not 0 <= element < len(self._parent):
+            raise IndexError(f"Element {element} out of range")
+
+    def find(self, element: int) -> int:
+        """
+        Return the representative (root) id of the set containing an element.
+
+        Args:
+            element (int): The element id.
+
+        Raises:
+            IndexError: If the element id is out of range.
+        """
+        self._check(element)
+        parent = self._parent
+        root = element
+        while parent[root] != root:
+            root = parent[root]
+        # point every element on the path directly at the root
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """
+        Merge the sets containing two elements, attaching the smaller set under the larger.
+
+        Args:
+            a (int): An element id.
+            b (int): An element id.
+
+        Returns:
+            True if the elements were in different sets.
+
+        Raises:
+            IndexError: If an element id is out of range.
+        """
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        size = self._size
+        if size[a] < size[b]:
+            a, b = b, a
+        self._parent[b] = a
+        size[a] += size[b]
+        self._count -= 1
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        """
+        Return True if two elements are in the same set.
+
+        Raises:
+            IndexError: If an element id is out of range.
+        """
+        return self.find(a) == self.find(b)
+
+    def find_many(self, elements) -> list:
+        """
+        Return the representative id of each element, in order.
+        The loop is inlined, which is faster than calling find() per element.
+
+        Args:
+            elements: An iterable of element ids.
+
+        Raises:
+            IndexError: If an element id is out of range.
+        """
+        parent = self._parent
+        n = len(parent)
+        roots = []
+        for element in elements:
+            if not 0 <= element < n:
+                raise IndexError(f"Element {element} out of range")
+            root = element
+            while parent[root] != root:
+                root = parent[root]
+            while parent[element] != root:
+                parent[element], element = root, parent[element]
+            roots.append(root)
+        return roots
+
+    def union_many(self, pairs) -> int:
+        """
+        Merge the sets of each (a, b) pair of element ids.
+        The loop is inlined, which is faster than calling union() per pair.
+
+        Args:
+            pairs: An iterable of (a, b) pairs of element ids.
+
+        Returns:
+            The number of pairs that merged two different sets.
+
+        Raises:
+            IndexError: If an element id is out of range. The pairs before it are merged.
+        """
+        parent = self._parent
+        size = self._size
+        n = len(parent)
+        merged = 0
+        for a, b in pairs:
+            if not (0 <= a < n and 0 <= b < n):
+                self._count -= merged
+                raise IndexError(f"Element {a if not 0 <= a < n else b} out of range")
+            root_a = a
+            while parent[root_a] != root_a:
+                root_a = parent[root_a]
+            while parent[a] != root_a:
+                parent[a], a = root_a, parent[a]
+            root_b = b
+            while parent[root_b] != root_b:
+                root_b = parent[root_b]
+            while parent[b] != root_b:
+                parent[b], b = root_b, parent[b]
+            if root_a == root_b:
+                continue
+            if size[root_a] < size[root_b]:
+                root_a, root_b = root_b, root_a
+            parent[root_b] = root_a
+            size[root_a] += size[root_b]
+            merged += 1
+        self._count -= merged
+        return merged
+
+    def set_size(self, element: int) -> int:
+        """
+        Return the number of elements in the set containing an element.
+
+        Raises:
+            IndexError: If the element id is out of range.
+        """
+        return self._size[self.find(element)]
+
+    def sizes(self) -> dict:
+        """
+        Return a dictionary {representative id: set size} of every set.
+        """
+        return {root: self._size[root] for root in range(len(self._parent)) if self._parent[root] == root}
+
+    def groups(self) -> list:
+        """
+        Return the sets as lists of element ids, ordered by their smallest element.
+        """
+        groups = {}
+        for element, root in enumerate(self.find_many(range(len(self._parent)))):
+            groups.setdefault(root, []).append(element)
+        return list(groups.values())
+
+    def count(self) -> int:
+        """
+        Return the number of disjoint sets.
+        """
+        return self._count
+
+    def __len__(self) -> int:
+        """
+        Return the number of elements.
+        """
+        return len(self._parent)
+
+    def __repr__(self):
+        return f"DisjointSet(elements={len(self._parent)}, sets={self._count})"
+
+
+class LabeledDisjointSet:
+    """
+    A disjoint set of arbitrary hashable labels, mapped to the integer ids of a DisjointSet.
+    """
+    def __init__(self, labels=None):
+        """
+        Args:
+            labels: An iterable of initial labels, each starting in its own set.
+        """
+        self._sets = DisjointSet()
+        self._ids = {}
+        self._labels = []
+        if labels is not None:
+            for label in labels:
+                self.add(label)
+
+    def add(self, label) -> bool:
+        """
+        Add a label in its own set. Adding an existing label does nothing.
+
+        Args:
+            label: The label to add.
+
+        Returns:
+            True if the label was added.
+        """
+        if label in self._ids:
+            return False
+        self._ids[label] = self._sets.add()
+        self._labels.append(label)
+        return True
+
+    def _id(self, label) -> int:
+        """
+        Helper function that returns the id of a label.
+        """
+        try:
+            return self._ids[label]
+        except KeyError:
+            raise KeyError(f"Element {label} does not exist") from None
+
+    def find(self, label):
+        """
+        Return the representative label of the set containing a label.
+
+        Raises:
+            KeyError: If the label does not exist.
+        """
+        return self._labels[self._sets.find(self._id(label))]
+
+    def union(self, a, b) -> bool:
+        """
+        Merge the sets containing two labels.
+
+        Returns:
+            True if the labels were in different sets.
+
+        Raises:
+            KeyError: If a label does not exist.
+        """
+        return self._sets.union(self._id(a), self._id(b))
+
+    def connected(self, a, b) -> bool:
+        """
+        Return True if two labels are in the same set.
+
+        Raises:
+            KeyError: If a label does not exist.
+        """
+        return self._sets.connected(self._id(a), self._id(b))
+
+    def find_many(self, labels) -> list:
+        """
+        Return the representative label of each label, in order.
+
+        Raises:
+            KeyError: If a label does not exist.
+        """
+        return [self._labels[root] for root in self._sets.find_many([self._id(label) for label in labels])]
+
+    def union_many(self, pairs) -> int:
+        """
+        Merge the sets of each (a, b) pair of labels.
+
+        Returns:
+            The number of pairs that merged two different sets.
+
+        Raises:
+            KeyError: If a label does not exist. No pairs are merged.
+        """
+        return self._sets.union_many([(self._id(a), self._id(b)) for a, b in pairs])
+
+    def set_size(self, label) -> int:
+        """
+        Return the number of labels in the set containing a label.
+
+        Raises:
+            KeyError: If the label does not exist.
+        """
+        return self._sets.set_size(self._id(label))
+
+    def sizes(self) -> dict:
+        """
+        Return a dictionary {representative label: set size} of every set.
+        """
+        return {self._labels[root]: size for root, size in self._sets.sizes().items()}
+
+    def groups(self) -> list:
+        """
+        Return the sets as lists of labels, ordered by the first label added to each.
+        """
+        return [[self._labels[element] for element in group] for group in self._sets.groups()]
+
+    def count(self) -> int:
+        """
+        Return the number of disjoint sets.
+        """
+        return self._sets.count()
+
+    def __contains__(self, label) -> bool:
+        """
+        Return True if the label has been added.
+        """
+        return label in self._ids
+
+    def __len__(self) -> int:
+        """
+        Return the number of labels.
+        """
+        return len(self._labels)
+
+    def __repr__(self):
+        return f"LabeledDisjointSet(elements={len(self._labels)}, sets={self.count()})"
@@ -0,0 +1,159 @@
+""" Module to access visitor classes that observe graph traversals and searches. """
+from contextlib import contextmanager, nullcontext
+import time
+
+class Visitor:
+    """
+    Base visitor with a no-op method for every hook. Subclass it and override the hooks you need.
+
+    Algorithms that accept a visitor (graph_traversal.dfs(), graph_traversal.bfs(), dijkstra.shortest_path()
+    and dijkstra.find_path()) call the hooks as they run. Without a visitor the traversals run a loop with no
+    hook calls, and Dijkstra calls the hooks of a no-op Visitor. The traversals print their debug output from
+    a visitor too, which forwards each hook to the caller's visitor first.
+    """
+    def on_discover(self, vertex):
+        """
+        Called when a vertex is reached for the first time.
+        """
+
+    def on_examine_edge(self, start, end):
+        """
+        Called for every edge scanned out of a vertex, whether or not it leads to a new vertex.
+        """
+
+    def on_finish(self, vertex):
+        """
+        Called when a vertex is done: all its adjacents have been explored (dfs, bfs) or its
+        shortest distance is final (Dijkstra).
+        """
+
+    def on_relax(self, start, end, weight):
+        """
+        Called when an edge improves the best known distance to its end vertex.
+
+        Args:
+            start: The vertex the edge leaves.
+            end: The vertex whose distance improved.
+            weight: The new distance to end.
+        """
+
+    def on_push(self, vertex, priority):
+        """
+        Called when a vertex is pushed onto a priority queue.
+        """
+
+    def on_pop(self, vertex, priority):
+        """
+        Called when a vertex is popped from a priority queue (including stale entries that are skipped).
+        """
+
+    def phase(self, name: str):
+        """
+        Return a context manager wrapped around each phase of an algorithm
+        ('traversal' for dfs and bfs, 'search' and 'path' for Dijkstra).
+
+        Args:
+            name (str): The phase name.
+        """
+        return nullcontext()
+
+
+class _ForwardingVisitor(Visitor):
+    """
+    Visitor that passes every hook on to another visitor. The debug visitors of the traversal
+    functions subclass it to print their output after the caller's visitor has run.
+    """
+    def __init__(self, visitor: Visitor=None):
+        """
+        Args:
+            visitor (Visitor): The visitor to forward to (default is a no-op Visitor).
+        """
+        self.visitor = visitor if visitor is not None else Visitor()
+
+    def on_discover(self, vertex):
+        self.visitor.on_discover(vertex)
+
+    def on_examine_edge(self, start, end):
+        self.visitor.on_examine_edge(start, end)
+
+    def on_finish(self, vertex):
+        self.visitor.on_finish(vertex)
+
+    def on_relax(self, start, end, weight):
+        self.visitor.on_relax(start, end, weight)
+
+    def on_push(self, vertex, priority):
+        self.visitor.on_push(vertex, priority)
+
+    def on_pop(self, vertex, priority):
+        self.visitor.on_pop(vertex, priority)
+
+    def phase(self, name: str):
+        return self.visitor.phase(name)
+
+
+class CounterVisitor(Visitor):
+    """
+    Visitor that counts hook calls and measures the wall time of each phase.
+
+    Attributes:
+        discovered (int): Vertices discovered.
+        finished (int): Vertices finished.
+        edges_examined (int): Edges scanned.
+        edges_relaxed (int): Edges that improved a distance.
+        pushes (int): Priority queue pushes.
+        pops (int): Priority queue pops.
+        times (dict): Seconds spent in each phase, by phase name.
+    """
+    def __init__(self):
+        self.discovered = 0
+        self.finished = 0
+        self.edges_examined = 0
+        self.edges_relaxed = 0
+        self.pushes = 0
+        self.pops = 0
+        self.times = {}
+
+    def on_discover(self, vertex):
+        self.discovered += 1
+
+    def on_examine_edge(self, start, end):
+        self.edges_examined += 1
+
+    def on_finish(self, vertex):
+        self.finished += 1
+
+    def on_relax(self, start, end, weight):
+        self.edges_relaxed += 1
+
+    def on_push(self, vertex, priority):
+        self.pushes += 1
+
+    def on_pop(self, vertex, priority):
+        self.pops += 1
+
+    @contextmanager
+    def phase(self, name: str):
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.times[name] = self.times.get(name, 0.0) + time.perf_counter() - begin
+
+    def report(self) -> dict:
+        """
+        Return the counts and phase times as a dictionary.
+        """
+        return {
+            'discovered': self.discovered,
+            'finished': self.finished,
+            'edges_examined': self.edges_examined,
+            'edges_relaxed': self.edges_relaxed,
+            'pushes': self.pushes,
+            'pops': self.pops,
+            'times': dict(self.times),
+        }
+
+    def __repr__(self):
+        counts = ", ".join(f"{key}={value}" for key, value in self.report().items() if key != 'times')
+        return f"CounterVisitor({counts})"
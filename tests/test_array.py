@@ -361,5 +361,39 @@ class TestArray(unittest.TestCase):
         self.assertFalse(circular == static_diff)
         self.assertFalse(circular == dynamic_diff)
 
+    def test_batch_operations(self):
+        for arr in (Array([3, 1, 2, 1], capacity=6), DynamicArray([3, 1, 2, 1]), CircularArray([3, 1, 2, 1], capacity=4)):
+            self.assertEqual(arr.map(lambda x: x * 2).to_list(), [6, 2, 4, 2])
+            self.assertIsInstance(arr.map(str), DynamicArray)
+            self.assertEqual(arr.filter(lambda x: x > 1).to_list(), [3, 2])
+            self.assertEqual(arr.reduce(lambda a, b: a * b), 6)
+            self.assertEqual(arr.reduce(lambda a, b: a + b, 10), 17)
+            self.assertEqual(arr.reduce(lambda a, b: [b] if a is None else a + [b], None), arr.to_list())
+            self.assertEqual(arr.sum(), 7)
+            self.assertEqual(arr.min(), 1)
+            self.assertEqual(arr.max(), 3)
+            self.assertEqual(arr.argsort(), [1, 3, 2, 0])
+
+        circular = CircularArray([0, 1, 2], capacity=3)
+        circular.append(3)
+        self.assertEqual(circular.to_list(), [1, 2, 3])
+        self.assertEqual(circular.sum(), 6)
+        self.assertEqual(circular.argsort(), [0, 1, 2])
+        self.assertEqual(circular.searchsorted(2), 1)
+
+        empty = Array()
+        self.assertEqual(empty.sum(), 0)
+        self.assertRaises(ValueError, empty.min)
+        self.assertRaises(ValueError, empty.max)
+        self.assertRaises(TypeError, lambda: empty.reduce(lambda a, b: a + b))
+
+    def test_searchsorted(self):
+        arr = DynamicArray([1, 2, 2, 4])
+        self.assertEqual(arr.searchsorted(2), 1)
+        self.assertEqual(arr.searchsorted(2, side='right'), 3)
+        self.assertEqual(arr.searchsorted(0), 0)
+        self.assertEqual(arr.searchsorted(5), 4)
+        self.assertRaises(ValueError, lambda: arr.searchsorted(1, side='middle'))
+
 if __name__ == "__main__":
     unittest.main()
@@ -116,6 +116,82 @@ class TestArray(unittest.TestCase):
         with self.assertRaises(IndexError):
             ca.delete(2)
 
+    def test_overwrite_disabled(self):
+        ca = CircularArray([1, 2], capacity=3, overwrite=False)
+        ca.append(3)
+        with self.assertRaises(Exception):
+            ca.append(4)
+        self.assertEqual(ca.to_list(), [1, 2, 3])
+
+    def test_append_many(self):
+        ca = CircularArray(capacity=5)
+        ca.append_many([1, 2, 3])
+        self.assertEqual(ca.to_list(), [1, 2, 3])
+        ca.append_many([4, 5, 6, 7])
+        self.assertEqual(ca.to_list(), [3, 4, 5, 6, 7])
+        ca.append_many(range(10, 20))
+        self.assertEqual(ca.to_list(), [15, 16, 17, 18, 19])
+        ca.append_many([])
+        self.assertEqual(len(ca), 5)
+
+        for size in range(8):
+            ca = CircularArray([0, 1, 2, 3], capacity=5)
+            ca.append(4)
+            ca.append(5)
+            expected = ([1, 2, 3, 4, 5] + list(range(100, 100 + size)))[-5:]
+            ca.append_many(range(100, 100 + size))
+            self.assertEqual(ca.to_list(), expected)
+
+    def test_latest(self):
+        ca = CircularArray(capacity=4)
+        self.assertEqual(ca.latest(2), [])
+        for i in range(6):
+            ca.append(i)
+        self.assertEqual(ca.latest(1), [5])
+        self.assertEqual(ca.latest(3), [3, 4, 5])
+        self.assertEqual(ca.latest(10), [2, 3, 4, 5])
+        self.assertEqual(ca.latest(0), [])
+        self.assertRaises(ValueError, lambda: ca.latest(-1))
+
+    def test_aggregates(self):
+        ca = CircularArray(capacity=3, aggregates=True)
+        self.assertEqual(ca.sum(), 0)
+        self.assertRaises(ValueError, ca.min)
+        self.assertRaises(ValueError, ca.mean)
+
+        samples = [5, 1, 4, 2, 8, 3, 3, 0, 7]
+        for i, sample in enumerate(samples):
+            ca.append(sample)
+            window = samples[max(0, i - 2):i + 1]
+            self.assertEqual(ca.sum(), sum(window))
+            self.assertEqual(ca.min(), min(window))
+            self.assertEqual(ca.max(), max(window))
+            self.assertAlmostEqual(ca.mean(), sum(window) / len(window))
+
+        ca[0] = 10
+        self.assertEqual(ca.to_list(), [10, 0, 7])
+        self.assertEqual(ca.max(), 10)
+        ca.delete(0)
+        self.assertEqual(ca.sum(), 7)
+        ca.insert(0, -1)
+        self.assertEqual(ca.min(), -1)
+
+        ca = CircularArray([4, 6], capacity=4, aggregates=True)
+        ca.append_many([1, 9, 2])
+        self.assertEqual(ca.to_list(), [6, 1, 9, 2])
+        self.assertEqual((ca.sum(), ca.min(), ca.max()), (18, 1, 9))
+
+    def test_insert_delete_wraparound(self):
+        ca = CircularArray(capacity=6)
+        for i in range(9):
+            ca.append(i)
+        ca.delete(1)
+        self.assertEqual(ca.to_list(), [3, 5, 6, 7, 8])
+        ca.insert(1, 4)
+        self.assertEqual(ca.to_list(), [3, 4, 5, 6, 7, 8])
+        ca.delete(4)
+        ca.insert(4, 70)
+        self.assertEqual(ca.to_list(), [3, 4, 5, 6, 70, 8])
 
 
 if __name__ == "__main__":
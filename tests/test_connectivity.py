@@ -0,0 +1,116 @@
+import random
+import unittest
+
+import networkx as nx
+
+from dsa.connectivity import connected_components, strongly_connected_components, topological_sort, IncrementalComponents
+from dsa.graph import Graph
+
+GRAPH_TYPES = ('adjacency_list', 'adjacency_matrix', 'bit_matrix', 'csr')
+
+def random_edges(rng, n, m):
+    return [(rng.randrange(n), rng.randrange(n)) for _ in range(m)]
+
+def as_sets(components):
+    return sorted(sorted(component) for component in components)
+
+class TestConnectivity(unittest.TestCase):
+    def test_connected_components(self):
+        rng = random.Random(3)
+        for directed in (False, True):
+            edges = random_edges(rng, 60, 50)
+            reference = nx.DiGraph(edges) if directed else nx.Graph(edges)
+            expected = as_sets(nx.weakly_connected_components(reference) if directed else nx.connected_components(reference))
+            for graph_type in GRAPH_TYPES:
+                graph = Graph.from_edges(edges, graph_type=graph_type, directed=directed)
+                components = connected_components(graph)
+                self.assertEqual(as_sets(components), expected)
+                self.assertEqual([component[0] for component in components],
+                                 [v for v in graph.vertices() if any(c[0] == v for c in components)])
+
+        graph = Graph.create_adjacency_list()
+        self.assertEqual(connected_components(graph), [])
+        graph.add_vertex('A')
+        self.assertEqual(connected_components(graph), [['A']])
+
+    def test_strongly_connected_components(self):
+        rng = random.Random(4)
+        edges = random_edges(rng, 60, 90)
+        expected = as_sets(nx.strongly_connected_components(nx.DiGraph(edges)))
+        for graph_type in GRAPH_TYPES:
+            graph = Graph.from_edges(edges, graph_type=graph_type, directed=True)
+            components = strongly_connected_components(graph)
+            self.assertEqual(as_sets(components), expected)
+            # reverse topological order: edges never lead to a later component
+            position = {v: i for i, component in enumerate(components) for v in component}
+            for a, b in edges:
+                self.assertGreaterEqual(position[a], position[b])
+
+        # deeper than the recursion limit
+        chain = Graph.from_edges([(i, i + 1) for i in range(5000)] + [(5000, 0)], graph_type='csr', directed=True)
+        self.assertEqual(len(strongly_connected_components(chain)), 1)
+
+    def test_topological_sort(self):
+        rng = random.Random(5)
+        edges = [(a, b) for a, b in random_edges(rng, 50, 120) if a < b]
+        for graph_type in GRAPH_TYPES:
+            graph = Graph.from_edges(edges, graph_type=graph_type, directed=True)
+            order = topological_sort(graph)
+            self.assertEqual(sorted(order), sorted(graph.vertices()))
+            position = {v: i for i, v in enumerate(order)}
+            for a, b in edges:
+                self.assertLess(position[a], position[b])
+
+        graph = Graph.from_edges([('A', 'B'), ('B', 'C'), ('C', 'A')], directed=True)
+        self.assertRaises(ValueError, lambda: topological_sort(graph))
+        graph = Graph.from_edges([('A', 'A')], directed=True)
+        self.assertRaises(ValueError, lambda: topological_sort(graph))
+        graph = Graph.from_edges([('A', 'B')])
+        self.assertRaises(ValueError, lambda: topological_sort(graph))
+
+    def test_views(self):
+        rng = random.Random(7)
+        edges = [(a, b) for a, b in random_edges(rng, 40, 100) if a < b]
+        for graph_type in GRAPH_TYPES:
+            graph = Graph.from_edges(edges, graph_type=graph_type, directed=True)
+            view = graph.subgraph(lambda v: v % 2 == 0 or v < 20)
+            self.assertFalse(hasattr(view, 'in_degree'))
+            order = topological_sort(view)
+            self.assertEqual(sorted(order), sorted(view.vertices()))
+            position = {v: i for i, v in enumerate(order)}
+            for a, b in edges:
+                if a in position and b in position:
+                    self.assertLess(position[a], position[b])
+
+            reference = nx.DiGraph(view.edges())
+            reference.add_nodes_from(view.vertices())
+            self.assertEqual(as_sets(connected_components(view)), as_sets(nx.weakly_connected_components(reference)))
+            self.assertEqual(as_sets(strongly_connected_components(view)), as_sets(nx.strongly_connected_components(reference)))
+
+    def test_incremental_components(self):
+        rng = random.Random(6)
+        tracker = IncrementalComponents(range(40))
+        reference = nx.Graph()
+        reference.add_nodes_from(range(40))
+        self.assertEqual(len(tracker), 40)
+        for a, b in random_edges(rng, 50, 60):
+            merged = tracker.add_edge(a, b)
+            self.assertEqual(merged, not (a in reference and b in reference and nx.has_path(reference, a, b)))
+            reference.add_edge(a, b)
+            self.assertEqual(len(tracker), nx.number_connected_components(reference))
+        self.assertEqual(as_sets(tracker.components()), as_sets(nx.connected_components(reference)))
+        for v in reference:
+            self.assertEqual(tracker.component_size(v), len(nx.node_connected_component(reference, v)))
+        self.assertRaises(KeyError, lambda: tracker.find('Z'))
+        self.assertNotIn('Z', tracker)
+
+        graph = Graph.from_edges([('A', 'B'), ('C', 'D')], directed=True)
+        tracker = IncrementalComponents.from_graph(graph)
+        self.assertEqual(len(tracker), 2)
+        self.assertTrue(tracker.connected('B', 'A'))
+        self.assertFalse(tracker.connected('A', 'C'))
+        self.assertTrue(tracker.add_edge('D', 'A'))
+        self.assertEqual(tracker.component_size('C'), 4)
+
+if __name__ == '__main__':
+    unittest.main()
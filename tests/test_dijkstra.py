@@ -1,3 +1,5 @@
+import contextlib
+import io
 import unittest
 from dsa.dijkstra import shortest_path, find_path
 from dsa.graph import Graph
@@ -149,6 +151,22 @@ class TestDijkstra(unittest.TestCase):
         with self.assertRaises(KeyError):
             weight_table, previous = shortest_path(self.gm, 'A', 'ZZZ')
 
+    def test_duck_typed_graph(self):
+        class DictGraph:
+            # graph-like object with only __contains__() and adjacent_items()
+            def __init__(self, graph):
+                self.adjacency = graph.to_dict()
+
+            def __contains__(self, vertex):
+                return vertex in self.adjacency
+
+            def adjacent_items(self, vertex):
+                return list(self.adjacency[vertex].items())
+
+        weight_table, previous = shortest_path(DictGraph(self.gl), 'A', 'D')
+        self.assertEqual(weight_table['D'], 4)
+        self.assertEqual(previous['D'], 'C')
+
 class TestFindPath(unittest.TestCase):
     def setUp(self):
         self.gl = Graph.create_adjacency_list(directed=True, weighted=True)
@@ -206,6 +224,24 @@ class TestFindPath(unittest.TestCase):
 
         path = find_path(self.gm, 'A', 'D', debug=True)
         self.assertEqual(path, ['A', 'B', 'C', 'D'])
+
+    def test_shortest_path_debug_output(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            shortest_path(self.gl, 'A', 'D', debug=True)
+        expected = [
+            "current_vertex  A  adjacent  B  weight  1  new_dist  1  predecessor  {'A': 'A'}",
+            "{'A': 0, 'B': 1}",
+            "current_vertex  A  adjacent  C  weight  4  new_dist  4  predecessor  {'A': 'A', 'B': 'A'}",
+            "{'A': 0, 'B': 1, 'C': 4}",
+            "current_vertex  B  adjacent  C  weight  2  new_dist  3  predecessor  {'A': 'A', 'B': 'A', 'C': 'A'}",
+            "{'A': 0, 'B': 1, 'C': 3}",
+            "current_vertex  B  adjacent  D  weight  5  new_dist  6  predecessor  {'A': 'A', 'B': 'A', 'C': 'B'}",
+            "{'A': 0, 'B': 1, 'C': 3, 'D': 6}",
+            "current_vertex  C  adjacent  D  weight  1  new_dist  4  predecessor  {'A': 'A', 'B': 'A', 'C': 'B', 'D': 'B'}",
+            "{'A': 0, 'B': 1, 'C': 3, 'D': 4}",
+        ]
+        self.assertEqual(output.getvalue().splitlines(), expected)
         
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
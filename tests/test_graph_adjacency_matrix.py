@@ -240,3 +240,53 @@ class TestAdjacencyMatrixGraph(unittest.TestCase):
         with self.assertRaises(KeyError):
             g.delete_edge('A', 'B')
 
+    def test_stable_ids(self):
+        g = AdjacencyMatrixGraph(vertices=['A', 'B', 'C', 'D'], stable_ids=True)
+        g.add_edge('A', 'B')
+        g.add_edge('B', 'C')
+        g.add_edge('C', 'D')
+        g.delete_vertex('B')
+        self.assertEqual(g.vertices(), ['A', 'C', 'D'])
+        self.assertEqual(g.index_of('C'), 2)
+        self.assertEqual(len(g), 3)
+        self.assertEqual(g.size(), 1)
+        self.assertEqual(g.adjacents('A'), [])
+        self.assertEqual(g.edges(), [('C', 'D'), ('D', 'C')])
+        self.assertEqual(g.to_dict(), {'A': [], 'C': ['D'], 'D': ['C']})
+        self.assertFalse(g.has_vertex('B'))
+        self.assertRaises(KeyError, lambda: g.delete_vertex('B'))
+
+        # the freed slot is reused
+        g.add_vertex('E')
+        self.assertEqual(g.index_of('E'), 1)
+        self.assertEqual(g.adjacents('E'), [])
+        g.add_edge('A', 'E')
+        self.assertEqual(g['A'], ['E'])
+
+        g.delete_vertex('A')
+        mapping = g.compact()
+        self.assertEqual(mapping, {1: 0, 2: 1, 3: 2})
+        self.assertEqual(g.vertices(), ['E', 'C', 'D'])
+        self.assertEqual(g.edges(), [('C', 'D'), ('D', 'C')])
+        self.assertEqual(g.index_of('D'), 2)
+
+    def test_stable_ids_none_label(self):
+        g = AdjacencyMatrixGraph(vertices=[None, 'A', 'B'], stable_ids=True)
+        g.add_edge(None, 'A')
+        g.delete_vertex('B')
+        self.assertEqual(g.vertices(), [None, 'A'])
+        self.assertEqual(g.to_dict(), {None: ['A'], 'A': [None]})
+        self.assertEqual(g.compact(), {0: 0, 1: 1})
+        self.assertEqual(g.vertices(), [None, 'A'])
+
+    def test_stable_ids_weighted(self):
+        g = AdjacencyMatrixWeightedGraph(directed=True, stable_ids=True)
+        g.add_edge('A', 'B', 1)
+        g.add_edge('B', 'C', 2)
+        g.add_edge('C', 'A', 3)
+        g.delete_vertex('A')
+        self.assertEqual(g.edges(), [('B', 'C', 2)])
+        self.assertEqual(g.adjacent_items('C'), [])
+        self.assertEqual(g.freeze().to_dict(), {'B': {'C': 2}, 'C': {}})
+        self.assertEqual(g.compact(), {1: 0, 2: 1})
+        self.assertEqual(g.to_dict(), {'B': {'C': 2}, 'C': {}})
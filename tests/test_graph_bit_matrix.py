@@ -0,0 +1,111 @@
+import random
+import unittest
+
+from dsa.graph import Graph, AdjacencyMatrixGraph, AdjacencyBitMatrixGraph
+from dsa.graph_traversal import bfs, dfs
+
+class TestAdjacencyBitMatrixGraph(unittest.TestCase):
+    def test_create(self):
+        g = Graph.create('bit_matrix', directed=True)
+        self.assertIsInstance(g, AdjacencyBitMatrixGraph)
+        self.assertTrue(g.is_directed)
+        self.assertFalse(g.is_weighted)
+        self.assertRaises(ValueError, lambda: Graph.create('bit_matrix', weighted=True))
+        self.assertRaises(ValueError, lambda: AdjacencyBitMatrixGraph(vertices=['A', 'A']))
+
+        g = Graph.create_bit_matrix(vertices=['A', 'B', 'C'])
+        self.assertEqual(g.vertices(), ['A', 'B', 'C'])
+        self.assertEqual(g.adjacents('A'), [])
+        self.assertRaises(ValueError, lambda: g.add_vertex('A'))
+
+    def test_edges(self):
+        g = AdjacencyBitMatrixGraph()
+        g.add_edge('A', 'B')
+        g.add_edge('A', 'C')
+        g.add_edge('B', 'C')
+        self.assertEqual(g['A'], ['B', 'C'])
+        self.assertEqual(g.adjacents('C'), ['A', 'B'])
+        self.assertTrue(g.has_edge('C', 'B'))
+        self.assertEqual(g.size(), 3)
+        self.assertEqual(g.undirected_edges(), [('A', 'B'), ('A', 'C'), ('B', 'C')])
+
+        g.delete_edge('A', 'B')
+        self.assertFalse(g.has_edge('B', 'A'))
+        self.assertRaises(KeyError, lambda: g.delete_edge('A', 'B'))
+        self.assertRaises(KeyError, lambda: g.has_edge('A', 'Z'))
+
+    def test_delete_vertex(self):
+        g = AdjacencyBitMatrixGraph(directed=True)
+        for start, end in [('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'A'), ('A', 'D')]:
+            g.add_edge(start, end)
+        g.delete_vertex('B')
+        self.assertEqual(g.vertices(), ['A', 'C', 'D'])
+        self.assertEqual(g.to_dict(), {'A': ['D'], 'C': ['D'], 'D': ['A']})
+
+    def test_iter_bits(self):
+        rng = random.Random(4)
+        for size in (1, 7, 8, 9, 23, 64, 130):
+            row = bytearray(rng.randrange(256) for _ in range(size))
+            expected = [i for i in range(8 * size) if row[i >> 3] >> (i & 7) & 1]
+            self.assertEqual(list(AdjacencyBitMatrixGraph._iter_bits(row)), expected)
+
+        g = AdjacencyBitMatrixGraph(directed=True, vertices=list(range(200)))
+        for i in range(0, 200, 3):
+            g.add_edge(0, i)
+        self.assertEqual(g.adjacents(0), list(range(0, 200, 3)))
+
+    def test_matches_matrix(self):
+        rng = random.Random(7)
+        labels = [f"v{i}" for i in range(40)]
+        for directed in (False, True):
+            bits = AdjacencyBitMatrixGraph(directed=directed)
+            matrix = AdjacencyMatrixGraph(directed=directed)
+            for _ in range(150):
+                start, end = rng.choice(labels), rng.choice(labels)
+                bits.add_edge(start, end)
+                matrix.add_edge(start, end)
+            for label in labels[::7]:
+                if label in matrix:
+                    bits.delete_vertex(label)
+                    matrix.delete_vertex(label)
+            self.assertEqual(bits.vertices(), matrix.vertices())
+            self.assertEqual(bits.to_dict(), matrix.to_dict())
+            self.assertEqual(bits.edges(), matrix.edges())
+            self.assertEqual(bits.undirected_edges(), matrix.undirected_edges())
+            self.assertEqual(bits.size(), matrix.size())
+            start = bits.vertices()[0]
+            self.assertEqual(bfs(bits, start), bfs(matrix, start))
+            self.assertEqual(dfs(bits, start), dfs(matrix, start))
+            self.assertEqual(bits.freeze().to_dict(), matrix.to_dict())
+
+    def test_bfs_layers(self):
+        g = AdjacencyBitMatrixGraph()
+        for start, end in [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D'), ('D', 'E')]:
+            g.add_edge(start, end)
+        g.add_vertex('F')
+        self.assertEqual(g.bfs_layers('A'), [['A'], ['B', 'C'], ['D'], ['E']])
+        self.assertEqual(g.bfs_layers('F'), [['F']])
+
+    def test_from_dict(self):
+        data = {'A': ['B'], 'B': ['A', 'C'], 'C': ['B']}
+        g = Graph.from_dict(data, 'bit_matrix')
+        self.assertIsInstance(g, AdjacencyBitMatrixGraph)
+        self.assertEqual(g.to_dict(), data)
+
+    def test_stable_ids(self):
+        g = AdjacencyBitMatrixGraph(directed=True, stable_ids=True)
+        for i in range(10):
+            g.add_edge(i, (i + 1) % 10)
+        g.delete_vertex(3)
+        self.assertEqual(g.index_of(4), 4)
+        self.assertEqual(g.size(), 8)
+        self.assertEqual(g.adjacents(2), [])
+        g.add_vertex('X')
+        self.assertEqual(g.index_of('X'), 3)
+        self.assertEqual(g.adjacents('X'), [])
+        mapping = g.compact()
+        self.assertEqual(mapping[9], 9)
+        g.delete_vertex(0)
+        g.compact()
+        self.assertEqual(g.vertices(), [1, 2, 'X', 4, 5, 6, 7, 8, 9])
+        self.assertEqual(g.edges(), [(1, 2), (4, 5), (5, 6), (6, 7), (7, 8), (8, 9)])
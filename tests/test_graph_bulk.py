@@ -0,0 +1,81 @@
+import os
+import random
+import tempfile
+import unittest
+
+from dsa.graph import Graph, AdjacencyListGraph, AdjacencyMatrixWeightedGraph, AdjacencyBitMatrixGraph, CSRGraph
+
+class TestGraphBulk(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(3)
+        labels = [f"v{i}" for i in range(30)]
+        self.edges = [(rng.choice(labels), rng.choice(labels)) for _ in range(120)]
+        self.weighted_edges = [(start, end, rng.randint(1, 9)) for start, end in self.edges]
+
+    def build(self, graph_type, directed, weighted):
+        g = Graph.create(graph_type, directed=directed, weighted=weighted)
+        for edge in (self.weighted_edges if weighted else self.edges):
+            g.add_edge(*edge)
+        return g
+
+    def test_from_edges_matches_add_edge(self):
+        cases = [('adjacency_list', False), ('adjacency_list', True), ('adjacency_matrix', False),
+                 ('adjacency_matrix', True), ('bit_matrix', False)]
+        for graph_type, weighted in cases:
+            for directed in (False, True):
+                expected = self.build(graph_type, directed, weighted)
+                edges = self.weighted_edges if weighted else self.edges
+                g = Graph.from_edges(iter(edges), graph_type=graph_type, directed=directed, weighted=weighted)
+                self.assertIsInstance(g, type(expected))
+                self.assertEqual(g.is_directed, directed)
+                self.assertEqual(g.vertices(), expected.vertices())
+                self.assertEqual(g.to_dict(), expected.to_dict())
+                self.assertEqual(g.size(), expected.size())
+
+    def test_from_edges_csr(self):
+        for weighted in (False, True):
+            for directed in (False, True):
+                expected = self.build('adjacency_list', directed, weighted).freeze()
+                edges = self.weighted_edges if weighted else self.edges
+                g = Graph.from_edges(edges, graph_type='csr', directed=directed, weighted=weighted)
+                self.assertIsInstance(g, CSRGraph)
+                self.assertEqual(g.vertices(), expected.vertices())
+                self.assertEqual(g.to_dict(), expected.to_dict())
+
+    def test_from_edges_classes(self):
+        g = AdjacencyListGraph.from_edges([('A', 'B'), ('A', 'B'), ('B', 'C')], directed=True)
+        self.assertEqual(g.to_dict(), {'A': ['B'], 'B': ['C'], 'C': []})
+        g = AdjacencyMatrixWeightedGraph.from_edges([('A', 'B', 2), ('B', 'B', 5)])
+        self.assertEqual(g.to_dict(), {'A': {'B': 2}, 'B': {'A': 2}})
+        g = AdjacencyBitMatrixGraph.from_edges([])
+        self.assertEqual(g.order(), 0)
+        self.assertRaises(ValueError, lambda: Graph.from_edges([], graph_type='bit_matrix', weighted=True))
+        self.assertRaises(ValueError, lambda: Graph.from_edges([], graph_type='unknown'))
+
+    def test_load_edgelist(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "edges.txt")
+            with open(path, "w") as f:
+                f.write("# comment\nA B\n\nA C\nC D extra\n")
+            g = Graph.load_edgelist(path)
+            self.assertEqual(g.to_dict(), {'A': ['B', 'C'], 'B': ['A'], 'C': ['A', 'D'], 'D': ['C']})
+
+            path = os.path.join(tmpdir, "edges.csv")
+            with open(path, "w") as f:
+                f.write("A, B, 1\nB, C, 2.5\n")
+            g = Graph.load_edgelist(path, graph_type='csr', directed=True, weighted=True, delimiter=',')
+            self.assertEqual(g.to_dict(), {'A': {'B': 1}, 'B': {'C': 2.5}, 'C': {}})
+
+            edges = list(Graph.read_edgelist(path, weighted=True, delimiter=','))
+            self.assertEqual(edges, [('A', 'B', 1), ('B', 'C', 2.5)])
+
+            path = os.path.join(tmpdir, "bad.txt")
+            with open(path, "w") as f:
+                f.write("A B\nC\n")
+            self.assertRaises(ValueError, lambda: Graph.load_edgelist(path))
+
+            path = os.path.join(tmpdir, "percent.txt")
+            with open(path, "w") as f:
+                f.write("% comment\nA B\n")
+            g = Graph.load_edgelist(path, comment='%')
+            self.assertEqual(g.to_dict(), {'A': ['B'], 'B': ['A']})
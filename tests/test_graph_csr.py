@@ -0,0 +1,106 @@
+import unittest
+
+from dsa.graph import Graph, CSRGraph
+from dsa.graph_traversal import dfs, bfs, dfs_path, bfs_path
+from dsa.dijkstra import shortest_path, find_path
+from dsa.prim import prims_mst, mst_weight
+
+class TestCSRGraph(unittest.TestCase):
+    def setUp(self):
+        self.weighted_edges = [('A', 'B', 1), ('A', 'C', 4), ('B', 'C', 2), ('B', 'D', 5), ('C', 'D', 3)]
+
+    def test_create(self):
+        g = Graph.create('csr', edges=[('A', 'B'), ('A', 'C'), ('B', 'D')])
+        self.assertIsInstance(g, CSRGraph)
+        self.assertFalse(g.is_directed)
+        self.assertFalse(g.is_weighted)
+        self.assertEqual(g.vertices(), ['A', 'B', 'C', 'D'])
+        self.assertEqual(g.adjacents('A'), ['B', 'C'])
+        self.assertEqual(g['B'], ['A', 'D'])
+        self.assertEqual(g.order(), 4)
+        self.assertEqual(len(g), 4)
+        self.assertEqual(g.size(), 3)
+        self.assertTrue('A' in g)
+        self.assertFalse('Z' in g)
+
+        g = Graph.create_csr(directed=True, vertices=['A', 'B', 'C'], edges=[('A', 'B')])
+        self.assertEqual(g.vertices(), ['A', 'B', 'C'])
+        self.assertEqual(g.adjacents('C'), [])
+        self.assertEqual(g.size(), 1)
+
+        self.assertRaises(ValueError, lambda: CSRGraph(vertices=['A', 'A']))
+
+    def test_edges(self):
+        g = Graph.create('csr', directed=True, weighted=True, edges=self.weighted_edges)
+        self.assertTrue(g.has_edge('A', 'B'))
+        self.assertFalse(g.has_edge('B', 'A'))
+        self.assertRaises(KeyError, lambda: g.has_edge('A', 'Z'))
+        self.assertEqual(g.get_weight('B', 'D'), 5)
+        self.assertRaises(KeyError, lambda: g.get_weight('D', 'B'))
+        self.assertEqual(g.adjacent_items('A'), [('B', 1), ('C', 4)])
+        self.assertEqual(g['A'], {'B': 1, 'C': 4})
+        self.assertEqual(g.edges(), self.weighted_edges)
+        self.assertEqual(g.size(), 5)
+
+        u = Graph.create('csr', weighted=True, edges=self.weighted_edges)
+        self.assertEqual(u.size(), 5)
+        self.assertEqual(sorted(u.undirected_edges()), sorted(self.weighted_edges))
+        self.assertTrue(u.has_edge('D', 'C'))
+
+        unweighted = Graph.create('csr', edges=[('A', 'B')])
+        self.assertRaises(TypeError, lambda: unweighted.adjacent_items('A'))
+        self.assertRaises(TypeError, lambda: unweighted.get_weight('A', 'B'))
+
+    def test_weight_storage(self):
+        g = Graph.create('csr', weighted=True, edges=[('A', 'B', 1.5)])
+        self.assertEqual(g.get_weight('A', 'B'), 1.5)
+        _, _, weights = g.csr_arrays()
+        self.assertEqual(weights.typecode, 'd')
+
+        g = Graph.create('csr', weighted=True, edges=[('A', 'B', 2)])
+        offsets, targets, weights = g.csr_arrays()
+        self.assertEqual(weights.typecode, 'q')
+        self.assertEqual(list(offsets), [0, 1, 2])
+        self.assertEqual(list(targets), [1, 0])
+        self.assertEqual(g.index_of('B'), 1)
+
+    def test_freeze(self):
+        for graph_type in ('adjacency_list', 'adjacency_matrix'):
+            for directed in (False, True):
+                g = Graph.create(graph_type, directed=directed)
+                for start, end, _ in self.weighted_edges:
+                    g.add_edge(start, end)
+                g.add_edge('D', 'E')
+                frozen = g.freeze()
+                self.assertIsInstance(frozen, CSRGraph)
+                self.assertEqual(frozen.to_dict(), g.to_dict())
+                self.assertEqual(frozen.size(), g.size())
+                self.assertEqual(frozen.is_directed, directed)
+                for v in g.vertices():
+                    self.assertEqual(dfs(frozen, v), dfs(g, v))
+                    self.assertEqual(bfs(frozen, v), bfs(g, v))
+                self.assertEqual(dfs_path(frozen, 'A', 'E'), dfs_path(g, 'A', 'E'))
+                self.assertEqual(bfs_path(frozen, 'A', 'E'), bfs_path(g, 'A', 'E'))
+
+                w = Graph.create(graph_type, directed=directed, weighted=True)
+                for start, end, weight in self.weighted_edges:
+                    w.add_edge(start, end, weight)
+                frozen = w.freeze()
+                self.assertTrue(frozen.is_weighted)
+                self.assertEqual(frozen.to_dict(), w.to_dict())
+                self.assertEqual(shortest_path(frozen, 'A', 'D'), shortest_path(w, 'A', 'D'))
+                self.assertEqual(find_path(frozen, 'A', 'D'), find_path(w, 'A', 'D'))
+
+    def test_prims(self):
+        g = Graph.create('csr', weighted=True, edges=self.weighted_edges)
+        mst = prims_mst(g, 'A')
+        self.assertEqual(sorted(mst.undirected_edges()), [('A', 'B', 1), ('B', 'C', 2), ('C', 'D', 3)])
+        self.assertEqual(mst_weight(mst), 6)
+
+    def test_from_dict(self):
+        data = {'A': {'B': 1}, 'B': {'A': 1, 'C': 2}, 'C': {'B': 2}}
+        g = Graph.from_dict(data, 'csr', weighted=True)
+        self.assertEqual(g.to_dict(), data)
+        data = {'A': ['B'], 'B': []}
+        g = Graph.from_dict(data, 'csr', directed=True)
+        self.assertEqual(g.to_dict(), data)
@@ -0,0 +1,121 @@
+import random
+import unittest
+
+from dsa.graph import Graph, AdjacencyMatrixGraph
+
+def brute_counts(graph):
+    """ Recompute size and degrees by walking every adjacency. """
+    out_degree = {v: len(graph.adjacents(v)) for v in graph.vertices()}
+    in_degree = {v: 0 for v in graph.vertices()}
+    for v in graph.vertices():
+        for w in graph.adjacents(v):
+            in_degree[w] += 1
+    total = sum(out_degree.values())
+    if isinstance(graph, AdjacencyMatrixGraph):
+        # matrix graphs leave self-loops out of size(), as edges() does
+        total -= sum(1 for v in graph.vertices() if v in graph.adjacents(v))
+    size = total if graph.is_directed else total // 2
+    return size, in_degree, out_degree
+
+class TestGraphDegree(unittest.TestCase):
+    def assertCounts(self, graph):
+        size, in_degree, out_degree = brute_counts(graph)
+        self.assertEqual(graph.size(), size)
+        for v in graph.vertices():
+            self.assertEqual(graph.in_degree(v), in_degree[v])
+            self.assertEqual(graph.out_degree(v), out_degree[v])
+            if graph.is_directed:
+                self.assertEqual(graph.degree(v), in_degree[v] + out_degree[v])
+            else:
+                self.assertEqual(graph.degree(v), out_degree[v])
+
+    def test_degree(self):
+        g = Graph.create_adjacency_list(directed=True)
+        g.add_edge('A', 'B')
+        g.add_edge('A', 'C')
+        g.add_edge('C', 'A')
+        g.add_edge('A', 'B')
+        self.assertEqual(g.out_degree('A'), 2)
+        self.assertEqual(g.in_degree('A'), 1)
+        self.assertEqual(g.degree('A'), 3)
+        self.assertEqual(g.in_degree('B'), 1)
+        self.assertEqual(g.size(), 3)
+
+        g = Graph.create_adjacency_matrix(weighted=True)
+        g.add_edge('A', 'B', 1)
+        g.add_edge('A', 'C', 2)
+        self.assertEqual(g.degree('A'), 2)
+        self.assertEqual(g.degree('B'), 1)
+        self.assertEqual(g.size(), 2)
+        self.assertRaises(KeyError, lambda: g.degree('Z'))
+
+    def test_mutations(self):
+        rng = random.Random(7)
+        labels = list(range(12))
+        for graph_type in ('adjacency_list', 'adjacency_matrix', 'bit_matrix'):
+            for directed in (False, True):
+                for weighted in (False, True):
+                    if graph_type == 'bit_matrix' and weighted:
+                        continue
+                    g = Graph.create(graph_type, directed=directed, weighted=weighted)
+                    for _ in range(300):
+                        a, b = rng.choice(labels), rng.choice(labels)
+                        op = rng.random()
+                        if op < 0.6:
+                            if weighted:
+                                g.add_edge(a, b, rng.randint(1, 9))
+                            else:
+                                g.add_edge(a, b)
+                        elif op < 0.9:
+                            if a != b and a in g and b in g and g.has_edge(a, b) and (directed or g.has_edge(b, a)):
+                                g.delete_edge(a, b)
+                        elif a in g:
+                            g.delete_vertex(a)
+                    self.assertCounts(g)
+
+    def test_stable_ids(self):
+        g = AdjacencyMatrixGraph(directed=True, stable_ids=True)
+        for i in range(6):
+            g.add_edge(i, (i + 1) % 6)
+            g.add_edge(i, i)
+        g.delete_vertex(2)
+        self.assertCounts(g)
+        g.compact()
+        self.assertCounts(g)
+
+    def test_self_loops(self):
+        for graph_type in ('adjacency_matrix', 'bit_matrix'):
+            for directed in (False, True):
+                g = Graph.create(graph_type, directed=directed)
+                g.add_edge('A', 'B')
+                g.add_edge('A', 'A')
+                g.add_edge('B', 'B')
+                self.assertEqual(g.size(), 1)
+                self.assertEqual(g.size(), len(g.edges()) if directed else len(g.undirected_edges()))
+                self.assertCounts(g)
+                g.delete_edge('A', 'A', directed=True)
+                self.assertEqual(g.size(), 1)
+                self.assertCounts(g)
+                g.delete_vertex('B')
+                g.add_edge('A', 'A')
+                self.assertEqual(g.size(), 0)
+                self.assertEqual(g.edges(), [])
+                self.assertCounts(g)
+
+    def test_bulk(self):
+        edges = [(i, (i * 7) % 20) for i in range(20)] + [(1, 2), (2, 1), (1, 2)]
+        for graph_type in ('adjacency_list', 'adjacency_matrix', 'bit_matrix', 'csr'):
+            for directed in (False, True):
+                g = Graph.from_edges(edges, graph_type=graph_type, directed=directed)
+                self.assertCounts(g)
+
+    def test_undirected_edges(self):
+        g = Graph.create_adjacency_list(weighted=True)
+        g.add_edge('A', 'B', 1)
+        g.add_edge('B', 'C', 2)
+        g.add_edge('C', 'A', 3, directed=True)
+        self.assertEqual(g.undirected_edges(), [('A', 'B', 1), ('B', 'C', 2), ('C', 'A', 3)])
+        self.assertEqual(g.freeze().undirected_edges(), [('A', 'B', 1), ('B', 'C', 2), ('C', 'A', 3)])
+
+if __name__ == '__main__':
+    unittest.main()
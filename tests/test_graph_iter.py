@@ -0,0 +1,36 @@
+import types
+import unittest
+
+from dsa.graph import Graph
+
+EDGES = [('A', 'B'), ('A', 'C'), ('B', 'C'), ('C', 'D'), ('D', 'A'), ('E', 'E')]
+WEIGHTED_EDGES = [('A', 'B', 3), ('A', 'C', 1), ('B', 'C', 2), ('C', 'D', 5), ('D', 'A', 4)]
+
+class TestGraphIterators(unittest.TestCase):
+    def graphs(self):
+        for graph_type in ('adjacency_list', 'adjacency_matrix', 'bit_matrix', 'csr'):
+            for directed in (False, True):
+                yield Graph.from_edges(EDGES, graph_type=graph_type, directed=directed)
+                if graph_type != 'bit_matrix':
+                    yield Graph.from_edges(WEIGHTED_EDGES, graph_type=graph_type, directed=directed, weighted=True)
+
+    def test_iter_matches_lists(self):
+        for g in self.graphs():
+            self.assertIsInstance(g.iter_edges(), types.GeneratorType)
+            self.assertEqual(list(g.iter_edges()), g.edges())
+            for v in g.vertices():
+                self.assertEqual(list(g.iter_adjacents(v)), list(g.adjacents(v)))
+                if g.is_weighted:
+                    self.assertEqual(list(g.iter_adjacent_items(v)), list(g.adjacent_items(v)))
+
+    def test_missing_vertex(self):
+        for g in self.graphs():
+            self.assertRaises(KeyError, lambda: g.iter_adjacents('Z'))
+            if g.is_weighted:
+                self.assertRaises(KeyError, lambda: g.iter_adjacent_items('Z'))
+
+        g = Graph.from_edges(EDGES, graph_type='csr')
+        self.assertRaises(TypeError, lambda: g.iter_adjacent_items('A'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import random
+import unittest
+
+from dsa.graph import Graph, AdjacencyListGraph, AdjacencyListWeightedGraph
+
+def brute_predecessors(graph, vertex):
+    return sorted(v for v in graph.vertices() if vertex in graph.adjacents(v))
+
+class TestPredecessors(unittest.TestCase):
+    def test_reverse_index(self):
+        g = AdjacencyListGraph(directed=True, reverse_index=True)
+        g.add_edge('A', 'B')
+        g.add_edge('C', 'B')
+        g.add_edge('B', 'D')
+        self.assertEqual(g.predecessors('B'), ['A', 'C'])
+        self.assertEqual(g.in_edges('B'), [('A', 'B'), ('C', 'B')])
+        self.assertEqual(g.predecessors('A'), [])
+        self.assertRaises(KeyError, lambda: g.predecessors('Z'))
+
+        g.delete_edge('A', 'B')
+        self.assertEqual(g.predecessors('B'), ['C'])
+        g.delete_vertex('B')
+        self.assertEqual(g.predecessors('D'), [])
+        self.assertEqual(g.adjacents('C'), [])
+        self.assertEqual(g.size(), 0)
+
+    def test_weighted_in_edges(self):
+        g = AdjacencyListWeightedGraph(directed=True, reverse_index=True)
+        g.add_edge('A', 'B', 2)
+        g.add_edge('C', 'B', 5)
+        g.add_edge('A', 'B', 3)
+        self.assertEqual(g.in_edges('B'), [('A', 'B', 3), ('C', 'B', 5)])
+        g.delete_vertex('A')
+        self.assertEqual(g.in_edges('B'), [('C', 'B', 5)])
+
+        for graph_type in ('adjacency_matrix', 'csr'):
+            h = Graph.from_edges([('A', 'B', 2), ('C', 'B', 5)], graph_type=graph_type, directed=True, weighted=True)
+            self.assertEqual(h.in_edges('B'), [('A', 'B', 2), ('C', 'B', 5)])
+
+    def test_enable_reverse_index(self):
+        g = Graph.from_edges([('A', 'B'), ('C', 'B')], directed=True)
+        self.assertEqual(g.predecessors('B'), ['A', 'C'])
+        g.enable_reverse_index()
+        g.add_edge('D', 'B')
+        self.assertEqual(g.predecessors('B'), ['A', 'C', 'D'])
+
+    def test_random_mutations(self):
+        rng = random.Random(3)
+        labels = list(range(10))
+        for cls in (AdjacencyListGraph, AdjacencyListWeightedGraph):
+            for directed in (True, False):
+                g = cls(directed=directed, reverse_index=True)
+                for _ in range(400):
+                    a, b = rng.choice(labels), rng.choice(labels)
+                    op = rng.random()
+                    if op < 0.6:
+                        if g.is_weighted:
+                            g.add_edge(a, b, rng.randint(1, 5))
+                        else:
+                            g.add_edge(a, b)
+                    elif op < 0.9:
+                        if a != b and a in g and b in g and g.has_edge(a, b) and (directed or g.has_edge(b, a)):
+                            g.delete_edge(a, b)
+                    elif a in g:
+                        g.delete_vertex(a)
+                for v in g.vertices():
+                    self.assertEqual(sorted(g.predecessors(v)), brute_predecessors(g, v))
+                    self.assertEqual(g.in_degree(v), len(g.predecessors(v)))
+
+                for graph_type in ('adjacency_matrix', 'bit_matrix', 'csr'):
+                    edges = [(u, v) for u in g.vertices() for v in g.adjacents(u)]
+                    h = Graph.from_edges(edges, graph_type=graph_type, directed=True)
+                    for v in h.vertices():
+                        self.assertEqual(sorted(h.predecessors(v)), brute_predecessors(h, v))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+
+from dsa.graph import Graph, CSRGraph, AdjacencyListGraph, AdjacencyListWeightedGraph
+
+class TestGraphSave(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory for graph files."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "graph.bin")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def assertSameGraph(self, a, b):
+        self.assertEqual(a.is_directed, b.is_directed)
+        self.assertEqual(a.is_weighted, b.is_weighted)
+        self.assertEqual(a.vertices(), b.vertices())
+        self.assertEqual(a.to_dict(), b.to_dict())
+        self.assertEqual(a.size(), b.size())
+
+    def test_round_trip(self):
+        cases = [
+            Graph.from_edges([('A', 'B'), ('B', 'C'), ('C', 'A')], graph_type='csr', directed=True),
+            Graph.from_edges([('A', 'B', 2), ('B', 'C', 3)], graph_type='csr', weighted=True),
+            Graph.from_edges([(1, 2, 0.5), (2, 3, 1.5)], graph_type='csr', directed=True, weighted=True),
+            Graph.from_edges([('A', 'B', 'x')], graph_type='csr', weighted=True),
+            CSRGraph(vertices=['A', 'B', 'C']),
+            CSRGraph(),
+        ]
+        for g in cases:
+            for memory_map in (False, True):
+                g.save(self.path)
+                h = CSRGraph.load(self.path, memory_map=memory_map)
+                self.assertSameGraph(g, h)
+                self.assertEqual(h.edges(), g.edges())
+
+    def test_label_types(self):
+        labels = [(0, 1), (1, 2), ('a', (None, True)), frozenset({1, 2}), 3, 2.5, None, 'x']
+        g = CSRGraph(directed=True, vertices=labels, edges=list(zip(labels, labels[1:])))
+        for memory_map in (False, True):
+            g.save(self.path)
+            with CSRGraph.load(self.path, memory_map=memory_map) as h:
+                self.assertEqual(h.vertices(), labels)
+                self.assertEqual([type(label) for label in h.vertices()], [type(label) for label in labels])
+                self.assertEqual(h.adjacents((0, 1)), [(1, 2)])
+        self.assertRaises(TypeError, CSRGraph(vertices=[object()]).save, self.path)
+
+    def test_close(self):
+        g = Graph.from_edges([(i, i + 1, i) for i in range(20)], graph_type='csr', weighted=True)
+        g.save(self.path)
+        h = CSRGraph.load(self.path, memory_map=True)
+        self.assertEqual(h.to_dict(), g.to_dict())
+        h.close()
+        self.assertTrue(h._mmap is None)
+        h.close()
+        g.close()
+
+    def test_memory_map(self):
+        g = Graph.from_edges([(i, (i * 3) % 50, i) for i in range(50)], graph_type='csr', directed=True, weighted=True)
+        g.save(self.path)
+        h = CSRGraph.load(self.path, memory_map=True)
+        offsets, targets, weights = h.csr_arrays()
+        self.assertIsInstance(targets, memoryview)
+        self.assertEqual(list(targets), list(g.csr_arrays()[1]))
+        self.assertEqual(h.get_weight(7, 21), 7)
+        self.assertEqual(h.predecessors(21), [7])
+        self.assertEqual(h.in_degree(21), 1)
+
+        # a memory-mapped graph can be saved again
+        path = os.path.join(self.tmpdir.name, "copy.bin")
+        h.save(path)
+        self.assertSameGraph(CSRGraph.load(path), g)
+
+    def test_save_other_graphs(self):
+        g = AdjacencyListWeightedGraph(directed=True)
+        g.add_edge('A', 'B', 4)
+        g.add_edge('B', 'C', 1)
+        g.save(self.path)
+        self.assertSameGraph(Graph.load(self.path), g.freeze())
+
+        h = Graph.load(self.path, graph_type='adjacency_list')
+        self.assertIsInstance(h, AdjacencyListWeightedGraph)
+        self.assertEqual(h.to_dict(), g.to_dict())
+
+        g = Graph.create_adjacency_matrix(vertices=['A', 'B', 'C'])
+        g.add_edge('A', 'C')
+        g.save(self.path)
+        h = Graph.load(self.path, graph_type='adjacency_matrix')
+        self.assertEqual(h.to_dict(), g.to_dict())
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not a graph file at all, really not one')
+        self.assertRaises(ValueError, lambda: CSRGraph.load(self.path))
+        with open(self.path, 'wb') as f:
+            f.write(b'')
+        self.assertRaises(ValueError, lambda: CSRGraph.load(self.path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,9 @@
 import unittest
-from dsa.graph_traversal import dfs, bfs, dfs_path, bfs_path
+import contextlib
+import io
+import random
+from dsa.graph_traversal import dfs, bfs, dfs_path, bfs_path, dfs_recursive, dfs_path_recursive, iter_bfs, iter_dfs, bfs_layers, bidirectional_bfs_path, direction_optimizing_bfs
+from dsa.graph_traversal import multi_source_bfs, all_pairs_bfs
 from dsa.graph import Graph
 
 class TestGraphTraversal(unittest.TestCase):
@@ -127,6 +131,188 @@ class TestGraphTraversal(unittest.TestCase):
 
 
 
+    def test_dfs_matches_recursive(self):
+        rng = random.Random(11)
+        for directed in (False, True):
+            edges = [(rng.randrange(40), rng.randrange(40)) for _ in range(80)]
+            graph = Graph.from_edges(edges, directed=directed)
+            for start in graph.vertices():
+                self.assertEqual(dfs(graph, start), dfs_recursive(graph, start))
+                for end in (0, 7, 39):
+                    if end in graph:
+                        self.assertEqual(dfs_path(graph, start, end), dfs_path_recursive(graph, start, end))
+
+        graph = Graph.from_edges([('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')])
+        outputs = []
+        for fn in (dfs, dfs_recursive):
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                fn(graph, 'A', debug=True)
+            outputs.append(out.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_deep_dfs(self):
+        n = 20000
+        graph = Graph.from_edges([(i, i + 1) for i in range(n)], directed=True)
+        self.assertEqual(dfs(graph, 0), list(range(n + 1)))
+        self.assertEqual(dfs_path(graph, 0, n), list(range(n + 1)))
+        self.assertIsNone(dfs_path(graph, 5, 0))
+        with self.assertRaises(RecursionError):
+            dfs_recursive(graph, 0)
+
+    def test_streaming_traversals(self):
+        rng = random.Random(2)
+        edges = [(rng.randrange(30), rng.randrange(30)) for _ in range(60)]
+        for directed in (False, True):
+            graph = Graph.from_edges(edges, directed=directed)
+            for start in graph.vertices():
+                self.assertEqual(list(iter_bfs(graph, start)), bfs(graph, start))
+                self.assertEqual(list(iter_dfs(graph, start)), dfs(graph, start))
+                layers = list(bfs_layers(graph, start))
+                self.assertEqual([v for layer in layers for v in layer], bfs(graph, start))
+
+        graph = Graph.from_edges([('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'E'), ('D', 'F')])
+        self.assertEqual(list(iter_bfs(graph, 'A', details=True)),
+                         [('A', 0, None), ('B', 1, 'A'), ('C', 1, 'A'), ('D', 2, 'B'), ('E', 2, 'C'), ('F', 3, 'D')])
+        self.assertEqual(list(iter_dfs(graph, 'A', details=True)),
+                         [('A', 0, None), ('B', 1, 'A'), ('D', 2, 'B'), ('F', 3, 'D'), ('C', 1, 'A'), ('E', 2, 'C')])
+        self.assertEqual(list(bfs_layers(graph, 'A')), [['A'], ['B', 'C'], ['D', 'E'], ['F']])
+
+    def test_early_termination(self):
+        explored = []
+        class Counting:
+            def __init__(self, graph):
+                self.graph = graph
+            def iter_adjacents(self, v):
+                explored.append(v)
+                return self.graph.iter_adjacents(v)
+
+        graph = Counting(Graph.from_edges([(i, i + 1) for i in range(1000)], directed=True))
+        self.assertEqual(next(v for v in iter_bfs(graph, 0) if v == 3), 3)
+        self.assertLess(len(explored), 5)
+        explored.clear()
+        self.assertEqual(next(v for v in iter_dfs(graph, 0) if v == 3), 3)
+        self.assertLess(len(explored), 5)
+
+    def test_bidirectional_bfs_path(self):
+        rng = random.Random(9)
+        for directed in (False, True):
+            edges = [(rng.randrange(50), rng.randrange(50)) for _ in range(90)]
+            for graph in (Graph.from_edges(edges, directed=directed),
+                          Graph.from_edges(edges, graph_type='csr', directed=directed),
+                          Graph.from_edges(edges, graph_type='adjacency_matrix', directed=directed)):
+                for start in graph.vertices()[:10]:
+                    for end in graph.vertices():
+                        expected = bfs_path(graph, start, end)
+                        path = bidirectional_bfs_path(graph, start, end)
+                        if expected is None:
+                            self.assertIsNone(path)
+                            continue
+                        self.assertEqual(len(path), len(expected))
+                        self.assertEqual((path[0], path[-1]), (start, end))
+                        for a, b in zip(path, path[1:]):
+                            self.assertTrue(graph.has_edge(a, b))
+
+        graph = Graph.create_adjacency_list(directed=True)
+        graph.add_edge('A', 'B')
+        self.assertEqual(bidirectional_bfs_path(graph, 'A', 'A'), ['A'])
+        self.assertEqual(bidirectional_bfs_path(graph, 'A', 'B'), ['A', 'B'])
+        self.assertIsNone(bidirectional_bfs_path(graph, 'B', 'A'))
+        self.assertRaises(KeyError, lambda: bidirectional_bfs_path(graph, 'A', 'Z'))
+
+    def test_direction_optimizing_bfs(self):
+        rng = random.Random(11)
+        for directed in (False, True):
+            edges = [(rng.randrange(200), rng.randrange(200)) for _ in range(2000)]
+            for graph in (Graph.from_edges(edges, directed=directed),
+                          Graph.from_edges(edges, graph_type='csr', directed=directed)):
+                for start in graph.vertices()[:5]:
+                    expected = {v: d for d, layer in enumerate(bfs_layers(graph, start)) for v in layer}
+                    distance, parent, levels = direction_optimizing_bfs(graph, start)
+                    self.assertEqual(distance, expected)
+                    self.assertIsNone(parent[start])
+                    for v, p in parent.items():
+                        if p is not None:
+                            self.assertTrue(graph.has_edge(p, v))
+                            self.assertEqual(distance[v], distance[p] + 1)
+                    self.assertEqual(sum(level['frontier'] for level in levels), len(distance))
+                    self.assertIn('bottom-up', [level['direction'] for level in levels])
+
+                    # never bottom-up: the same distances, examining every reachable out-edge
+                    distance, _, levels = direction_optimizing_bfs(graph, start, alpha=0)
+                    self.assertEqual(distance, expected)
+                    self.assertEqual({level['direction'] for level in levels}, {'top-down'})
+                    self.assertEqual(sum(level['edges'] for level in levels),
+                                     sum(len(graph.adjacents(v)) for v in distance))
+
+        graph = Graph.create_adjacency_list(directed=True)
+        graph.add_edge('A', 'B')
+        graph.add_vertex('C')
+        self.assertEqual(direction_optimizing_bfs(graph, 'A')[:2], ({'A': 0, 'B': 1}, {'A': None, 'B': 'A'}))
+        self.assertRaises(KeyError, lambda: direction_optimizing_bfs(graph, 'Z'))
+
+    def test_multi_source_bfs(self):
+        rng = random.Random(5)
+        for directed in (False, True):
+            edges = [(rng.randrange(40), rng.randrange(40)) for _ in range(60)]
+            graph = Graph.from_edges(edges, directed=directed)
+            expected = {s: {v: d for d, layer in enumerate(bfs_layers(graph, s)) for v in layer}
+                        for s in graph.vertices()}
+            self.assertEqual(all_pairs_bfs(graph), expected)
+            self.assertEqual(all_pairs_bfs(graph.freeze()), expected)
+
+            sources = graph.vertices()[:6] + graph.vertices()[:1]
+            result = multi_source_bfs(graph, sources, parents=True)
+            self.assertEqual(list(result), graph.vertices()[:6])
+            for s, (distance, parent) in result.items():
+                self.assertEqual(distance, expected[s])
+                self.assertIsNone(parent[s])
+                for v, p in parent.items():
+                    if p is not None:
+                        self.assertTrue(graph.has_edge(p, v))
+                        self.assertEqual(distance[v], distance[p] + 1)
+            self.assertEqual(multi_source_bfs(graph, sources, workers=2), {s: expected[s] for s in sources})
+
+        self.assertRaises(KeyError, lambda: multi_source_bfs(graph, ['Z']))
+        self.assertRaises(ValueError, lambda: multi_source_bfs(graph, sources, parents=True, workers=2))
+
+    def test_csr_fast_path(self):
+        rng = random.Random(13)
+        for directed in (False, True):
+            edges = [(rng.randrange(80), rng.randrange(80)) for _ in range(200)]
+            graph = Graph.from_edges(edges, directed=directed)
+            frozen = graph.freeze()
+            for start in graph.vertices()[:10]:
+                self.assertEqual(bfs(frozen, start), bfs(graph, start))
+                self.assertEqual(dfs(frozen, start), dfs(graph, start))
+                self.assertEqual(dfs(frozen, start), dfs_recursive(frozen, start))
+                self.assertEqual(dfs(frozen, start, path=['X']), ['X'] + dfs(graph, start))
+                visited = set()
+                self.assertEqual(dfs(frozen, start, visited=visited), dfs(graph, start))
+                self.assertEqual(visited, set(dfs(graph, start)))
+
+        chain = Graph.from_edges([(i, i + 1) for i in range(5000)], graph_type='csr', directed=True)
+        self.assertEqual(dfs(chain, 0), list(range(5001)))
+        self.assertEqual(bfs(chain, 0), list(range(5001)))
+        self.assertRaises(KeyError, lambda: bfs(chain, -1))
+        self.assertRaises(KeyError, lambda: dfs(chain, -1))
+
+    def test_duck_typed_graph(self):
+        class DictGraph:
+            # graph-like object with only adjacents()
+            def __init__(self, adjacency):
+                self.adjacency = adjacency
+
+            def adjacents(self, vertex):
+                return self.adjacency[vertex]
+
+        g = DictGraph({'A': ['B', 'C'], 'B': ['D'], 'C': ['D'], 'D': []})
+        self.assertEqual(dfs(g, 'A'), ['A', 'B', 'D', 'C'])
+        self.assertEqual(bfs(g, 'A'), ['A', 'B', 'C', 'D'])
+        self.assertEqual(bfs_path(g, 'A', 'D'), ['A', 'B', 'D'])
+        self.assertEqual(dfs_path(g, 'A', 'D'), ['A', 'B', 'D'])
+        self.assertEqual(list(iter_dfs(g, 'A')), ['A', 'B', 'D', 'C'])
+
     def test_weighted_traversal(self):
         gl = Graph.create_adjacency_list(directed=False, weighted=True)
         gl.add_edge('A', 'B', 1)
@@ -0,0 +1,127 @@
+import unittest
+
+from dsa.graph import Graph, SubgraphView, EdgeFilteredView, AdjacencyListWeightedGraph, AdjacencyMatrixGraph
+from dsa.graph_traversal import bfs, bidirectional_bfs_path
+from dsa.dijkstra import find_path
+
+class TestGraphViews(unittest.TestCase):
+    def setUp(self):
+        self.g = AdjacencyListWeightedGraph()
+        self.g.add_edge('A', 'B', 1)
+        self.g.add_edge('B', 'C', 5)
+        self.g.add_edge('C', 'D', 1)
+        self.g.add_edge('A', 'D', 9)
+        self.g.add_edge('D', 'E', 2)
+
+    def test_subgraph(self):
+        view = self.g.subgraph(['A', 'B', 'D'])
+        self.assertIsInstance(view, SubgraphView)
+        self.assertEqual(view.vertices(), ['A', 'B', 'D'])
+        self.assertEqual(view['A'], {'B': 1, 'D': 9})
+        self.assertEqual(view.adjacents('D'), ['A'])
+        self.assertIn('A', view)
+        self.assertNotIn('C', view)
+        self.assertTrue(view.has_edge('A', 'D'))
+        self.assertRaises(KeyError, lambda: view.has_edge('A', 'C'))
+        self.assertRaises(KeyError, lambda: view.adjacents('C'))
+        self.assertEqual(view.size(), 2)
+        self.assertEqual(len(view), 3)
+        self.assertRaises(KeyError, lambda: self.g.subgraph(['Z']))
+
+        # predicate form, and changes to the parent show through
+        view = self.g.subgraph(lambda v: v != 'C')
+        self.assertEqual(view.vertices(), ['A', 'B', 'D', 'E'])
+        self.g.add_edge('B', 'E', 3)
+        self.assertEqual(view['B'], {'A': 1, 'E': 3})
+
+    def test_subgraph_parent_deletion(self):
+        view = self.g.subgraph(['A', 'B', 'D'])
+        self.g.delete_vertex('B')
+        self.assertEqual(view.vertices(), ['A', 'D'])
+        self.assertEqual(view.order(), 2)
+        self.assertEqual(len(view), 2)
+        self.assertNotIn('B', view)
+        self.g.add_vertex('B')
+        self.assertEqual(view.order(), 3)
+        self.assertIn('B', view)
+
+    def test_edge_filtered(self):
+        view = self.g.edge_filtered(lambda start, end, weight: weight < 5)
+        self.assertIsInstance(view, EdgeFilteredView)
+        self.assertEqual(view.vertices(), self.g.vertices())
+        self.assertEqual(view['A'], {'B': 1})
+        self.assertFalse(view.has_edge('B', 'C'))
+        self.assertRaises(KeyError, lambda: view.get_weight('B', 'C'))
+        self.assertEqual(view.get_weight('C', 'D'), 1)
+        self.assertEqual(bfs(view, 'A'), ['A', 'B'])
+        self.assertEqual(find_path(self.g, 'A', 'E'), ['A', 'B', 'C', 'D', 'E'])
+        self.assertRaises(KeyError, lambda: find_path(view, 'A', 'E'))
+
+        unweighted = Graph.from_edges([(1, 2), (2, 3), (3, 4)], graph_type='adjacency_matrix', directed=True)
+        view = unweighted.edge_filtered(lambda start, end: start % 2 == 1)
+        self.assertEqual(view.edges(), [(1, 2), (3, 4)])
+        self.assertRaises(TypeError, lambda: view.adjacent_items(1))
+
+    def test_nested_and_materialize(self):
+        view = self.g.subgraph(['A', 'B', 'C', 'D']).edge_filtered(lambda s, e, w: w > 1)
+        self.assertEqual(view.to_dict(), {'A': {'D': 9}, 'B': {'C': 5}, 'C': {'B': 5}, 'D': {'A': 9}})
+
+        copy = view.materialize()
+        self.assertIsInstance(copy, AdjacencyListWeightedGraph)
+        self.assertEqual(copy.to_dict(), view.to_dict())
+        copy.add_edge('A', 'B', 4)
+        self.assertEqual(self.g['A']['B'], 1)
+
+        matrix = view.materialize('adjacency_matrix')
+        self.assertEqual(matrix.to_dict(), view.to_dict())
+        self.assertEqual(view.freeze().to_dict(), view.to_dict())
+
+        g = AdjacencyMatrixGraph(vertices=['A', 'B', 'C'])
+        g.add_edge('A', 'B')
+        g.add_edge('B', 'C')
+        sub = g.subgraph(['B', 'C']).materialize()
+        self.assertIsInstance(sub, AdjacencyMatrixGraph)
+        self.assertEqual(sub.to_dict(), {'B': ['C'], 'C': ['B']})
+
+        csr = g.freeze().subgraph(['A', 'B'])
+        self.assertEqual(csr.materialize().to_dict(), {'A': ['B'], 'B': ['A']})
+
+    def test_undirected_size(self):
+        # the predicate keeps only one direction of A-B and B-C
+        view = self.g.edge_filtered(lambda start, end, weight: start < end)
+        self.assertEqual(view.size(), 5)
+        self.assertEqual(self.g.edge_filtered(lambda start, end, weight: True).size(), self.g.size())
+
+        g = Graph.from_edges([(1, 1), (1, 2)], graph_type='adjacency_list')
+        self.assertEqual(g.subgraph([1, 2]).size(), 2)
+
+    def test_materialize_isolated_vertices(self):
+        view = self.g.edge_filtered(lambda start, end, weight: weight < 2)
+        self.assertEqual(view.materialize().vertices(), ['A', 'B', 'C', 'D', 'E'])
+        self.assertEqual(view.materialize().to_dict(), view.to_dict())
+        for graph_type in ('adjacency_matrix', 'csr'):
+            copy = view.materialize(graph_type)
+            self.assertEqual(copy.vertices(), ['A', 'B', 'C', 'D', 'E'])
+            self.assertEqual(copy.to_dict(), view.to_dict())
+
+        g = AdjacencyListWeightedGraph(vertices=['A', 'B'])
+        self.assertEqual(g.to_dict(), {'A': {}, 'B': {}})
+        g.add_vertex('C')
+        g.add_edge('A', 'C', 1)
+        self.assertEqual(g.to_dict(), {'A': {'C': 1}, 'B': {}, 'C': {'A': 1}})
+
+    def test_predecessors(self):
+        g = Graph.from_edges([('A', 'B', 1), ('B', 'C', 2), ('A', 'C', 7), ('C', 'D', 1), ('E', 'D', 1)],
+                             directed=True, weighted=True)
+        view = g.edge_filtered(lambda start, end, weight: weight < 5)
+        self.assertEqual(view.predecessors('C'), ['B'])
+        self.assertEqual(view.in_edges('C'), [('B', 'C', 2)])
+        sub = view.subgraph(['A', 'B', 'C', 'D'])
+        self.assertEqual(sub.predecessors('D'), ['C'])
+        self.assertRaises(KeyError, lambda: sub.predecessors('E'))
+        self.assertEqual(bidirectional_bfs_path(sub, 'A', 'D'), ['A', 'B', 'C', 'D'])
+        self.assertEqual(bidirectional_bfs_path(g.subgraph(['A', 'C', 'D']), 'A', 'D'), ['A', 'C', 'D'])
+        self.assertIsNone(bidirectional_bfs_path(sub, 'D', 'A'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+
+from dsa.array import Array, MmapArray
+
+class TestMmapArray(unittest.TestCase):
+    def setUp(self):
+        """Set up a temporary directory for backing files."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "data.bin")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_create(self):
+        with MmapArray(self.path, 'q', capacity=4) as a:
+            self.assertEqual(len(a), 0)
+            self.assertTrue(a.is_empty())
+            self.assertEqual(a.capacity(), 4)
+            self.assertEqual(a.typecode, 'q')
+
+        with MmapArray(self.path + "2", 'd', [1, 2, 3]) as a:
+            self.assertEqual(len(a), 3)
+            self.assertEqual(a.to_list(), [1.0, 2.0, 3.0])
+
+    def test_append_grow(self):
+        with MmapArray(self.path, 'q', capacity=2) as a:
+            for i in range(100):
+                a.append(i)
+            self.assertEqual(len(a), 100)
+            self.assertGreaterEqual(a.capacity(), 100)
+            self.assertEqual(a[0], 0)
+            self.assertEqual(a[99], 99)
+            self.assertEqual(a.to_list(), list(range(100)))
+
+    def test_indexing(self):
+        with MmapArray(self.path, 'd', [1.5, 2.5, 3.5]) as a:
+            self.assertEqual(a[1], 2.5)
+            a[1] = 10
+            self.assertEqual(a[1], 10.0)
+            self.assertRaises(IndexError, lambda: a[3])
+            self.assertRaises(IndexError, lambda: a[-1])
+            with self.assertRaises(IndexError):
+                a[3] = 1
+
+    def test_insert_delete(self):
+        with MmapArray(self.path, 'i', [1, 2, 3], capacity=3) as a:
+            a.insert(1, 9)
+            self.assertEqual(a.to_list(), [1, 9, 2, 3])
+            a.insert(4, 8)
+            self.assertEqual(a.to_list(), [1, 9, 2, 3, 8])
+            a.delete(0)
+            self.assertEqual(a.to_list(), [9, 2, 3, 8])
+            self.assertRaises(IndexError, lambda: a.insert(10, 1))
+            self.assertRaises(IndexError, lambda: a.delete(4))
+
+    def test_persistence(self):
+        a = MmapArray(self.path, 'q')
+        a.extend([5, 6, 7])
+        a.flush()
+        a.close()
+
+        with MmapArray(self.path) as b:
+            self.assertEqual(b.typecode, 'q')
+            self.assertEqual(b.to_list(), [5, 6, 7])
+            b.append(8)
+
+        with MmapArray(self.path, 'q') as c:
+            self.assertEqual(c.to_list(), [5, 6, 7, 8])
+
+        self.assertRaises(ValueError, lambda: MmapArray(self.path, 'd'))
+
+    def test_invalid_file(self):
+        with open(self.path, 'wb') as f:
+            f.write(b'not an array file')
+        self.assertRaises(ValueError, lambda: MmapArray(self.path))
+
+    def test_equality(self):
+        with MmapArray.from_list([1, 2, 3], self.path, 'q') as a:
+            self.assertEqual(a, Array([1, 2, 3]))
+            self.assertNotEqual(a, Array([1, 2]))
+
+    def test_batch_operations(self):
+        with MmapArray(self.path, 'q', [3, 1, 2, 1]) as a:
+            self.assertEqual(a.sum(), 7)
+            self.assertEqual(a.min(), 1)
+            self.assertEqual(a.max(), 3)
+            self.assertEqual(a.argsort(), [1, 3, 2, 0])
+            self.assertEqual(a.map(lambda x: x + 1).to_list(), [4, 2, 3, 2])
+            self.assertEqual(a.filter(lambda x: x == 1).to_list(), [1, 1])
+            self.assertEqual(a.reduce(lambda x, y: x + y), 7)
+
+        with MmapArray(self.path + "2", 'd', [1.0, 2.5, 4.0]) as a:
+            self.assertEqual(a.searchsorted(2.5), 1)
+            self.assertEqual(a.searchsorted(2.5, side='right'), 2)
+            self.assertEqual(a.sum(), 7.5)
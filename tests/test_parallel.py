@@ -0,0 +1,43 @@
+import random
+import unittest
+
+from dsa.graph import Graph
+from dsa.graph_traversal import bfs
+from dsa.parallel import parallel_bfs
+
+class TestParallelBFS(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(5)
+        edges = [(rng.randrange(60), rng.randrange(60)) for _ in range(150)]
+        self.graph = Graph.from_edges(edges, directed=True)
+
+    def test_matches_bfs(self):
+        for workers in (1, 2):
+            results = dict(parallel_bfs(self.graph, workers=workers, batch_size=7))
+            self.assertEqual(sorted(results), sorted(self.graph.vertices()))
+            for source, order in results.items():
+                self.assertEqual(order, bfs(self.graph, source))
+
+    def test_distances(self):
+        g = Graph.from_edges([('A', 'B'), ('B', 'C'), ('A', 'D'), ('E', 'A')], graph_type='csr', directed=True)
+        results = dict(parallel_bfs(g, ['A', 'E'], workers=2, distances=True))
+        self.assertEqual(results['A'], {'A': 0, 'B': 1, 'D': 1, 'C': 2})
+        self.assertEqual(results['E'], {'E': 0, 'A': 1, 'B': 2, 'D': 2, 'C': 3})
+
+    def test_tuple_labels(self):
+        g = Graph.from_edges([((0, 0), (0, 1)), ((0, 1), (1, 1)), ((0, 0), (1, 0))], directed=True)
+        results = dict(parallel_bfs(g, [(0, 0)], workers=2))
+        self.assertEqual(results[(0, 0)], bfs(g, (0, 0)))
+
+    def test_stream(self):
+        stream = parallel_bfs(self.graph, workers=2, batch_size=1)
+        source, order = next(stream)
+        self.assertEqual(order, bfs(self.graph, source))
+        stream.close()
+
+    def test_missing_source(self):
+        with self.assertRaises(KeyError):
+            list(parallel_bfs(self.graph, ['missing'], workers=1))
+
+if __name__ == '__main__':
+    unittest.main()
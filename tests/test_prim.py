@@ -23,5 +23,21 @@ class TestPrim(unittest.TestCase):
         total_weight = mst_weight(mst)
         self.assertEqual(total_weight, 6)
 
+    def test_duck_typed_graph(self):
+        class DictGraph:
+            # graph-like object with only vertices() and adjacent_items()
+            def __init__(self, graph):
+                self.adjacency = graph.to_dict()
+
+            def vertices(self):
+                return list(self.adjacency)
+
+            def adjacent_items(self, vertex):
+                return list(self.adjacency[vertex].items())
+
+        mst = prims_mst(DictGraph(self.graph), 'A')
+        self.assertEqual(mst_weight(mst), 6)
+        self.assertEqual(mst_weight(DictGraph(mst)), 6)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,117 @@
+import random
+import unittest
+
+from dsa.graph import Graph
+from dsa.sampling import Sampler, alias_table, alias_draw
+
+class TestSampling(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(21)
+        self.edges = [(rng.randrange(40), rng.randrange(40)) for _ in range(150)]
+        self.weighted_edges = [(a, b, rng.randint(1, 5)) for a, b in self.edges]
+
+    def assertWalk(self, graph, walk, length):
+        self.assertLessEqual(len(walk), length)
+        for a, b in zip(walk, walk[1:]):
+            self.assertTrue(graph.has_edge(a, b))
+        if len(walk) < length:
+            self.assertEqual(graph.adjacents(walk[-1]), [])
+
+    def test_alias_table(self):
+        weights = [1, 0, 3, 6]
+        probability, alias = alias_table(weights)
+        rng = random.Random(1)
+        counts = [0] * 4
+        for _ in range(40000):
+            counts[alias_draw(probability, alias, rng)] += 1
+        self.assertEqual(counts[1], 0)
+        for count, weight in zip(counts, weights):
+            self.assertAlmostEqual(count / 40000, weight / 10, delta=0.01)
+
+        self.assertRaises(ValueError, lambda: alias_table([0, 0]))
+        self.assertRaises(ValueError, lambda: alias_table([1, -1, 2]))
+
+    def test_random_walks(self):
+        for directed in (False, True):
+            for graph in (Graph.from_edges(self.edges, directed=directed),
+                          Graph.from_edges(self.weighted_edges, directed=directed, weighted=True)):
+                walks = Sampler(graph, seed=3).random_walks(8, walks_per_vertex=2)
+                self.assertEqual(len(walks), 2 * graph.order())
+                self.assertEqual([walk[0] for walk in walks], graph.freeze().vertices() * 2)
+                for walk in walks:
+                    self.assertWalk(graph, walk, 8)
+                self.assertEqual(Sampler(graph, seed=3).random_walks(8, walks_per_vertex=2), walks)
+
+        graph = Graph.from_edges(self.edges)
+        sampler = Sampler(graph, seed=4)
+        first = sampler.random_walks(5, starts=[0, 1])
+        self.assertNotEqual(sampler.random_walks(5, starts=[0, 1] * 20), first * 20)
+        self.assertEqual(Sampler(graph, seed=4).random_walks(1, starts=[0]), [[0]])
+        self.assertRaises(KeyError, lambda: sampler.random_walks(5, starts=['Z']))
+        self.assertRaises(ValueError, lambda: sampler.random_walks(0))
+
+    def test_weighted_walk_distribution(self):
+        graph = Graph.from_edges([('A', 'B', 1), ('A', 'C', 3)], directed=True, weighted=True)
+        walks = Sampler(graph, seed=5).random_walks(2, starts=['A'], walks_per_vertex=8000)
+        share = sum(walk[1] == 'C' for walk in walks) / len(walks)
+        self.assertAlmostEqual(share, 0.75, delta=0.02)
+
+    def test_workers(self):
+        graph = Graph.from_edges(self.weighted_edges, weighted=True)
+        expected = Sampler(graph, seed=6).random_walks(6, walks_per_vertex=3, batch_size=16)
+        self.assertEqual(Sampler(graph, seed=6).random_walks(6, walks_per_vertex=3, batch_size=16, workers=2), expected)
+        expected = Sampler(graph, seed=6).node2vec_walks(6, p=0.5, q=2, batch_size=16)
+        self.assertEqual(Sampler(graph, seed=6).node2vec_walks(6, p=0.5, q=2, batch_size=16, workers=2), expected)
+
+    def test_node2vec_walks(self):
+        graph = Graph.from_edges(self.edges)
+        sampler = Sampler(graph, seed=7)
+        walks = sampler.node2vec_walks(10, p=0.5, q=2.0)
+        for walk in walks:
+            self.assertWalk(graph, walk, 10)
+        self.assertEqual(Sampler(graph, seed=7).node2vec_walks(10, p=0.5, q=2.0), walks)
+
+        # a tiny p makes walks step straight back
+        path = Graph.from_edges([(i, i + 1) for i in range(10)] + [(5, 20), (5, 21)])
+        walks = Sampler(path, seed=8).node2vec_walks(12, p=0.001, q=1, starts=[5], walks_per_vertex=50)
+        returns = sum(walk[i] == walk[i + 2] for walk in walks for i in range(len(walk) - 2))
+        steps = sum(len(walk) - 2 for walk in walks)
+        self.assertGreater(returns / steps, 0.95)
+        self.assertRaises(ValueError, lambda: sampler.node2vec_walks(5, p=0))
+
+    def test_sample_neighbors(self):
+        for graph in (Graph.from_edges(self.edges), Graph.from_edges(self.weighted_edges, weighted=True)):
+            sampler = Sampler(graph, seed=9)
+            for v in graph.vertices():
+                adjacents = graph.adjacents(v)
+                sample = sampler.sample_neighbors(v, 3)
+                self.assertEqual(len(sample), min(3, len(adjacents)))
+                self.assertEqual(len(set(sample)), len(sample))
+                self.assertTrue(set(sample) <= set(adjacents))
+                sample = sampler.sample_neighbors(v, 5, replace=True)
+                self.assertEqual(len(sample), 5 if adjacents else 0)
+                self.assertTrue(set(sample) <= set(adjacents))
+            self.assertRaises(KeyError, lambda: sampler.sample_neighbors('Z', 2))
+
+        graph = Graph.from_edges([('A', 'B', 1), ('A', 'C', 100), ('A', 'D', 100)], directed=True, weighted=True)
+        sampler = Sampler(graph, seed=10)
+        picks = [tuple(sorted(sampler.sample_neighbors('A', 2))) for _ in range(200)]
+        self.assertGreater(picks.count(('C', 'D')), 180)
+
+    def test_k_hop_sample(self):
+        graph = Graph.from_edges(self.edges)
+        sampler = Sampler(graph, seed=11)
+        hops = sampler.k_hop_sample([0, 1], [4, 2])
+        self.assertEqual(len(hops), 2)
+        self.assertEqual({a for a, _ in hops[0]} <= {0, 1}, True)
+        self.assertEqual({a for a, _ in hops[1]}, {b for _, b in hops[0]})
+        for hop, fanout in zip(hops, [4, 2]):
+            for a, b in hop:
+                self.assertTrue(graph.has_edge(a, b))
+            sources = [a for a, _ in hop]
+            for a in set(sources):
+                self.assertLessEqual(sources.count(a), fanout)
+        self.assertEqual(Sampler(graph, seed=11).k_hop_sample([0, 1], [4, 2]), hops)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,195 @@
+import bisect
+import random
+import unittest
+
+from dsa.array import Array, DynamicArray
+from dsa.sequence import GapBuffer, Rope
+
+class TestGapBuffer(unittest.TestCase):
+    def test_create(self):
+        gb = GapBuffer()
+        self.assertEqual(len(gb), 0)
+        self.assertTrue(gb.is_empty())
+
+        gb = GapBuffer([1, 2, 3])
+        self.assertEqual(len(gb), 3)
+        self.assertEqual(gb.to_list(), [1, 2, 3])
+        self.assertEqual(gb.cursor(), 3)
+
+    def test_insert_delete(self):
+        gb = GapBuffer(list("held"), capacity=4)
+        gb.insert(3, "l")
+        self.assertEqual("".join(gb.to_list()), "helld")
+        gb.insert(4, "o")
+        gb.insert(5, " ")
+        self.assertEqual("".join(gb.to_list()), "hello d")
+        self.assertEqual(gb.cursor(), 6)
+        gb.delete(6)
+        gb.extend("world")
+        self.assertEqual("".join(gb.to_list()), "hello world")
+        gb.delete(0)
+        self.assertEqual(gb.cursor(), 0)
+        self.assertEqual("".join(gb.to_list()), "ello world")
+
+        self.assertRaises(IndexError, lambda: gb.insert(11, "x"))
+        self.assertRaises(IndexError, lambda: gb.delete(10))
+        self.assertRaises(IndexError, lambda: gb.move_cursor(-1))
+
+    def test_indexing(self):
+        gb = GapBuffer([1, 2, 3, 4])
+        gb.move_cursor(2)
+        self.assertEqual([gb[i] for i in range(4)], [1, 2, 3, 4])
+        gb[3] = 40
+        gb[0] = 10
+        self.assertEqual(gb.to_list(), [10, 2, 3, 40])
+        self.assertRaises(IndexError, lambda: gb[4])
+
+    def test_read_api(self):
+        gb = GapBuffer([3, 1, 2])
+        gb.move_cursor(1)
+        self.assertEqual(gb, Array([3, 1, 2]))
+        self.assertEqual(gb.sum(), 6)
+        self.assertEqual(gb.argsort(), [1, 2, 0])
+        self.assertEqual(gb.map(lambda x: x * 2).to_list(), [6, 2, 4])
+
+    def test_searchsorted(self):
+        values = [1, 2, 2, 2, 5, 7, 7, 9]
+        for cursor in range(len(values) + 1):
+            gb = GapBuffer(values)
+            gb.move_cursor(cursor)
+            for value in range(11):
+                self.assertEqual(gb.searchsorted(value), bisect.bisect_left(values, value))
+                self.assertEqual(gb.searchsorted(value, side='right'), bisect.bisect_right(values, value))
+        self.assertRaises(ValueError, lambda: gb.searchsorted(1, side='middle'))
+
+    def test_shift(self):
+        values = [1, 2, 3, 4, 5]
+        for cursor in range(len(values) + 1):
+            for start in range(len(values) + 1):
+                gb = GapBuffer(values)
+                gb.move_cursor(cursor)
+                gb.shift_right(start)
+                self.assertEqual(gb.to_list(), values[:start + 1] + values[start:-1] if start < len(values) else values)
+                self.assertEqual(len(gb), len(values))
+                gb = GapBuffer(values)
+                gb.move_cursor(cursor)
+                gb.shift_left(start)
+                self.assertEqual(gb.to_list(), values[:start] + values[start + 1:] + values[-1:] if start < len(values) else values)
+                self.assertEqual(len(gb), len(values))
+        gb = GapBuffer(capacity=1)
+        gb.shift_right(0)
+        gb.shift_left(0)
+        self.assertEqual(gb.to_list(), [])
+
+    def test_random_edits(self):
+        rng = random.Random(1)
+        gb = GapBuffer()
+        expected = []
+        for _ in range(500):
+            if expected and rng.random() < 0.3:
+                i = rng.randrange(len(expected))
+                gb.delete(i)
+                del expected[i]
+            else:
+                i = rng.randint(0, len(expected))
+                v = rng.random()
+                gb.insert(i, v)
+                expected.insert(i, v)
+        self.assertEqual(gb.to_list(), expected)
+
+
+class TestRope(unittest.TestCase):
+    def test_create(self):
+        rope = Rope()
+        self.assertEqual(len(rope), 0)
+        self.assertTrue(rope.is_empty())
+
+        rope = Rope(range(200))
+        self.assertEqual(len(rope), 200)
+        self.assertEqual(rope.to_list(), list(range(200)))
+        self.assertEqual(rope[150], 150)
+        self.assertEqual(Rope.from_list([1, 2]).to_list(), [1, 2])
+
+    def test_insert_delete(self):
+        rope = Rope([1, 2, 3])
+        rope.insert(1, 9)
+        self.assertEqual(rope.to_list(), [1, 9, 2, 3])
+        rope.insert(4, 8)
+        rope.append(7)
+        self.assertEqual(rope.to_list(), [1, 9, 2, 3, 8, 7])
+        rope.delete(0)
+        rope.delete(4)
+        self.assertEqual(rope.to_list(), [9, 2, 3, 8])
+        rope[1] = 20
+        self.assertEqual(rope.to_list(), [9, 20, 3, 8])
+
+        self.assertRaises(IndexError, lambda: rope.insert(5, 1))
+        self.assertRaises(IndexError, lambda: rope.delete(4))
+        self.assertRaises(IndexError, lambda: rope[4])
+
+    def test_concat_split(self):
+        a = Rope(range(100))
+        b = Rope(range(100, 150))
+        c = a.concat(b)
+        self.assertEqual(c.to_list(), list(range(150)))
+        self.assertEqual(a.to_list(), list(range(100)))
+        self.assertEqual(b.to_list(), list(range(100, 150)))
+
+        left, right = c.split(70)
+        self.assertEqual(left.to_list(), list(range(70)))
+        self.assertEqual(right.to_list(), list(range(70, 150)))
+        self.assertEqual(len(left), 70)
+        self.assertEqual(c.to_list(), list(range(150)))
+
+        left, right = c.split(0)
+        self.assertTrue(left.is_empty())
+        self.assertEqual(len(right), 150)
+        self.assertRaises(IndexError, lambda: c.split(151))
+
+    def test_read_api(self):
+        rope = Rope([3, 1, 2])
+        self.assertEqual(rope, DynamicArray([3, 1, 2]))
+        self.assertEqual(rope.max(), 3)
+        self.assertEqual(rope.filter(lambda x: x < 3).to_list(), [1, 2])
+
+    def test_searchsorted(self):
+        values = sorted(random.Random(3).randrange(50) for _ in range(300))
+        rope = Rope(values)
+        for value in range(-1, 52):
+            self.assertEqual(rope.searchsorted(value), bisect.bisect_left(values, value))
+            self.assertEqual(rope.searchsorted(value, side='right'), bisect.bisect_right(values, value))
+        self.assertEqual(Rope().searchsorted(1), 0)
+        self.assertRaises(ValueError, lambda: rope.searchsorted(1, side='middle'))
+
+    def test_shift(self):
+        values = list(range(150))
+        for start in (0, 1, 63, 64, 100, 148, 149, 150):
+            rope = Rope(values)
+            rope.shift_right(start)
+            self.assertEqual(rope.to_list(), values[:start + 1] + values[start:-1] if start < len(values) else values)
+            self.assertEqual(len(rope), len(values))
+            rope = Rope(values)
+            rope.shift_left(start)
+            self.assertEqual(rope.to_list(), values[:start] + values[start + 1:] + values[-1:] if start < len(values) else values)
+            self.assertEqual(len(rope), len(values))
+        rope = Rope()
+        rope.shift_right(0)
+        rope.shift_left(0)
+        self.assertEqual(rope.to_list(), [])
+
+    def test_random_edits(self):
+        rng = random.Random(2)
+        rope = Rope(range(100))
+        expected = list(range(100))
+        for _ in range(500):
+            if expected and rng.random() < 0.3:
+                i = rng.randrange(len(expected))
+                rope.delete(i)
+                del expected[i]
+            else:
+                i = rng.randint(0, len(expected))
+                v = rng.random()
+                rope.insert(i, v)
+                expected.insert(i, v)
+        self.assertEqual(rope.to_list(), expected)
+        self.assertEqual([rope[i] for i in range(len(rope))], expected)
@@ -0,0 +1,89 @@
+import unittest
+
+from dsa.array import Array, ArrayView, SortedArray
+
+class TestSortedArray(unittest.TestCase):
+    def setUp(self):
+        self.array = SortedArray([5, 1, 4, 2, 3])
+
+    def test_create(self):
+        self.assertEqual(self.array.to_list(), [1, 2, 3, 4, 5])
+        self.assertEqual(len(self.array), 5)
+        self.assertTrue(SortedArray().is_empty())
+        self.assertEqual(SortedArray.from_list([3, 2, 1]).to_list(), [1, 2, 3])
+        self.assertEqual(self.array, Array([1, 2, 3, 4, 5]))
+
+    def test_add(self):
+        self.assertEqual(self.array.add(0), 0)
+        self.assertEqual(self.array.add(10), 6)
+        self.assertEqual(self.array.add(3), 4)
+        self.assertEqual(self.array.to_list(), [0, 1, 2, 3, 3, 4, 5, 10])
+
+        arr = SortedArray(capacity=2)
+        for x in [9, 3, 7, 1, 5, 3]:
+            arr.append(x)
+        self.assertEqual(arr.to_list(), [1, 3, 3, 5, 7, 9])
+        self.assertGreaterEqual(arr.capacity(), 6)
+
+    def test_insert(self):
+        self.array.insert(2, 2)
+        self.array.insert(0, 0)
+        self.array.insert(7, 9)
+        self.assertEqual(self.array.to_list(), [0, 1, 2, 2, 3, 4, 5, 9])
+        self.assertRaises(ValueError, lambda: self.array.insert(0, 7))
+        self.assertRaises(ValueError, lambda: self.array.insert(3, 5))
+        self.assertRaises(IndexError, lambda: self.array.insert(9, 10))
+        self.assertEqual(self.array.to_list(), [0, 1, 2, 2, 3, 4, 5, 9])
+
+        arr = SortedArray(capacity=1)
+        for x in range(5):
+            arr.insert(len(arr), x)
+        self.assertEqual(arr.to_list(), [0, 1, 2, 3, 4])
+
+    def test_merge(self):
+        self.array.merge([0, 2, 6, 7])
+        self.assertEqual(self.array.to_list(), [0, 1, 2, 2, 3, 4, 5, 6, 7])
+        self.array.merge([])
+        self.assertEqual(len(self.array), 9)
+        self.array.extend([8, -1])
+        self.assertEqual(self.array.to_list(), [-1, 0, 1, 2, 2, 3, 4, 5, 6, 7, 8])
+
+        arr = SortedArray()
+        arr.merge(range(50))
+        self.assertEqual(arr.to_list(), list(range(50)))
+        self.assertRaises(ValueError, lambda: arr.merge([3, 1]))
+
+    def test_search(self):
+        self.assertEqual(self.array.index(1), 0)
+        self.assertEqual(self.array.index(5), 4)
+        self.assertRaises(ValueError, lambda: self.array.index(6))
+        self.assertTrue(3 in self.array)
+        self.assertFalse(0 in self.array)
+        self.assertFalse(6 in self.array)
+
+        arr = SortedArray([2, 2, 2, 1])
+        self.assertEqual(arr.index(2), 1)
+
+    def test_range(self):
+        view = self.array.range(2, 5)
+        self.assertIsInstance(view, ArrayView)
+        self.assertEqual(len(view), 3)
+        self.assertEqual(view.to_list(), [2, 3, 4])
+        self.assertEqual(list(view), [2, 3, 4])
+        self.assertEqual(view[0], 2)
+        self.assertRaises(IndexError, lambda: view[3])
+        self.assertEqual(len(self.array.range(6, 10)), 0)
+        self.assertEqual(self.array.range(0, 100).to_list(), [1, 2, 3, 4, 5])
+
+    def test_setitem_delete(self):
+        self.array[1] = 2
+        self.assertRaises(ValueError, lambda: self.array.__setitem__(1, 4))
+        self.assertRaises(IndexError, lambda: self.array.__setitem__(5, 4))
+        self.array.delete(0)
+        self.assertEqual(self.array.to_list(), [2, 3, 4, 5])
+
+    def test_min_max(self):
+        self.assertEqual(self.array.min(), 1)
+        self.assertEqual(self.array.max(), 5)
+        self.assertRaises(ValueError, SortedArray().min)
+        self.assertRaises(ValueError, SortedArray().max)
@@ -0,0 +1,93 @@
+import random
+import unittest
+
+from dsa.unionfind import DisjointSet, LabeledDisjointSet
+
+def naive_groups(n, pairs):
+    """ Merge sets by relabeling every member, for comparison. """
+    group = list(range(n))
+    for a, b in pairs:
+        old, new = group[b], group[a]
+        if old != new:
+            group = [new if g == old else g for g in group]
+    return group
+
+class TestDisjointSet(unittest.TestCase):
+    def test_union_find(self):
+        ds = DisjointSet(5)
+        self.assertEqual(len(ds), 5)
+        self.assertEqual(ds.count(), 5)
+        self.assertTrue(ds.union(0, 1))
+        self.assertTrue(ds.union(3, 4))
+        self.assertFalse(ds.union(1, 0))
+        self.assertTrue(ds.connected(0, 1))
+        self.assertFalse(ds.connected(1, 3))
+        self.assertEqual(ds.count(), 3)
+        self.assertEqual(ds.set_size(4), 2)
+        self.assertEqual(ds.set_size(2), 1)
+        self.assertEqual(ds.groups(), [[0, 1], [2], [3, 4]])
+        self.assertEqual(sorted(ds.sizes().values()), [1, 2, 2])
+
+        self.assertEqual(ds.add(), 5)
+        self.assertEqual(ds.count(), 4)
+        self.assertTrue(ds.union(5, 2))
+        self.assertEqual(ds.find(5), ds.find(2))
+
+        self.assertRaises(IndexError, lambda: ds.find(6))
+        self.assertRaises(IndexError, lambda: ds.find(-1))
+        self.assertRaises(IndexError, lambda: ds.union(0, 9))
+        self.assertRaises(IndexError, lambda: ds.find_many([0, -1]))
+
+    def test_random(self):
+        rng = random.Random(8)
+        n = 300
+        pairs = [(rng.randrange(n), rng.randrange(n)) for _ in range(250)]
+        expected = naive_groups(n, pairs)
+
+        ds = DisjointSet(n)
+        merged = ds.union_many(pairs)
+        self.assertEqual(ds.count(), len(set(expected)))
+        self.assertEqual(merged, n - ds.count())
+        roots = ds.find_many(range(n))
+        self.assertEqual(roots, [ds.find(i) for i in range(n)])
+        for i in range(n):
+            for j in range(0, n, 17):
+                self.assertEqual(roots[i] == roots[j], expected[i] == expected[j])
+            self.assertEqual(ds.set_size(i), expected.count(expected[i]))
+        self.assertEqual(sum(ds.sizes().values()), n)
+
+        # same result with single unions
+        single = DisjointSet(n)
+        self.assertEqual(sum(single.union(a, b) for a, b in pairs), merged)
+        self.assertEqual(single.groups(), ds.groups())
+
+    def test_union_many_error(self):
+        ds = DisjointSet(3)
+        self.assertRaises(IndexError, lambda: ds.union_many([(0, 1), (1, 3)]))
+        self.assertTrue(ds.connected(0, 1))
+        self.assertEqual(ds.count(), 2)
+
+    def test_labeled(self):
+        ds = LabeledDisjointSet('ABC')
+        self.assertTrue(ds.add('D'))
+        self.assertFalse(ds.add('A'))
+        self.assertEqual(len(ds), 4)
+        self.assertIn('D', ds)
+        self.assertNotIn('Z', ds)
+        self.assertEqual(ds.union_many([('A', 'B'), ('C', 'D'), ('B', 'A')]), 2)
+        self.assertTrue(ds.connected('B', 'A'))
+        self.assertFalse(ds.connected('A', 'C'))
+        self.assertIn(ds.find('B'), ('A', 'B'))
+        self.assertEqual(ds.find_many(['A', 'B']), [ds.find('A')] * 2)
+        self.assertEqual(ds.set_size('D'), 2)
+        self.assertEqual(ds.groups(), [['A', 'B'], ['C', 'D']])
+        self.assertEqual(sorted(ds.sizes().values()), [2, 2])
+        self.assertTrue(ds.union('A', 'D'))
+        self.assertEqual(ds.count(), 1)
+
+        self.assertRaises(KeyError, lambda: ds.find('Z'))
+        self.assertRaises(KeyError, lambda: ds.union('A', 'Z'))
+        self.assertRaises(KeyError, lambda: ds.union_many([('A', 'Z')]))
+
+if __name__ == '__main__':
+    unittest.main()
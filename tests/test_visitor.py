@@ -0,0 +1,113 @@
+import contextlib
+import io
+import random
+import unittest
+
+from dsa.dijkstra import shortest_path, find_path
+from dsa.graph import Graph
+from dsa.graph_traversal import dfs, bfs
+from dsa.visitor import Visitor, CounterVisitor
+
+class RecordingVisitor(Visitor):
+    def __init__(self):
+        self.events = []
+
+    def on_discover(self, vertex):
+        self.events.append(('discover', vertex))
+
+    def on_examine_edge(self, start, end):
+        self.events.append(('edge', start, end))
+
+    def on_finish(self, vertex):
+        self.events.append(('finish', vertex))
+
+    def on_relax(self, start, end, weight):
+        self.events.append(('relax', start, end, weight))
+
+class TestVisitor(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(12)
+        edges = [(rng.randrange(30), rng.randrange(30), rng.randint(1, 9)) for _ in range(80)]
+        self.graphs = [Graph.from_edges(edges, directed=directed, weighted=True) for directed in (False, True)]
+
+    def test_traversals(self):
+        for graph in self.graphs:
+            start = graph.vertices()[0]
+            for traversal in (dfs, bfs):
+                counter = CounterVisitor()
+                path = traversal(graph, start, visitor=counter)
+                self.assertEqual(path, traversal(graph, start))
+                self.assertEqual(counter.discovered, len(path))
+                self.assertEqual(counter.finished, len(path))
+                self.assertEqual(counter.edges_examined, sum(len(graph.adjacents(v)) for v in path))
+                self.assertEqual((counter.pushes, counter.pops, counter.edges_relaxed), (0, 0, 0))
+                self.assertEqual(list(counter.times), ['traversal'])
+
+                recorder = RecordingVisitor()
+                traversal(graph, start, visitor=recorder)
+                self.assertEqual([e[1] for e in recorder.events if e[0] == 'discover'], path)
+                finished = set()
+                for event in recorder.events:
+                    if event[0] == 'finish':
+                        finished.add(event[1])
+                    elif event[0] == 'edge':
+                        self.assertNotIn(event[1], finished)
+
+    def test_dfs_finish_order(self):
+        graph = Graph.from_edges([('A', 'B'), ('B', 'C'), ('A', 'D')], directed=True)
+        recorder = RecordingVisitor()
+        dfs(graph, 'A', visitor=recorder)
+        self.assertEqual([e[1] for e in recorder.events if e[0] == 'finish'], ['C', 'B', 'D', 'A'])
+
+    def test_debug_with_visitor(self):
+        graph = self.graphs[0]
+        start = graph.vertices()[0]
+        for traversal in (dfs, bfs):
+            plain, observed = io.StringIO(), io.StringIO()
+            with contextlib.redirect_stdout(plain):
+                traversal(graph, start, debug=True)
+            with contextlib.redirect_stdout(observed):
+                traversal(graph, start, debug=True, visitor=CounterVisitor())
+            self.assertEqual(plain.getvalue(), observed.getvalue())
+            self.assertTrue(plain.getvalue())
+
+        end = graph.vertices()[-1]
+        plain, observed = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(plain):
+            expected = shortest_path(graph, start, end, debug=True)
+        counter = CounterVisitor()
+        with contextlib.redirect_stdout(observed):
+            self.assertEqual(shortest_path(graph, start, end, debug=True, visitor=counter), expected)
+        self.assertEqual(plain.getvalue(), observed.getvalue())
+        self.assertEqual(plain.getvalue().count('new_dist'), counter.edges_examined)
+
+    def test_dijkstra(self):
+        for graph in self.graphs:
+            start, end = graph.vertices()[0], graph.vertices()[-1]
+            counter = CounterVisitor()
+            weight_table, predecessor = shortest_path(graph, start, end, visitor=counter)
+            self.assertEqual((weight_table, predecessor), shortest_path(graph, start, end))
+            self.assertEqual(counter.discovered, len(weight_table))
+            self.assertEqual(counter.pushes, counter.edges_relaxed + 1)
+            self.assertLessEqual(counter.pops, counter.pushes)
+            self.assertLessEqual(counter.finished, counter.discovered)
+            self.assertEqual(list(counter.times), ['search'])
+
+            recorder = RecordingVisitor()
+            shortest_path(graph, start, end, visitor=recorder)
+            last = {}
+            for event in recorder.events:
+                if event[0] == 'relax':
+                    self.assertLess(event[3], last.get(event[2], float('inf')))
+                    last[event[2]] = event[3]
+            self.assertEqual({v: w for v, w in last.items()}, {v: w for v, w in weight_table.items() if v != start})
+
+        counter = CounterVisitor()
+        path = find_path(self.graphs[1], start, end, visitor=counter)
+        self.assertEqual(path, find_path(self.graphs[1], start, end))
+        self.assertEqual(set(counter.times), {'search', 'path'})
+        self.assertEqual(counter.report()['pushes'], counter.pushes)
+        self.assertIn('pushes=', repr(counter))
+
+if __name__ == '__main__':
+    unittest.main()